@@ -1,29 +1,106 @@
 import pygame
+import os
 import sys
 import cProfile
 import pstats
 import io
 import traceback
+from src.Constantes import (BENCHMARK_FRAMES, BENCHMARK_SEED, BENCHMARK_OUTPUT_FILE, BENCHMARK_TOLERANCE,
+                            FRAME_PACING_MODE)
 from src.core.game_manager import GameManager
+from src.screens.menu_screen import MenuScreen
+from src.screens.game_screen import GameScreen
+from src.screens.game_screen_mission import MissionGameScreen
+from src.core.replay import replay_session
+from src.core.logger import game_log
+from src.systems.ability_system import ability_system
+
+# Escenas que se pueden arrancar directamente en modo --headless
+HEADLESS_SCENES = {
+    "menu": MenuScreen,
+    "game": GameScreen,
+    "mission": MissionGameScreen,
+}
+
+def _get_arg_value(flag: str, default=None, cast=str):
+    """Devuelve el valor que sigue a un flag de la linea de comandos"""
+    if flag in sys.argv:
+        index = sys.argv.index(flag)
+        if index + 1 < len(sys.argv):
+            return cast(sys.argv[index + 1])
+    return default
+
+def _apply_seed_arg(game: GameManager):
+    """Usa la semilla de --seed N para todas las partidas (partidas reproducibles)"""
+    seed = _get_arg_value('--seed', None, int)
+    if seed is not None:
+        game.shared_data['run_seed'] = seed
+
+def _apply_tick_rate_arg(game: GameManager):
+    """--tick-rate N: menos ticks por segundo en equipos lentos (el movimiento se escala por dt)"""
+    tick_rate = _get_arg_value('--tick-rate', None, int)
+    if tick_rate is not None:
+        game.set_tick_rate(tick_rate)
+
+def _apply_replay_args(game: GameManager):
+    """
+    Configura --record ARCHIVO o --replay ARCHIVO.
+    
+    Con --replay se restauran semilla, ticks por segundo, personaje, modo y
+    habilidades de la grabacion y se arranca directo en la escena grabada.
+    
+    Returns:
+        La cantidad de ticks del replay, o None si no se reproduce nada
+    """
+    record_path = _get_arg_value('--record')
+    if record_path:
+        replay_session.start_recording(record_path)
+        print(f"Grabando partidas en {record_path}")
+    
+    replay_path = _get_arg_value('--replay')
+    if not replay_path:
+        return None
+    
+    replayer = replay_session.load_replay(replay_path)
+    meta = replayer.meta
+    game.set_tick_rate(replayer.tick_rate)
+    game.shared_data['run_seed'] = replayer.seed
+    for key in ('selected_character', 'game_mode', 'selected_level'):
+        if key in meta:
+            game.shared_data[key] = meta[key]
+    if 'unlocked_abilities' in meta:
+        ability_system.load_snapshot(meta['unlocked_abilities'], meta.get('completed_missions', []))
+    
+    game.scene_manager.change_scene(HEADLESS_SCENES[meta.get('scene', 'game')])
+    print(f"Reproduciendo {replay_path}: {replayer.tick_count} ticks, semilla {replayer.seed}")
+    return replayer.tick_count
 
 def main():
     """Punto de entrada principal del juego"""
     try:
         pygame.init()
-        game = GameManager()
+        # --pacing tick|busy|hybrid|vsync elige como se espera entre frames
+        game = GameManager(_get_arg_value('--pacing', FRAME_PACING_MODE))
+        _apply_seed_arg(game)
+        _apply_tick_rate_arg(game)
+        _apply_replay_args(game)
         game.run()
     except Exception as e: 
         print(f"Error al iniciar el juego: {e}")
     finally:
+        replay_session.end_run()
         pygame.quit()
         sys.exit()
 def main_debug():
     """Ejecuta el juego y, si ocurre un error, muestra archivo y linea exacta."""
+    # En debug se ven tambien los eventos de cada frame (spawns, colisiones, volumen)
+    game_log.configure(level="DEBUG")
     try:
         pygame.init()
-        game = GameManager()
+        game = GameManager(_get_arg_value('--pacing', FRAME_PACING_MODE))
         game.run()
     except Exception as e:
+        game_log.flush()  # Que los logs pendientes salgan antes del error
         # Extraer lista de frames del traceback
         tb_list = traceback.extract_tb(e.__traceback__)
         if tb_list:
@@ -82,12 +159,101 @@ def main_with_profiling():
         print(s.getvalue())
         # Guardar estadisticas en archivo
         stats.dump_stats('profile_results.prof')
+
+def main_headless():
+    """Ejecuta el juego sin ventana ni audio, sin esperas, y muestra el rendimiento.
+    
+    Uso: python main.py --headless [--scene game|mission|menu] [--frames N | --seconds S] [--seed N]
+                        [--record ARCHIVO | --replay ARCHIVO]
+    
+    Con --replay se corren exactamente los ticks grabados (salvo que se indique --frames/--seconds).
+    """
+    # Los drivers dummy deben configurarse antes de pygame.init()
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    
+    frames = _get_arg_value('--frames', None, int)
+    seconds = _get_arg_value('--seconds', None, float)
+    scene_name = _get_arg_value('--scene', 'game')
+    if scene_name not in HEADLESS_SCENES:
+        print(f"Escena desconocida: {scene_name}. Opciones: {', '.join(HEADLESS_SCENES)}")
+        sys.exit(2)
+    
+    try:
+        pygame.init()
+        game = GameManager()
+        _apply_seed_arg(game)
+        _apply_tick_rate_arg(game)
+        game.scene_manager.change_scene(HEADLESS_SCENES[scene_name])
+        replay_ticks = _apply_replay_args(game)
+        if replay_ticks is not None and frames is None and seconds is None:
+            frames = replay_ticks
+        if replay_ticks is not None:
+            scene_name = replay_session.replayer.meta.get('scene', scene_name)
+        result = game.run_headless(frames=frames, seconds=seconds)
+        
+        print(f"Escena: {scene_name}")
+        print(f"Frames: {result['frames']} ({result['simulated_seconds']:.1f} s simulados)")
+        print(f"Tiempo real: {result['wall_seconds']:.2f} s -> {result['fps']:.1f} frames/s")
+        print(f"Update promedio: {result['avg_update_ms']:.3f} ms")
+        print(f"Draw promedio: {result['avg_draw_ms']:.3f} ms")
+    finally:
+        replay_session.end_run()
+        pygame.quit()
+
+def main_benchmark():
+    """Corre los escenarios de benchmark sin ventana y los compara con un baseline.
+    
+    Uso: python main.py --benchmark [--scenarios a,b] [--frames N] [--output ARCHIVO]
+                        [--baseline ARCHIVO] [--tolerance 0.1] [--entities]
+    
+    --entities agrega la memoria por instancia y el costo de acceso a atributos
+    de Player, Car y los coleccionables, comparados con el mismo estado guardado
+    en el layout anterior con __dict__.
+    
+    Sale con codigo 1 si algun escenario empeora mas que la tolerancia.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    from src.core import benchmark
+    
+    names = _get_arg_value('--scenarios', None, lambda value: value.split(','))
+    frames = _get_arg_value('--frames', BENCHMARK_FRAMES, int)
+    seed = _get_arg_value('--seed', BENCHMARK_SEED, int)
+    output_path = _get_arg_value('--output', BENCHMARK_OUTPUT_FILE)
+    baseline_path = _get_arg_value('--baseline')
+    tolerance = _get_arg_value('--tolerance', BENCHMARK_TOLERANCE, float)
+    
+    regressions = []
+    try:
+        pygame.init()
+        game = GameManager()
+        results = benchmark.run_benchmarks(game, names, frames, seed, '--entities' in sys.argv)
+        baseline = benchmark.load_results(baseline_path) if baseline_path else None
+        
+        benchmark.print_results(results, baseline)
+        benchmark.save_results(results, output_path)
+        print(f"Resultados guardados en {output_path}")
+        
+        if baseline:
+            regressions = benchmark.compare_with_baseline(results, baseline, tolerance)
+            for regression in regressions:
+                print(f"REGRESION {regression}")
+            if not regressions:
+                print(f"Sin regresiones (tolerancia {tolerance:.0%})")
+    finally:
+        pygame.quit()
+    sys.exit(1 if regressions else 0)
+
 if __name__ == "__main__":
-    # Cambiar entre normal y con profiling
-    import sys
-    if '--profile' in sys.argv:
+    # Cambiar entre normal, headless y con profiling
+    if '--benchmark' in sys.argv:
+        main_benchmark()
+    elif '--headless' in sys.argv:
+        main_headless()
+    elif '--profile' in sys.argv:
         main_with_profiling()
-    if '--debug' in sys.argv:
+    elif '--debug' in sys.argv:
         main_debug()
     else:
         main()
\ No newline at end of file
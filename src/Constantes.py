@@ -5,7 +5,24 @@ ALTO_PANTALLA = 800    # Alto de ventana principal
 # Configuracion de renderizado (usar nombres consistentes)
 PANTALLA_ANCHO = 1280  # Ancho del area de juego
 PANTALLA_ALTO = 720    # Alto del area de juego
-FPS = 100            
+FPS = 100                      # Limite de frames de renderizado por segundo
+
+# Bucle de simulacion con paso fijo (independiente del renderizado)
+SIMULATION_TICK_RATE = 100     # Ticks de simulacion por segundo (las velocidades por tick estan ajustadas a 100)
+MAX_FRAME_TIME = 0.25          # Tiempo maximo (s) que se simula por frame si el render se traba
+KINEMATICS_SUBSTEPS = True     # Con menos ticks por segundo, la fisica del jugador se subdivide en pasos de 1/SIMULATION_TICK_RATE
+KINEMATICS_MAX_SUBSTEPS = 32   # Tope de subpasos por tick (alcanza para 4 ticks por segundo)
+
+# Ritmo de frames (--pacing): "tick", "busy", "hybrid" o "vsync"
+FRAME_PACING_MODE = "tick"
+FRAME_PACING_SPIN_MS = 2.0     # En modo hybrid: ultimos ms de espera activa en lugar de dormir
+FRAME_PACING_HISTORY = 600     # Intervalos entre frames usados para medir el jitter
+
+# Ahorro de energia: menus y ventana en segundo plano
+MENU_FPS_CAP = 30              # Limite de frames en los menus (pantallas casi estaticas)
+UNFOCUSED_FPS_CAP = 20         # Limite de frames con la ventana sin foco
+HIDDEN_TICK_RATE = 4           # Ticks por segundo con la ventana minimizada u oculta (sin dibujar)
+PAUSE_AUDIO_IN_BACKGROUND = True  # Pausar musica y efectos mientras la ventana no tiene foco
 
 # ===== COLORES DEL JUEGO =====
 
@@ -223,20 +240,105 @@ BACKGROUND_PARALLAX_CAMERA_FACTOR = 0.1
 # Animacion de menu background
 MENU_BACKGROUND_ANIMATION_SPEED = 0.5
 
+# ===== CARGA DE RECURSOS =====
+
+ASSET_LOADER_WORKERS = 4                # Hilos que decodifican imagenes y sonidos al iniciar (uno por nucleo como maximo)
+ASSET_LOADER_PROGRESS_INTERVAL = 0.1    # Segundos entre redibujados de la pantalla de carga
+ASSET_LOADER_SPLASH_DELAY = 0.15        # La pantalla de carga solo aparece si la carga tarda mas que esto (segundos)
+ASSET_CACHE_BUDGET_MB = 32              # Recursos sin uso que se mantienen cargados (0 = liberar al salir de la escena)
+PIXEL_CACHE_ENABLED = True              # Guardar en disco los pixeles ya decodificados de cada PNG
+PIXEL_CACHE_DIR = ".cache/pixels"       # Carpeta del cache (se puede borrar sin problema)
+SOUND_CACHE_ENABLED = True              # Guardar en disco el PCM ya decodificado de cada efecto
+SOUND_CACHE_DIR = ".cache/sounds"
+SCALED_CACHE_BUDGET_MB = 32             # Copias escaladas de imagenes (fondos a pantalla completa) que se reutilizan
+MEMORY_BUDGET_MB = 160                  # Tope de superficies y sonidos del ResourceManager: al pasarlo se descarta lo que no se usa
+
+ASSET_ROOT = "Assets"                   # Carpeta que se indexa al iniciar (rutas sin distinguir mayusculas)
+ASSET_MANIFEST = "Assets/manifest.json" # Catalogo de recursos: tipo, ruta, frames y escenas que los usan
+# Fondos del modo noche (mision 4)
+NIGHT_ASSETS = ("bg_sky_night", "bg_mid_night", "bg_front_night", "bg_front_night_2")
+
+# Atlas de sprites (src/core/texture_atlas.py): recurso -> tamaño final de cada frame (None = original)
+ATLAS_SPRITES = {
+    "UIAbot_walk": None, "UAIBOTA_walk": None, "UAIBOTINA_walk": None, "UAIBOTINO_walk": None,
+    "Auto_azul": None, "Auto_rojo": None,
+    "avion": (280, 187),
+    "pila": None, "escudo": None,
+}
+ATLAS_PAGE_SIZE = 1024                  # Ancho maximo (y alto) de cada pagina del atlas
+ATLAS_PADDING = 1                       # Pixeles transparentes entre frames
+
+# ===== TEXTO =====
+
+FUENTE_PRINCIPAL = "Assets/Fuentes/C&C Red Alert [INET].ttf"
+# Fuentes con nombre: nombre -> (archivo, tamaño); None = fuente por defecto de pygame
+FUENTES = {
+    "titulo": (FUENTE_PRINCIPAL, 90),
+    "subtitulo": (FUENTE_PRINCIPAL, 40),
+    "boton": (FUENTE_PRINCIPAL, 55),
+    "pequeña": (FUENTE_PRINCIPAL, 32),
+    "hud": (FUENTE_PRINCIPAL, 32),
+    "instrucciones": (FUENTE_PRINCIPAL, 36),
+    "pausa": (None, 60),
+    "pausa_detalle": (None, 36),
+}
+TEXT_CACHE_BUDGET_MB = 4                # Textos ya renderizados que se reutilizan (LRU)
+
 # ===== CONFIGURACIONES DE DEBUG Y DESARROLLO =====
 
 DEBUG_MODE = False              # Activar modo debug
 SHOW_HITBOXES = False          # Mostrar hitboxes de colision
-ENABLE_CONSOLE_LOGS = True     # Habilitar logs en consola
+ENABLE_CONSOLE_LOGS = True     # Habilitar logs en consola (False: solo advertencias y errores)
+
+# Logger (src/core/logger.py): nivel minimo y categorias habilitadas
+LOG_LEVEL = "INFO"             # DEBUG muestra tambien los eventos de cada frame (spawns, colisiones)
+LOG_CATEGORIES = {
+    "recursos": True,
+    "audio": True,
+    "spawn": True,
+    "colisiones": True,
+    "jugador": True,
+    "habilidades": True,
+    "partida": True,
+}
+
+# Profiler de frames (overlay con F3)
+PROFILER_HISTORY_SIZE = 300     # Frames guardados en cada buffer circular
+PROFILER_REFRESH_FRAMES = 15    # Cada cuantos frames se recalculan los percentiles del overlay
+PROFILER_FRAME_BUDGET_MS = 10.0 # Presupuesto de tiempo por frame (ms) marcado en el grafico
+
+# Modo sin ventana (--headless)
+HEADLESS_DEFAULT_SECONDS = 30.0 # Segundos simulados si no se indica --frames ni --seconds
+
+# Benchmarks (--benchmark)
+BENCHMARK_FRAMES = 1500          # Frames medidos por escenario
+BENCHMARK_WARMUP_FRAMES = 100    # Frames previos sin medir (carga de caches, creacion de la escena)
+BENCHMARK_SEED = 1234            # Semilla fija para que cada corrida tenga la misma carga
+BENCHMARK_TOLERANCE = 0.10       # Empeoramiento permitido respecto del baseline (10%)
+BENCHMARK_OUTPUT_FILE = "benchmark_results.json"
+ENTITY_BENCHMARK_COUNT = 2000    # Instancias por tipo en la medicion de entidades (--entities)
+ENTITY_BENCHMARK_REPEATS = 50    # Repeticiones del recorrido de lectura/update (se toma el minimo)
 
 # Pool sizes
 INITIAL_CAR_POOL_SIZE = 8
 MAX_CAR_POOL_SIZE = 15
 AVAILABLE_CAR_POOL_LIMIT = 6
 
+# Almacen de entidades por columnas (autos, coleccionables y aviones)
+# Apagado por defecto: con las ~10 entidades de una partida normal los objetos sueltos son
+# mas rapidos; se enciende para el modo de estres (cientos de entidades)
+ENTITY_STORE_ENABLED = False
+ENTITY_STORE_INITIAL_CAPACITY = 16  # Slots iniciales (las columnas se duplican al llenarse)
+ENTITY_STORE_USE_NUMPY = True       # Vectorizar con NumPy si esta instalado (si no, array + bucle)
+ENTITY_STORE_NUMPY_MIN_SIZE = 64    # Con menos slots un bucle sobre los array es mas rapido que NumPy
+
 ESCUDO_DURACION = 8.0  # Duracion del escudo en segundos
 ESCUDO_SPAWN_CHANCE = 0.3  # 30% de probabilidad de generar escudo en lugar de pila
 
+# Pool de coleccionables (por tipo: pilas y escudos)
+COLLECTIBLE_POOL_PREWARM = 2          # Instancias creadas de antemano por tipo
+COLLECTIBLE_POOL_AVAILABLE_LIMIT = 4  # Instancias libres que se conservan por tipo
+
 # === CONSTANTES PARA EFECTOS VISUALES ===
 SHIELD_EFFECT_DURATION = 300  # Duracion del efecto visual de impacto en milisegundos
 COLLISION_FLASH_DURATION = 200  # Duracion del flash al colisionar con escudo
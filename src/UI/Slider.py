@@ -67,6 +67,12 @@ class Slider:
         # Borde exterior del botón
         pygame.draw.rect(screen, COLOR_BLANCO, main_button, 2)
     
+    def get_bounds(self) -> pygame.Rect:
+        """Area que ocupa el slider al dibujarse (el boton sobresale del track)"""
+        button_size = self.size[1]
+        return pygame.Rect(self.slider_left_pos - button_size // 2 - 1, self.slider_top_pos - 1,
+                           self.size[0] + button_size + 4, button_size + 4)
+    
     def move_slider(self, mouse_x):
         """Mueve el slider y ejecuta callback si existe"""
         # Calcular donde debería estar el centro del botón
@@ -1,6 +1,8 @@
 import pygame
 from src.Constantes import *
 
+HOVER_SCALE = 1.1  # Escala del boton con el mouse encima
+
 class Button:    
     def __init__(self, text, x, y, width, height, resource_manager, callback=None):
         self.rect = pygame.Rect(x, y, width, height)
@@ -9,6 +11,7 @@ class Button:
         self.is_hovered = False
         self.hover_scale = 1.0
         self.target_scale = 1.0
+        self._visual_state = None  # Lo que se dibujo la ultima vez (para regiones sucias)
         
         # Cache de texto
         self._text = text
@@ -67,15 +70,31 @@ class Button:
             if self.is_hovered and not was_hovered:
                 self.resource_manager.play_sound("boton_hover")
     
-    def update(self, dt):
-        """Actualiza la animacion del boton"""
+    def update(self, dt) -> bool:
+        """Actualiza la animacion del boton. Devuelve True si cambio su aspecto"""
         # Actualizar cache si es necesario
         self._update_text_cache()
         
         # Animacion de escala suave
-        self.target_scale = 1.1 if self.is_hovered else 1.0
+        self.target_scale = HOVER_SCALE if self.is_hovered else 1.0
         scale_diff = self.target_scale - self.hover_scale
-        self.hover_scale += scale_diff * 8 * dt  # Velocidad de animacion
+        if abs(scale_diff) < 0.001:
+            # Fijar al llegar: la aproximacion exponencial nunca termina y el boton seguiria "sucio"
+            self.hover_scale = self.target_scale
+        else:
+            self.hover_scale += scale_diff * 8 * dt  # Velocidad de animacion
+        
+        visual_state = (self.is_hovered, self._text,
+                        int(self.rect.width * self.hover_scale), int(self.rect.height * self.hover_scale))
+        changed = visual_state != self._visual_state
+        self._visual_state = visual_state
+        return changed
+    
+    def get_bounds(self) -> pygame.Rect:
+        """Area maxima que puede ocupar el boton (con la escala de hover y el borde)"""
+        extra_w = int(self.rect.width * (HOVER_SCALE - 1.0)) + 4
+        extra_h = int(self.rect.height * (HOVER_SCALE - 1.0)) + 4
+        return self.rect.inflate(extra_w, extra_h)
     
     def draw(self, screen):
         """Dibuja el boton con texto cacheado"""
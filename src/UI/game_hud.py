@@ -23,7 +23,7 @@ class GameHUD:
             ]
             
             for texto, pos in textos:
-                txt_surface = font_instrucciones.render(texto, True, COLOR_BLANCO)
+                txt_surface = self.resource_manager.render_text(font_instrucciones, texto, COLOR_BLANCO)
                 rect = txt_surface.get_rect(topleft=pos)
                 self.instructions.append((txt_surface, rect))
         self.cached_instruction_texts = {}
@@ -33,6 +33,7 @@ class GameHUD:
         # Configuracion para el panel de distancias
         self.distances_panel_width = 300
         self.distances_panel_height = 150
+        self._panel_overlay = None  # Fondo semitransparente del panel (se crea una vez)
         
         # Cache para superficies de texto 
         self.cached_text = {}
@@ -46,16 +47,15 @@ class GameHUD:
              game_mode='normal', shield_time: float = 0.0):
         """Version optimizada con cache de textos y sistema de escudo"""
         
+        render_text = self.resource_manager.render_text
+        
         # Cache textos de instrucciones (no cambian)
         if not self.cached_instruction_texts:
             font = self.resource_manager.get_font('pequeña')
             if font:
-                self.cached_instruction_texts['space'] = font.render(
-                    "[ESPACIO] Saltar", True, COLOR_BLANCO)
-                self.cached_instruction_texts['z'] = font.render(
-                    "[Z] Dash", True, COLOR_BLANCO)
-                self.cached_instruction_texts['c'] = font.render(
-                    "[C] Cambiar personaje", True, COLOR_BLANCO)
+                self.cached_instruction_texts['space'] = render_text(font, "[ESPACIO] Saltar", COLOR_BLANCO)
+                self.cached_instruction_texts['z'] = render_text(font, "[Z] Dash", COLOR_BLANCO)
+                self.cached_instruction_texts['c'] = render_text(font, "[C] Cambiar personaje", COLOR_BLANCO)
         
         # Renderizar textos dinamicos solo si cambiaron
         font = self.resource_manager.get_font('hud')
@@ -63,26 +63,20 @@ class GameHUD:
             # Energy text
             energy_str = f"Energia: {energy_remaining:.1f}s"
             if self.last_energy_text != energy_str:
-                self.energy_surface = font.render(energy_str, True, COLOR_BLANCO)
+                self.energy_surface = render_text(font, energy_str, COLOR_BLANCO)
                 self.last_energy_text = energy_str
             
             # KM text
-            if game_mode == 'normal':
-                km_str = f"Distancia: {km_remaining:.2f} km"
-                if self.last_km_text != km_str:
-                    self.km_surface = font.render(km_str, True, COLOR_BLANCO)
-                    self.last_km_text = km_str
-            else:
-                km_str = f"Distancia: {km_remaining:.2f} km"
-                if self.last_km_text != km_str:
-                    self.km_surface = font.render(km_str, True, COLOR_BLANCO)
-                    self.last_km_text = km_str
+            km_str = f"Distancia: {km_remaining:.2f} km"
+            if self.last_km_text != km_str:
+                self.km_surface = render_text(font, km_str, COLOR_BLANCO)
+                self.last_km_text = km_str
             
             # NUEVO: Shield text (solo si hay escudo activo)
             if shield_time > 0:
                 shield_str = f"Escudo: {shield_time:.1f}s"
                 if self.last_shield_text != shield_str:
-                    self.shield_surface = font.render(shield_str, True, COLOR_AMARILLO)
+                    self.shield_surface = render_text(font, shield_str, COLOR_AMARILLO)
                     self.last_shield_text = shield_str
             else:
                 self.last_shield_text = None
@@ -146,14 +140,14 @@ class GameHUD:
             
             # Crear superficie con alpha para el efecto pulsante
             shield_text_alpha = int(180 + pulse * 75)  # Entre 180 y 255
-            shield_text_surface = font_hud.render(f"Escudo: {shield_time:.1f}s", True, shield_color)
+            shield_text_surface = self.resource_manager.render_text(font_hud, f"Escudo: {shield_time:.1f}s", shield_color)
             
             # Dibujar texto del escudo
             screen.blit(shield_text_surface, (shield_bar_x, shield_bar_y - 25))
             
             # NUEVO: Añadir simbolo de escudo parpadeante
             shield_symbol = "🛡️"
-            symbol_surface = font_hud.render(shield_symbol, True, shield_color)
+            symbol_surface = self.resource_manager.render_text(font_hud, shield_symbol, shield_color)
             symbol_x = shield_bar_x - 30
             symbol_y = shield_bar_y - 25
             
@@ -192,10 +186,11 @@ class GameHUD:
         panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
         
         # Fondo semi-transparente (manteniendo el estilo del HUD original)
-        overlay = pygame.Surface((panel_width, panel_height))
-        overlay.set_alpha(150)
-        overlay.fill(COLOR_INSTRUCCION_FONDO)
-        screen.blit(overlay, panel_rect)
+        if self._panel_overlay is None:
+            self._panel_overlay = pygame.Surface((panel_width, panel_height))
+            self._panel_overlay.set_alpha(150)
+            self._panel_overlay.fill(COLOR_INSTRUCCION_FONDO)
+        screen.blit(self._panel_overlay, panel_rect)
         
         # Borde del panel
         pygame.draw.rect(screen, COLOR_BLANCO, panel_rect, 2)
@@ -205,9 +200,11 @@ class GameHUD:
         font_datos = self.resource_manager.get_font('hud')
         
         if font_titulo and font_datos:
+            render_text = self.resource_manager.render_text
+            
             # Titulo del panel
             titulo_text = "Distancias Recorridas"
-            titulo_surface = font_titulo.render(titulo_text, True, COLOR_AMARILLO)
+            titulo_surface = render_text(font_titulo, titulo_text, COLOR_AMARILLO)
             titulo_rect = titulo_surface.get_rect()
             titulo_rect.centerx = panel_x + panel_width // 2
             titulo_rect.y = panel_y + 8
@@ -226,7 +223,7 @@ class GameHUD:
                     
                     # Texto del personaje
                     personaje_text = f"{personaje}:"
-                    personaje_surface = font_datos.render(personaje_text, True, COLOR_BLANCO)
+                    personaje_surface = render_text(font_datos, personaje_text, COLOR_BLANCO)
                     personaje_rect = personaje_surface.get_rect()
                     personaje_rect.x = panel_x + 10
                     personaje_rect.y = y_offset + (i * line_height)
@@ -234,7 +231,7 @@ class GameHUD:
                     
                     # Distancia (alineada a la derecha)
                     distancia_text = f"{distancia:.2f} km"
-                    distancia_surface = font_datos.render(distancia_text, True, COLOR_BARRA_ENERGIA)
+                    distancia_surface = render_text(font_datos, distancia_text, COLOR_BARRA_ENERGIA)
                     distancia_rect = distancia_surface.get_rect()
                     distancia_rect.right = panel_x + panel_width - 10
                     distancia_rect.y = personaje_rect.y
@@ -244,13 +241,13 @@ class GameHUD:
             total_y = y_offset + (len(personajes_ordenados) * line_height) + 2
             # Total de la partida
             distancia_total = sum(distancias_personajes.values())
-            total_surface = font_datos.render("TOTAL:", True, COLOR_AMARILLO)
+            total_surface = render_text(font_datos, "TOTAL:", COLOR_AMARILLO)
             total_rect = total_surface.get_rect()
             total_rect.x = panel_x + 10
             total_rect.y = total_y + 6
             screen.blit(total_surface, total_rect)
             
-            total_km_surface = font_datos.render(f"{distancia_total:.2f} km", True, COLOR_AMARILLO)
+            total_km_surface = render_text(font_datos, f"{distancia_total:.2f} km", COLOR_AMARILLO)
             total_km_rect = total_km_surface.get_rect()
             total_km_rect.right = panel_x + panel_width - 10
             total_km_rect.y = total_rect.y
@@ -286,7 +283,7 @@ class GameHUD:
         
         font_hud = self.resource_manager.get_font('hud')
         if font_hud:
-            energy_text = font_hud.render(f"Energia: {percentage:.0f}%", True, COLOR_NEGRO)
+            energy_text = self.resource_manager.render_text(font_hud, f"Energia: {percentage:.0f}%", COLOR_NEGRO)
             screen.blit(energy_text, (bar_x, bar_y - 25))
     
     def _draw_km_counter(self, screen, km_remaining):
@@ -297,7 +294,8 @@ class GameHUD:
         # Crear texto
         font_hud = self.resource_manager.get_font('hud')
         if font_hud:
-            km_text = font_hud.render(f"Kilometros restantes: {km_remaining:.2f} km", True, COLOR_AMARILLO)
+            km_text = self.resource_manager.render_text(font_hud, f"Kilometros restantes: {km_remaining:.2f} km",
+                                                        COLOR_AMARILLO)
             
             # Crear fondo para el texto
             text_rect = km_text.get_rect()
@@ -20,6 +20,9 @@ class Camera:
         self.world_position_x = 0  
         self.world_position_y = 0  
         
+        # Posicion en el tick anterior (para interpolar el renderizado)
+        self.previous_x = 0.0
+        
         # Donde deberia aparecer el jugador visualmente en pantalla
         self.player_visual_x = DEFAULT_PLAYER_SCREEN_X  
         
@@ -34,6 +37,8 @@ class Camera:
             delta_time: Tiempo transcurrido desde el ultimo frame
             player_rect: Rectangulo del jugador a seguir
         """
+        self.previous_x = self.world_position_x
+        
         # Calcular la posicion objetivo de la camara (evitar valores negativos)
         desired_x = max(0.0, player_rect.x - self.player_visual_x)
         
@@ -47,6 +52,10 @@ class Camera:
         factor_y = max(0.0, min(1.0, self.follow_speed * delta_time))
         self.world_position_y += (desired_y - self.world_position_y) * factor_y
 	
+    def get_interpolated_x(self, alpha: float) -> float:
+        """Posicion X entre el tick anterior y el actual (alpha entre 0 y 1)"""
+        return self.previous_x + (self.world_position_x - self.previous_x) * alpha
+    
     def _calculate_player_deviation(self, player_rect: pygame.Rect) -> float:
         """Calcula cuanto se desvio el jugador de su posicion visual ideal"""
         return player_rect.x - self.player_visual_x
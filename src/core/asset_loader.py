@@ -0,0 +1,144 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, List, Optional, Tuple
+import pygame
+from src.Constantes import *
+from src.core.logger import game_log
+from src.core.pixel_cache import pixel_cache
+from src.core.sound_cache import sound_cache
+
+resource_log = game_log.channel("recursos")
+
+
+class AssetLoader:
+    """
+    Carga un lote de recursos en paralelo. Los hilos solo decodifican
+    (pygame.image.load y mixer.Sound liberan el GIL mientras leen el archivo, y las
+    imagenes que ya estan en el cache de pixeles solo se mapean a memoria);
+    convert_alpha() y el registro en el ResourceManager se hacen en el hilo
+    principal, que ademas puede dibujar una pantalla de progreso mientras espera.
+    """
+
+    def __init__(self, resource_manager, workers: int = ASSET_LOADER_WORKERS):
+        self.resource_manager = resource_manager
+        # Decodificar en paralelo solo rinde con varios nucleos: con uno los hilos se pisan
+        self.workers = max(1, min(workers, os.cpu_count() or 1))
+        self._jobs: List[Tuple] = []
+
+    # ===== REGISTRO DE TRABAJOS =====
+    def add_job(self, job: Tuple):
+        """Encola un recurso descrito como (tipo, nombre, ruta, *parametros)"""
+        self._jobs.append(job)
+
+    def add_image(self, name: str, path: str, convert_alpha: bool = True):
+        """Encola una imagen"""
+        self.add_job(("image", name, path, convert_alpha))
+
+    def add_spritesheet(self, name: str, path: str, frame_width: int, frame_height: int):
+        """Encola una hoja de sprites"""
+        self.add_job(("spritesheet", name, path, frame_width, frame_height))
+
+    def add_sound(self, name: str, path: str):
+        """Encola un efecto de sonido"""
+        self.add_job(("sound", name, path))
+
+    def add_music(self, name: str, path: str):
+        """Encola una pista de musica (solo se registra la ruta: se decodifica al reproducir)"""
+        self.add_job(("music", name, path))
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    # ===== CARGA =====
+    def load_all(self, on_progress: Optional[Callable[[int, int], None]] = None) -> float:
+        """
+        Carga todo lo encolado
+
+        Args:
+            on_progress: Funcion opcional (cargados, total) que se llama en el hilo
+                principal cada ASSET_LOADER_PROGRESS_INTERVAL segundos como maximo, solo
+                cuando cambia el porcentaje y recien despues de ASSET_LOADER_SPLASH_DELAY
+                (una carga corta no dibuja nada: cada flip cuesta varios ms)
+
+        Returns:
+            Tiempo total de carga en segundos
+        """
+        jobs, self._jobs = self._jobs, []
+        total = len(jobs)
+        start = time.perf_counter()
+        done = 0
+        last_progress = 0.0
+        shown_percent = -1  # Porcentaje en pantalla (-1 = la pantalla de carga no se dibujo)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="asset-loader") as pool:
+            pending = {pool.submit(self._decode, job): job for job in jobs}
+            while pending:
+                finished, _ = wait(pending, timeout=ASSET_LOADER_PROGRESS_INTERVAL,
+                                   return_when=FIRST_COMPLETED)
+                for future in finished:
+                    job = pending.pop(future)
+                    self._finish(job, future)
+                    done += 1
+                now = time.perf_counter()
+                if not on_progress or now - start < ASSET_LOADER_SPLASH_DELAY:
+                    continue
+                percent = done * 100 // total
+                if percent != shown_percent and (not pending or now - last_progress >= ASSET_LOADER_PROGRESS_INTERVAL):
+                    on_progress(done, total)
+                    shown_percent = percent
+                    last_progress = now
+                elif shown_percent >= 0:
+                    pygame.event.pump()  # Sin cambio visible: solo mantener viva la ventana
+
+        elapsed = time.perf_counter() - start
+        resource_log.info("%d recursos cargados en %.0f ms (%d hilos)", total, elapsed * 1000.0, self.workers)
+        return elapsed
+
+    def _decode(self, job: Tuple):
+        """Hilo de trabajo: lee y decodifica el archivo (None si no existe)"""
+        kind = job[0]
+        path = None if kind == "music" else self.resource_manager.resolve_path(job[2])
+        if path is None:
+            return None
+        if kind == "sound":
+            return sound_cache.load(path)
+        return pixel_cache.load(path)
+
+    def _finish(self, job: Tuple, future):
+        """Hilo principal: registra el recurso decodificado en el ResourceManager"""
+        rm = self.resource_manager
+        kind, name, path = job[0], job[1], job[2]
+        try:
+            decoded = future.result()
+        except Exception:
+            decoded = None  # La carga sincronica de abajo informa el error
+
+        if kind == "music" or decoded is None:
+            # Musica (solo ruta) o archivo faltante/con error: el camino normal avisa y pone el placeholder
+            rm.load_job(job)
+        elif kind == "image":
+            rm.add_image(name, decoded, job[3])
+        elif kind == "spritesheet":
+            rm.add_spritesheet(name, decoded, job[3], job[4])
+        else:
+            rm.add_sound(name, decoded)
+
+
+def draw_loading_screen(screen: pygame.Surface, font: Optional[pygame.font.Font], loaded: int, total: int):
+    """Pantalla de carga minima: texto y barra de progreso"""
+    screen.fill(COLOR_FONDO_BASE)
+    progress = loaded / total if total else 1.0
+
+    bar_width, bar_height = ANCHO_PANTALLA // 2, 24
+    bar_rect = pygame.Rect(0, 0, bar_width, bar_height)
+    bar_rect.center = (ANCHO_PANTALLA // 2, ALTO_PANTALLA // 2 + 40)
+    pygame.draw.rect(screen, COLOR_PRIMARIO, (bar_rect.x, bar_rect.y, int(bar_width * progress), bar_height))
+    pygame.draw.rect(screen, COLOR_BLANCO, bar_rect, 2)
+
+    if font:
+        text = font.render(f"Cargando... {int(progress * 100)}%", True, COLOR_TEXTO_EN_FONDO)
+        screen.blit(text, text.get_rect(center=(ANCHO_PANTALLA // 2, ALTO_PANTALLA // 2 - 20)))
+    pygame.display.flip()
+    # Procesar eventos del sistema para que la ventana no figure como "no responde"
+    pygame.event.pump()
@@ -0,0 +1,190 @@
+import json
+import os
+import time
+from typing import Collection, Dict, List, Optional, Tuple
+from src.Constantes import *
+from src.core.logger import game_log
+
+resource_log = game_log.channel("recursos")
+
+# Campos obligatorios segun el tipo de recurso
+_REQUIRED_FIELDS = {
+    "image": ("name", "type", "path"),
+    "spritesheet": ("name", "type", "path", "frame_size"),
+    "sound": ("name", "type", "path"),
+    "music": ("name", "type", "path"),
+}
+
+
+def _is_positive_int(value) -> bool:
+    """Entero mayor que cero (bool no cuenta aunque sea subclase de int)"""
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+class AssetIndex:
+    """
+    Indice de todos los archivos bajo la carpeta de recursos. Se arma con una
+    sola recorrida de os.scandir y despues resolver una ruta es buscar en un dict,
+    sin stat por archivo. Las rutas se comparan sin distinguir mayusculas, asi
+    "bateria.png" encuentra "Bateria.png" tambien en Linux.
+    """
+
+    def __init__(self, root: str = ASSET_ROOT):
+        self.root = os.path.normpath(root)
+        self.files: Dict[str, str] = {}   # ruta normalizada en minusculas -> ruta real
+        self._lookups: Dict[str, Tuple[bool, Optional[str]]] = {}  # ruta pedida -> (dentro del indice, ruta real)
+        self.build_ms = 0.0
+        self.rebuild()
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.normpath(path).replace("\\", "/").lower()
+
+    def rebuild(self):
+        """Vuelve a recorrer la carpeta (por ejemplo si se agregaron archivos)"""
+        start = time.perf_counter()
+        self.files = {}
+        self._lookups = {}
+        pending = [self.root]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        else:
+                            self.files[self._key(entry.path)] = entry.path.replace("\\", "/")
+            except OSError as e:
+                resource_log.warning("No se pudo leer la carpeta de recursos %s: %s", directory, e)
+        self.build_ms = (time.perf_counter() - start) * 1000.0
+
+    def lookup(self, path: str) -> Tuple[bool, Optional[str]]:
+        """(la ruta cae dentro de la carpeta indexada, ruta real o None); se memoriza por ruta pedida"""
+        found = self._lookups.get(path)
+        if found is None:
+            key = self._key(path)
+            found = (key.startswith(self._key(self.root) + "/"), self.files.get(key))
+            self._lookups[path] = found
+        return found
+
+    def covers(self, path: str) -> bool:
+        """Indica si la ruta cae dentro de la carpeta indexada"""
+        return self.lookup(path)[0]
+
+    def resolve(self, path: str) -> Optional[str]:
+        """Ruta real del archivo (None si no existe)"""
+        return self.lookup(path)[1]
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+
+class AssetManifest:
+    """
+    Catalogo declarativo de recursos leido de un JSON. Cada entrada tiene
+    nombre, tipo (image, spritesheet, sound, music), ruta y, segun el tipo,
+    tamaño y cantidad de frames, si es persistente y que escenas la usan siempre.
+    """
+
+    def __init__(self, entries: List[Dict], path: str = ""):
+        self.path = path
+        self.entries = entries
+        self.errors: List[str] = []      # Entradas invalidas (se descartan)
+        self.missing: List[str] = []     # Entradas validas cuyo archivo no esta
+        self.unknown_scenes: List[str] = []  # Nombres en "scenes" que no son ninguna escena (no cargarian nada)
+        self.renamed: List[Tuple[str, str]] = []  # (ruta del manifiesto, ruta real) que solo difieren en mayusculas
+
+    @classmethod
+    def load(cls, path: str = ASSET_MANIFEST) -> "AssetManifest":
+        """Lee el manifiesto (lanza OSError/ValueError si no se puede leer)"""
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        entries = data.get("assets", []) if isinstance(data, dict) else data
+        if not isinstance(entries, list):
+            raise ValueError(f"se esperaba una lista de recursos, no {type(entries).__name__}")
+        return cls(entries, path)
+
+    def validate(self, index: AssetIndex, scene_names: Optional[Collection[str]] = None) -> List[Dict]:
+        """
+        Revisa todas las entradas en una pasada y resuelve sus rutas con el indice.
+        Una entrada mal formada se anota en errors y se descarta, sin cortar la revision.
+
+        Args:
+            index: Indice de la carpeta de recursos
+            scene_names: Nombres de las clases Scene; si se pasan, los de "scenes"
+                que no coinciden se anotan en unknown_scenes
+
+        Returns:
+            Entradas validas, con "path" reemplazado por la ruta real y
+            "missing" en True si el archivo no existe
+        """
+        self.errors, self.missing, self.renamed, self.unknown_scenes = [], [], [], []
+        valid = []
+        seen = set()
+        for position, entry in enumerate(self.entries):
+            if not isinstance(entry, dict):
+                self.errors.append(f"#{position}: se esperaba un objeto, no {type(entry).__name__}")
+                continue
+            kind = entry.get("type")
+            name = entry.get("name")
+            if not isinstance(kind, str) or kind not in _REQUIRED_FIELDS:
+                self.errors.append(f"#{position} ({name}): tipo desconocido '{kind}'")
+                continue
+            absent = [field for field in _REQUIRED_FIELDS[kind] if not entry.get(field)]
+            if absent:
+                self.errors.append(f"#{position} ({name}): faltan {', '.join(absent)}")
+                continue
+            not_text = [field for field in ("name", "path") if not isinstance(entry[field], str)]
+            if not_text:
+                self.errors.append(f"#{position} ({name}): {', '.join(not_text)} debe ser texto")
+                continue
+            if name in seen:
+                self.errors.append(f"#{position}: nombre repetido '{name}'")
+                continue
+            frame_size = entry.get("frame_size")
+            if kind == "spritesheet" and not (isinstance(frame_size, (list, tuple)) and len(frame_size) == 2
+                                              and all(_is_positive_int(value) for value in frame_size)):
+                self.errors.append(f"#{position} ({name}): frame_size debe ser [ancho, alto] enteros, no {frame_size!r}")
+                continue
+            if "frames" in entry and not _is_positive_int(entry["frames"]):
+                self.errors.append(f"#{position} ({name}): frames debe ser un entero positivo, no {entry['frames']!r}")
+                continue
+            scenes = entry.get("scenes", [])
+            if not isinstance(scenes, (list, tuple)) or not all(isinstance(scene, str) for scene in scenes):
+                self.errors.append(f"#{position} ({name}): scenes debe ser una lista de nombres de escena")
+                continue
+            if scene_names is not None:
+                # Scene.required_assets busca por nombre de clase: un error de tipeo no cargaria nada
+                self.unknown_scenes.extend(f"{scene} ({name})" for scene in scenes if scene not in scene_names)
+            seen.add(name)
+
+            entry = dict(entry)
+            declared = entry["path"]
+            covered, resolved = index.lookup(declared)
+            if not covered:
+                resolved = declared if os.path.exists(declared) else None
+            entry["missing"] = resolved is None
+            if resolved is None:
+                self.missing.append(f"{name} ({declared})")
+            else:
+                if resolved != declared:
+                    self.renamed.append((declared, resolved))
+                entry["path"] = resolved
+            valid.append(entry)
+        return valid
+
+    def report(self):
+        """Un solo aviso con todo lo que encontro validate()"""
+        if self.errors:
+            resource_log.error("Manifiesto %s: %d entradas invalidas: %s", self.path, len(self.errors),
+                               "; ".join(self.errors))
+        if self.missing:
+            resource_log.warning("Manifiesto %s: %d archivos faltantes: %s", self.path, len(self.missing),
+                                 ", ".join(self.missing))
+        if self.unknown_scenes:
+            resource_log.warning("Manifiesto %s: %d escenas desconocidas en \"scenes\": %s", self.path,
+                                 len(self.unknown_scenes), ", ".join(self.unknown_scenes))
+        if self.renamed:
+            resource_log.info("Manifiesto %s: %d rutas difieren solo en mayusculas: %s", self.path,
+                              len(self.renamed), ", ".join(f"{a} -> {b}" for a, b in self.renamed))
@@ -0,0 +1,366 @@
+import json
+import platform
+import sys
+import time
+import types
+import tracemalloc
+from abc import ABC
+from typing import Callable, Dict, List, Optional
+import pygame
+from src.Constantes import *
+from src.systems.ability_system import ability_system
+from src.screens.menu_screen import MenuScreen
+from src.screens.game_screen import GameScreen
+from src.screens.game_screen_mission import MissionGameScreen
+from src.screens.level_screen import LevelScreen
+from src.entities.Player import Player
+from src.entities.Car import Car
+from src.entities.Pilas import pilas
+
+# Metricas que se comparan contra el baseline y si "mas alto" es peor
+COMPARED_METRICS = {
+    "mean_ms": True,
+    "p95_ms": True,
+    "p99_ms": True,
+    "low_1_fps": False,
+}
+
+
+class BenchmarkScenario:
+    """Escena a medir con los datos compartidos y los ganchos que la preparan"""
+
+    def __init__(self, name: str, scene_class, description: str, shared_data: Dict = None,
+                 prepare: Callable = None, before_update: Callable = None):
+        self.name = name
+        self.scene_class = scene_class
+        self.description = description
+        self.shared_data = shared_data or {}
+        self.prepare = prepare              # Se llama una vez con la escena ya creada
+        self.before_update = before_update  # Se llama antes de cada tick medido
+
+
+# ===== GANCHOS DE LOS ESCENARIOS =====
+
+def _disable_collisions(scene):
+    """Los autos no terminan la partida: el escenario corre completo"""
+    scene.car_spawner.check_collisions = lambda player_rect, previous_player_rect=None: False
+
+
+def _keep_alive(scene):
+    """Mantiene energia llena y la distancia sin avanzar (sin game over ni victoria)"""
+    scene.energy_remaining = scene.player.obtener_autonomia_maxima()
+    scene.time = 0.0
+
+
+def _force_effects(scene):
+    """Escudo, efecto de impacto y dash siempre activos"""
+    _keep_alive(scene)
+    player = scene.player
+    player.has_shield = True
+    player.shield_time = player.max_shield_time
+    player.shield_collision_effect_time = SHIELD_EFFECT_DURATION
+    player.is_dashing = True
+    player.dash_timer = player.dash_duration
+
+
+def _prepare_night(scene):
+    _disable_collisions(scene)
+    scene.renderer.set_night_mode(True)
+
+
+def _prepare_long_dialog(scene):
+    """Posiciona el dialogo en el texto mas largo del nivel"""
+    lengths = [len(dialog["text"]) for dialog in scene.current_dialogs]
+    scene.current_dialog_index = lengths.index(max(lengths))
+
+
+def _retype_dialog(scene):
+    """Cuando el texto termina de escribirse, lo vuelve a empezar"""
+    if scene.waiting_for_input:
+        scene.text_timer = 0
+        scene.text_animation_progress = 0
+        scene.waiting_for_input = False
+
+
+def _prepare_mission_completed(scene):
+    """Muestra la pantalla de mision completada sin guardar progreso"""
+    scene.victory = True
+    scene.mission_completed = True
+    scene.new_abilities = list(ability_system.ability_rewards.get(scene.mission_key, []))
+
+
+SCENARIOS: List[BenchmarkScenario] = [
+    BenchmarkScenario("menu_idle", MenuScreen, "Menu principal sin interaccion"),
+    BenchmarkScenario("game_normal", GameScreen, "Partida en modo normal",
+                      {"game_mode": "normal"}, _disable_collisions, _keep_alive),
+    BenchmarkScenario("game_effects", GameScreen, "Partida con escudo y dash forzados",
+                      {"game_mode": "normal"}, _disable_collisions, _force_effects),
+    BenchmarkScenario("game_night", GameScreen, "Partida con modo noche",
+                      {"game_mode": "normal"}, _prepare_night, _keep_alive),
+    BenchmarkScenario("level_dialog", LevelScreen, "Dialogo largo escribiendose",
+                      {"selected_level": "level_1"}, _prepare_long_dialog, _retype_dialog),
+    BenchmarkScenario("mission_completed", MissionGameScreen, "Pantalla de mision completada",
+                      {"selected_level": "level_4"}, _prepare_mission_completed),
+]
+
+
+# ===== METRICAS =====
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Percentil por rango mas cercano sobre una lista ya ordenada"""
+    index = int(round(percent / 100.0 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def compute_metrics(frame_times_ms: List[float]) -> Dict[str, float]:
+    """
+    Calcula las metricas de ritmo de frames
+
+    Args:
+        frame_times_ms: Tiempo de cada frame en milisegundos
+
+    Returns:
+        FPS promedio, percentiles, 1% low (FPS del 1% de frames mas lentos) y peor tiron
+    """
+    if not frame_times_ms:
+        return {}
+    ordered = sorted(frame_times_ms)
+    mean_ms = sum(ordered) / len(ordered)
+    worst_count = max(1, len(ordered) // 100)
+    worst_mean_ms = sum(ordered[-worst_count:]) / worst_count
+    return {
+        "frames": len(ordered),
+        "mean_fps": 1000.0 / mean_ms if mean_ms > 0 else 0.0,
+        "mean_ms": mean_ms,
+        "p50_ms": _percentile(ordered, 50),
+        "p95_ms": _percentile(ordered, 95),
+        "p99_ms": _percentile(ordered, 99),
+        "low_1_fps": 1000.0 / worst_mean_ms if worst_mean_ms > 0 else 0.0,
+        "worst_ms": ordered[-1],
+    }
+
+
+# ===== ENTIDADES =====
+
+def _player_attributes(player: Player):
+    """Lecturas que hacen el renderer y las colisiones sobre el jugador en cada frame"""
+    return (player.rect, player.previous_x, player.previous_y, player.current_sprite,
+            player.current_sprite_rect, player.has_shield, player.is_dashing, player.shield_time)
+
+
+def _car_attributes(car: Car):
+    """Lecturas de GameRenderer.draw_cars y CarSpawner.check_collisions sobre un auto"""
+    return (car.rect, car.previous_x, car.current_sprite)
+
+
+def _collectible_attributes(collectible):
+    """Lecturas de draw_collectibles y CollectibleSpawner.check_collisions sobre un coleccionable"""
+    return (collectible.rect, collectible.previous_x, collectible.region, collectible.collected)
+
+
+def _dict_layout(cls, sprite_base: bool):
+    """
+    La misma clase sin __slots__, como estaban antes las entidades: mismos
+    metodos, atributos en un __dict__ y, para autos y coleccionables,
+    pygame.sprite.Sprite como base. Sirve de referencia para medir la ganancia.
+    """
+    namespace = {}
+    for klass in reversed(cls.__mro__):
+        if klass in (object, ABC):
+            continue
+        for name, value in vars(klass).items():
+            if name in ("__slots__", "__dict__", "__weakref__", "__abstractmethods__") or name.startswith("_abc"):
+                continue
+            if not isinstance(value, types.MemberDescriptorType):
+                namespace[name] = value
+    bases = (pygame.sprite.Sprite,) if sprite_base else ()
+    return type(f"{cls.__name__}ConDict", bases, namespace)
+
+
+def _dict_copy(entity, layout):
+    """Instancia del layout con __dict__ que tiene el mismo estado que entity (con rects propios)"""
+    copy = layout.__new__(layout)
+    if issubclass(layout, pygame.sprite.Sprite):
+        pygame.sprite.Sprite.__init__(copy)
+    for klass in reversed(type(entity).__mro__):
+        for name in getattr(klass, "__slots__", ()):
+            if hasattr(entity, name):
+                value = getattr(entity, name)
+                setattr(copy, name, value.copy() if isinstance(value, pygame.Rect) else value)
+    return copy
+
+
+def _object_bytes(entity) -> int:
+    """Bytes del objeto y de su __dict__ (lo que referencia es igual en las dos formas)"""
+    size = sys.getsizeof(entity)
+    if hasattr(entity, "__dict__"):
+        size += sys.getsizeof(vars(entity))
+    return size
+
+
+def _time_loop(entities: List, step: Callable) -> float:
+    """Segundos que tarda step sobre todas las entidades"""
+    start = time.perf_counter()
+    for entity in entities:
+        step(entity)
+    return time.perf_counter() - start
+
+
+def _measure_entity(create: Callable, read: Callable, sprite_base: bool,
+                    count: int, repeats: int) -> Dict[str, float]:
+    """
+    Memoria por instancia y costo de leer y actualizar cada entidad, junto al
+    mismo estado guardado con el layout con __dict__ (columnas dict_*)
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [create(i) for i in range(count)]
+    memory = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    layout = _dict_layout(type(entities[0]), sprite_base)
+    copies = [_dict_copy(entity, layout) for entity in entities]
+
+    dt = 1.0 / SIMULATION_TICK_RATE
+    update = lambda entity: entity.update(dt)
+    times = {"read": [], "dict_read": [], "update": [], "dict_update": []}
+    # Las dos formas se alternan en cada repeticion para que compartan el ruido del sistema
+    for _ in range(repeats):
+        times["read"].append(_time_loop(entities, read))
+        times["dict_read"].append(_time_loop(copies, read))
+        times["update"].append(_time_loop(entities, update))
+        times["dict_update"].append(_time_loop(copies, update))
+    # El minimo de las repeticiones es el menos afectado por el ruido del sistema
+    result = {
+        "count": count,
+        "bytes_per_instance": memory / count,
+        "has_dict": hasattr(entities[0], "__dict__"),
+        "object_bytes": _object_bytes(entities[0]),
+        "dict_object_bytes": _object_bytes(copies[0]),
+    }
+    for name, samples in times.items():
+        result[f"{name}_ns"] = min(samples) / count * 1e9
+    return result
+
+
+def measure_entities(resource_manager, count: int = ENTITY_BENCHMARK_COUNT,
+                     repeats: int = ENTITY_BENCHMARK_REPEATS) -> Dict[str, Dict[str, float]]:
+    """Mide memoria y acceso a atributos de Player, Car y los coleccionables contra el layout con __dict__"""
+    entities = {
+        "player": (lambda i: Player(100, 300, 0.8, resource_manager), _player_attributes, False),
+        "car": (lambda i: Car(i * 10, 400, resource_manager, 15), _car_attributes, True),
+        "pilas": (lambda i: pilas(resource_manager), _collectible_attributes, True),
+    }
+    return {name: _measure_entity(create, read, sprite_base, count, repeats)
+            for name, (create, read, sprite_base) in entities.items()}
+
+
+# ===== EJECUCION =====
+
+def run_scenario(game, scenario: BenchmarkScenario, frames: int, seed: int) -> Dict[str, float]:
+    """Crea la escena del escenario, la calienta y mide sus frames"""
+    shared = game.shared_data
+    base_shared = dict(shared)
+    shared.update(scenario.shared_data)
+    shared['run_seed'] = seed
+    try:
+        game.scene_manager.change_scene(scenario.scene_class)
+        # El primer frame crea la escena; el calentamiento carga caches antes de medir
+        game.run_headless(frames=1)
+        if scenario.prepare:
+            scenario.prepare(game.scene_manager.current_scene)
+        game.run_headless(frames=BENCHMARK_WARMUP_FRAMES, before_update=scenario.before_update)
+        result = game.run_headless(frames=frames, before_update=scenario.before_update)
+    finally:
+        shared.clear()
+        shared.update(base_shared)
+    return compute_metrics(result["frame_times_ms"])
+
+
+def run_benchmarks(game, names: Optional[List[str]] = None, frames: int = BENCHMARK_FRAMES,
+                   seed: int = BENCHMARK_SEED, entities: bool = False) -> Dict:
+    """
+    Corre los escenarios pedidos (o todos) y devuelve los resultados listos para JSON
+
+    Con entities=True agrega la medicion de memoria y atributos de las entidades
+    """
+    selected = [s for s in SCENARIOS if not names or s.name in names]
+    results = {
+        "meta": {
+            "frames": frames,
+            "warmup_frames": BENCHMARK_WARMUP_FRAMES,
+            "seed": seed,
+            "tick_rate": game.tick_rate,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+        },
+        "scenarios": {},
+    }
+    for scenario in selected:
+        print(f"Escenario {scenario.name}: {scenario.description}")
+        results["scenarios"][scenario.name] = run_scenario(game, scenario, frames, seed)
+    if entities:
+        print(f"Entidades: {ENTITY_BENCHMARK_COUNT} instancias de cada tipo")
+        results["entities"] = measure_entities(game.resource_manager)
+    return results
+
+
+def compare_with_baseline(results: Dict, baseline: Dict, tolerance: float = BENCHMARK_TOLERANCE) -> List[str]:
+    """
+    Compara los resultados con un baseline guardado
+
+    Returns:
+        Lista de regresiones encontradas (vacia si todo esta dentro de la tolerancia)
+    """
+    regressions = []
+    for name, metrics in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            continue
+        for metric, higher_is_worse in COMPARED_METRICS.items():
+            current, previous = metrics.get(metric), base.get(metric)
+            if not current or not previous:
+                continue
+            change = (current - previous) / previous
+            if (change if higher_is_worse else -change) > tolerance:
+                regressions.append(f"{name}.{metric}: {previous:.2f} -> {current:.2f} ({change:+.1%})")
+    return regressions
+
+
+def print_results(results: Dict, baseline: Dict = None):
+    """Muestra una tabla con los resultados (y el cambio contra el baseline)"""
+    header = f"{'escenario':<20}{'fps':>9}{'p50':>8}{'p95':>8}{'p99':>8}{'1% low':>9}{'peor':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, m in results["scenarios"].items():
+        line = (f"{name:<20}{m['mean_fps']:>9.1f}{m['p50_ms']:>8.2f}{m['p95_ms']:>8.2f}"
+                f"{m['p99_ms']:>8.2f}{m['low_1_fps']:>9.1f}{m['worst_ms']:>9.2f}")
+        base = (baseline or {}).get("scenarios", {}).get(name)
+        if base and base.get("mean_fps"):
+            line += f"   ({(m['mean_fps'] - base['mean_fps']) / base['mean_fps']:+.1%} fps)"
+        print(line)
+
+    if results.get("entities"):
+        print()
+        print("Entidades: layout con __dict__ -> clase actual con __slots__")
+        header = f"{'entidad':<10}{'bytes objeto':>24}{'lectura ns':>24}{'update ns':>24}{'bytes totales':>15}"
+        print(header)
+        print("-" * len(header))
+        for name, m in results["entities"].items():
+            line = f"{name:<10}"
+            for key in ("object_bytes", "read_ns", "update_ns"):
+                before, after = m["dict_" + key], m[key]
+                line += f"{before:>8.0f} ->{after:>6.0f} ({(after - before) / before:+4.0%})"
+            print(line + f"{m['bytes_per_instance']:>15.0f}")
+
+
+def save_results(results: Dict, path: str):
+    """Guarda los resultados como JSON"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path: str) -> Dict:
+    """Carga resultados (o un baseline) guardados como JSON"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
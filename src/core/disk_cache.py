@@ -0,0 +1,40 @@
+import hashlib
+import os
+import threading
+from typing import Iterable
+
+# Utilidades compartidas por los caches en disco (pixel_cache, sound_cache): cada
+# entrada guarda en su cabecera mtime, tamaño y sha1 del archivo original.
+
+
+def cache_key(path: str) -> str:
+    """Nombre base de la entrada del cache para `path` (sha1 de la ruta absoluta)"""
+    return hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()
+
+
+def hash_file(path: str) -> bytes:
+    """sha1 del contenido de `path`"""
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).digest()
+
+
+def write_atomic(cache_path: str, chunks: Iterable[bytes]):
+    """Escribe la entrada en un archivo temporal y lo reemplaza de una vez (OSError si falla)"""
+    os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, cache_path)
+
+
+def rewrite_header(cache_path: str, header: bytes):
+    """
+    Reescribe la cabecera de una entrada valida (tipicamente con el mtime nuevo
+    despues de que el hash coincidio) para no volver a hashear en el proximo inicio
+    """
+    try:
+        with open(cache_path, "r+b") as f:
+            f.write(header)
+    except OSError:
+        pass  # Cache de solo lectura: se vuelve a hashear la proxima vez
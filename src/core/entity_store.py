@@ -0,0 +1,210 @@
+from array import array
+from typing import List
+from src.Constantes import *
+from src.core.kinematics import tick_scale
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin el se usa array y un bucle sobre las columnas
+    np = None
+
+# Columnas de punto flotante y enteras (una entrada por slot)
+_FLOAT_COLUMNS = ("x", "prev_x", "y", "vx", "width", "anim_timer", "anim_speed")
+_INT_COLUMNS = ("frame", "frame_count", "alive", "used")
+
+
+class EntityStore:
+    """
+    Entidades guardadas por columnas (structure of arrays): posicion, velocidad,
+    timers de animacion y flags en arreglos paralelos, un slot por entidad.
+    step() y cull() recorren las columnas de una vez.
+
+    Solo se usa con ENTITY_STORE_ENABLED (modo de estres, cientos de
+    entidades): los pools crean entonces StoreCar y las vistas de los
+    coleccionables, que leen rect, previous_x y el frame de su slot al
+    consultarlos. Con pocas entidades los objetos sueltos son mas baratos.
+
+    Las columnas son array (leer un slot desde Python es barato). Con NumPy
+    instalado y al menos ENTITY_STORE_NUMPY_MIN_SIZE slots, step() y cull()
+    trabajan sobre vistas NumPy de la misma memoria (sin copiar).
+
+    Unidades: vx en pixeles por tick de referencia (como las velocidades de
+    los autos), anim_speed en segundos por frame.
+    """
+
+    def __init__(self, capacity: int = ENTITY_STORE_INITIAL_CAPACITY):
+        self.use_numpy = np is not None and ENTITY_STORE_USE_NUMPY
+        self.capacity = 0
+        self.size = 0                  # Slots usados alguna vez (los libres quedan en free_slots)
+        self.free_slots: List[int] = []
+        self._views = None             # Vistas NumPy de las columnas (se rehacen al crecer)
+        for name in _FLOAT_COLUMNS + _INT_COLUMNS:
+            setattr(self, name, array('d' if name in _FLOAT_COLUMNS else 'i'))
+        self._grow(max(1, capacity))
+
+    @property
+    def backend(self) -> str:
+        """Como se recorren las columnas con el tamaño actual"""
+        return "numpy" if self._vectorized() else "array"
+
+    def _vectorized(self) -> bool:
+        return self.use_numpy and self.size >= ENTITY_STORE_NUMPY_MIN_SIZE
+
+    def _grow(self, capacity: int):
+        """Agranda todas las columnas conservando los datos"""
+        self._views = None  # Las vistas apuntan a la memoria vieja
+        for name in _FLOAT_COLUMNS + _INT_COLUMNS:
+            old = getattr(self, name)
+            column = array(old.typecode, bytes(old.itemsize * capacity))
+            column[:len(old)] = old
+            setattr(self, name, column)
+        self.capacity = capacity
+
+    def _numpy_views(self):
+        """Columnas vistas como arreglos NumPy (comparten memoria con los array)"""
+        if self._views is None:
+            self._views = {name: np.frombuffer(getattr(self, name), dtype=np.float64 if name in _FLOAT_COLUMNS else np.int32)
+                           for name in _FLOAT_COLUMNS + _INT_COLUMNS}
+        return self._views
+
+    def spawn(self, x: float, y: float, vx: float, width: float,
+              anim_speed: float = 0.0, frame_count: int = 0) -> int:
+        """Ocupa un slot (reusa uno libre si hay) y devuelve su indice"""
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            if self.size == self.capacity:
+                self._grow(self.capacity * 2)
+            slot = self.size
+            self.size += 1
+        self.used[slot] = 1
+        self.reset(slot, x, y, vx, width, anim_speed, frame_count)
+        return slot
+
+    def reset(self, slot: int, x: float, y: float, vx: float, width: float,
+              anim_speed: float = 0.0, frame_count: int = 0):
+        """Vuelve a inicializar un slot ya ocupado (reuso desde un pool)"""
+        self.y[slot] = y
+        self.vx[slot] = vx
+        self.width[slot] = width
+        self.anim_timer[slot] = 0.0
+        self.anim_speed[slot] = anim_speed
+        self.frame[slot] = 0
+        self.frame_count[slot] = frame_count
+        self.alive[slot] = 1
+        self.place(slot, x)
+
+    def place(self, slot: int, x: float):
+        """Coloca el slot en x sin rastro de interpolacion"""
+        self.x[slot] = x
+        self.prev_x[slot] = x
+
+    def release(self, slot: int):
+        """Libera el slot para la proxima entidad"""
+        if self.used[slot]:
+            self.used[slot] = 0
+            self.alive[slot] = 0
+            self.free_slots.append(slot)
+
+    def step(self, delta_time: float):
+        """Mueve y anima todas las entidades vivas en una pasada"""
+        n = self.size
+        if not n:
+            return
+        scale = tick_scale(delta_time)
+        if self._vectorized():
+            v = self._numpy_views()
+            alive = v["alive"][:n] != 0
+            x = v["x"][:n]
+            timer = v["anim_timer"][:n]
+            v["prev_x"][:n] = x
+            x += v["vx"][:n] * scale * alive
+            timer += delta_time * alive
+            frame_count = v["frame_count"][:n]
+            due = alive & (frame_count > 0) & (timer >= v["anim_speed"][:n])
+            if due.any():
+                timer[due] = 0.0
+                frame = v["frame"][:n]
+                frame[due] = (frame[due] + 1) % frame_count[due]
+            return
+        # Sin NumPy: un solo recorrido con zip sobre las tajadas de las columnas;
+        # x y los timers se vuelven a copiar de una vez
+        old_x = self.x[:n]
+        self.prev_x[:n] = old_x
+        xs, timers, due = [], [], []
+        for value, velocity, live, elapsed, speed, count in zip(
+                old_x, self.vx[:n], self.alive[:n],
+                self.anim_timer[:n], self.anim_speed[:n], self.frame_count[:n]):
+            if live:
+                value += velocity * scale
+                if count:
+                    elapsed += delta_time
+                    if elapsed >= speed:
+                        elapsed = 0.0
+                        due.append(len(xs))
+            xs.append(value)
+            timers.append(elapsed)
+        self.x[:n] = array('d', xs)
+        self.anim_timer[:n] = array('d', timers)
+        frame, frame_count = self.frame, self.frame_count
+        for slot in due:
+            frame[slot] = (frame[slot] + 1) % frame_count[slot]
+
+    def step_slot(self, slot: int, delta_time: float):
+        """Mueve y anima una sola entidad (update() de las vistas sueltas)"""
+        self.prev_x[slot] = self.x[slot]
+        if not self.alive[slot]:
+            return
+        self.x[slot] += self.vx[slot] * tick_scale(delta_time)
+        if self.frame_count[slot]:
+            self.anim_timer[slot] += delta_time
+            if self.anim_timer[slot] >= self.anim_speed[slot]:
+                self.anim_timer[slot] = 0.0
+                self.frame[slot] = (self.frame[slot] + 1) % self.frame_count[slot]
+
+    def cull(self, min_right: float, include_dead: bool = False) -> List[int]:
+        """
+        Slots ocupados cuyo borde derecho quedo a la izquierda de min_right
+
+        Args:
+            min_right: Limite izquierdo en coordenadas del mundo
+            include_dead: Incluir tambien los slots ocupados que ya no estan vivos
+        """
+        n = self.size
+        if not n:
+            return []
+        if self._vectorized():
+            v = self._numpy_views()
+            used = v["used"][:n] != 0
+            alive = v["alive"][:n] != 0
+            gone = v["x"][:n] + v["width"][:n] <= min_right
+            gone = used & ((gone | ~alive) if include_dead else (gone & alive))
+            return np.flatnonzero(gone).tolist()
+        gone = []
+        for slot, (x, width, used, alive) in enumerate(zip(self.x[:n], self.width[:n], self.used[:n], self.alive[:n])):
+            if used and ((x + width <= min_right and alive) or (include_dead and not alive)):
+                gone.append(slot)
+        return gone
+
+    def near(self, center: float, reach: float) -> List[int]:
+        """
+        Slots vivos a menos de reach de center, contando su ancho y lo que se
+        movieron en el ultimo tick. Es la primera criba de las colisiones en
+        modo almacen: puede devolver de mas, nunca de menos (el test exacto se
+        hace despues con los rects).
+        """
+        n = self.size
+        if not n:
+            return []
+        reach += 1  # Los rects estan redondeados: medio pixel de diferencia con x
+        if self._vectorized():
+            v = self._numpy_views()
+            x = v["x"][:n]
+            close = np.abs(x - center) <= reach + v["width"][:n] + np.abs(x - v["prev_x"][:n])
+            return np.flatnonzero(close & (v["alive"][:n] != 0)).tolist()
+        return [slot for slot, (x, prev_x, width, alive) in enumerate(zip(self.x[:n], self.prev_x[:n], self.width[:n], self.alive[:n]))
+                if alive and abs(x - center) <= reach + width + abs(x - prev_x)]
+
+    def count_alive(self) -> int:
+        """Cantidad de entidades vivas"""
+        return sum(self.alive[:self.size])
@@ -0,0 +1,153 @@
+import math
+import time
+from typing import Dict, Tuple
+import pygame
+from src.Constantes import *
+from src.core.profiler import RingBuffer
+
+# Estrategias de espera entre frames
+PACING_MODES = ("tick", "busy", "hybrid", "vsync")
+
+
+class FramePacer:
+    """
+    Controla el ritmo de frames con distintas estrategias y mide su calidad.
+
+    - tick:   pygame Clock.tick (duerme; barato pero con granularidad gruesa)
+    - busy:   pygame Clock.tick_busy_loop (preciso pero ocupa un nucleo entero)
+    - hybrid: duerme hasta poco antes del limite y termina esperando activamente
+    - vsync:  la espera la hace display.flip() sincronizado con el monitor
+    """
+
+    def __init__(self, mode: str = FRAME_PACING_MODE):
+        if mode not in PACING_MODES:
+            print(f"Modo de pacing desconocido '{mode}', usando 'tick'. Opciones: {', '.join(PACING_MODES)}")
+            mode = "tick"
+        self.mode = mode
+        self.clock = pygame.time.Clock()
+
+        # Intervalos entre frames (ms) para calcular jitter
+        self.intervals = RingBuffer(FRAME_PACING_HISTORY)
+        # Desvio de cada frame respecto de su propio objetivo (el limite cambia segun escena y foco)
+        self.deviations = RingBuffer(FRAME_PACING_HISTORY)
+        self._presented = False
+        self._deadline = 0.0
+        self._last_frame = time.perf_counter()
+
+        # Uso de CPU del proceso: ventana de 1 s para el overlay y total de la corrida
+        self.cpu_usage = 0.0
+        self._cpu_mark: Tuple[float, float] = (self._last_frame, time.process_time())
+        self._run_start: Tuple[float, float] = self._cpu_mark
+
+    def create_display(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Crea la ventana; en modo vsync la pide sincronizada con el monitor"""
+        if self.mode == "vsync":
+            try:
+                # SDL solo respeta vsync con el renderer de SCALED (u OpenGL)
+                return pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+            except pygame.error as e:
+                print(f"No se pudo activar vsync ({e}), usando modo 'hybrid'")
+                self.mode = "hybrid"
+        return pygame.display.set_mode(size)
+
+    def wait(self, fps: int) -> float:
+        """
+        Espera hasta el proximo frame segun la estrategia elegida
+
+        Args:
+            fps: Limite de frames por segundo (0 = sin limite)
+
+        Returns:
+            Tiempo real transcurrido desde el frame anterior, en segundos
+        """
+        if self.mode == "tick":
+            self.clock.tick(fps)
+        elif self.mode == "busy":
+            self.clock.tick_busy_loop(fps)
+        elif self.mode == "hybrid":
+            self._wait_hybrid(fps)
+        elif not self._presented:
+            # vsync: el flip del frame anterior ya bloqueo hasta el refresco, pero si no
+            # se subio nada (regiones sucias vacias) no hubo espera y hay que dormir igual
+            self.clock.tick(fps)
+        self._presented = False
+
+        now = time.perf_counter()
+        frame_time = now - self._last_frame
+        self._last_frame = now
+        self.intervals.push(frame_time * 1000.0)
+        if fps > 0 and self.mode != "vsync":
+            self.deviations.push(abs(frame_time * 1000.0 - 1000.0 / fps))
+
+        wall_mark, cpu_mark = self._cpu_mark
+        if now - wall_mark >= 1.0:
+            cpu_now = time.process_time()
+            self.cpu_usage = (cpu_now - cpu_mark) / (now - wall_mark)
+            self._cpu_mark = (now, cpu_now)
+        return frame_time
+
+    def frame_presented(self):
+        """Avisa que este frame se subio a pantalla (en vsync eso ya hizo la espera)"""
+        self._presented = True
+
+    def _wait_hybrid(self, fps: int):
+        """Duerme la mayor parte de la espera y hace el ultimo tramo con perf_counter"""
+        if fps <= 0:
+            return
+        period = 1.0 / fps
+        now = time.perf_counter()
+        self._deadline += period
+        # Si el frame anterior se paso del limite no se recupera con frames sin espera:
+        # se resincroniza y este frame espera un periodo completo
+        if self._deadline <= now:
+            self._deadline = now + period
+
+        remaining = self._deadline - now
+        spin_time = FRAME_PACING_SPIN_MS / 1000.0
+        if remaining > spin_time:
+            time.sleep(remaining - spin_time)
+        while time.perf_counter() < self._deadline:
+            pass
+
+    def reset_stats(self):
+        """Descarta las mediciones (por ejemplo al cambiar de modo)"""
+        self.intervals.clear()
+        self.deviations.clear()
+        now = time.perf_counter()
+        self._cpu_mark = (now, time.process_time())
+        self._run_start = self._cpu_mark
+        self._last_frame = now
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Calcula jitter y uso de CPU
+
+        Returns:
+            Intervalo promedio, desviacion estandar, desviacion p99 respecto del
+            objetivo (o del promedio en vsync / sin limite) y uso de CPU total
+        """
+        values = self.intervals.ordered()
+        if not values:
+            return {"mean_ms": 0.0, "jitter_ms": 0.0, "p99_dev_ms": 0.0, "cpu": 0.0}
+        mean = sum(values) / len(values)
+        stddev = math.sqrt(sum((v - mean) ** 2 for v in values) / len(values))
+        deviations = sorted(self.deviations.ordered() or [abs(v - mean) for v in values])
+        p99 = deviations[int(round(0.99 * (len(deviations) - 1)))]
+
+        wall_start, cpu_start = self._run_start
+        wall = time.perf_counter() - wall_start
+        cpu = (time.process_time() - cpu_start) / wall if wall > 0 else 0.0
+        return {"mean_ms": mean, "jitter_ms": stddev, "p99_dev_ms": p99, "cpu": cpu}
+
+    def overlay_line(self) -> str:
+        """Linea de resumen para el overlay del profiler"""
+        stats = self.get_stats()
+        return (f"pacing {self.mode}: jitter {stats['jitter_ms']:.2f} ms  "
+                f"p99 dev {stats['p99_dev_ms']:.2f} ms  cpu {self.cpu_usage:.0%}")
+
+    def report(self):
+        """Muestra el resumen de la corrida en consola"""
+        stats = self.get_stats()
+        print(f"Pacing '{self.mode}': intervalo medio {stats['mean_ms']:.2f} ms, "
+              f"jitter {stats['jitter_ms']:.2f} ms, desviacion p99 {stats['p99_dev_ms']:.2f} ms, "
+              f"CPU {stats['cpu']:.0%}")
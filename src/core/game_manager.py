@@ -1,23 +1,55 @@
 import pygame
 import sys
+import time
 from src.Constantes import *
 from src.core.resource_manager import ResourceManager
-from src.core.scene_manager import SceneManager
+from src.core.scene_manager import SceneManager, scene_class_names
+from src.core.profiler import frame_profiler
+from src.core.logger import game_log
+from src.core.frame_pacer import FramePacer
+from src.core.asset_loader import draw_loading_screen
+from src.core.sound_cache import sound_cache
 from src.screens.menu_screen import MenuScreen
 
+# Eventos tras los cuales la ventana puede haber perdido su contenido
+WINDOW_REDRAW_EVENTS = (
+    pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN,
+    pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED, pygame.WINDOWSIZECHANGED,
+)
+
+# Eventos que ocultan o vuelven a mostrar la ventana
+WINDOW_HIDE_EVENTS = (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN)
+WINDOW_SHOW_EVENTS = (pygame.WINDOWSHOWN, pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED)
+
 class GameManager:
     """Gestor principal del juego se encarga de inicializar,
     cargar recursos, manejar escenas y controlar el bucle.
     """
-    def __init__(self):
-        # Configurar pantalla
-        self.screen = pygame.display.set_mode((ANCHO_PANTALLA, ALTO_PANTALLA))
+    def __init__(self, pacing_mode: str = FRAME_PACING_MODE):
+        # Configurar pantalla (el pacer decide si se pide vsync)
+        self.pacer = FramePacer(pacing_mode)
+        self.screen = self.pacer.create_display((ANCHO_PANTALLA, ALTO_PANTALLA))
         pygame.display.set_caption("Go UAIBOT")
-        self.clock = pygame.time.Clock()
+        frame_profiler.add_stats_provider(self.pacer.overlay_line)
+        
+        # Simulacion a paso fijo y renderizado con limite propio
+        self.tick_rate = SIMULATION_TICK_RATE
+        self.render_fps = FPS
+        
+        # Fuerza subir la pantalla completa en el proximo frame (ventana expuesta, overlay)
+        self.force_full_redraw = True
+        
+        # Estado de la ventana: en segundo plano se baja el ritmo y se pausa el audio
+        self.window_focused = True
+        self.window_hidden = False
+        self._audio_paused = False
         
         # Inicializar gestores
         self.resource_manager = ResourceManager()
+        frame_profiler.add_stats_provider(self.resource_manager.scaled_cache_line)
+        frame_profiler.add_stats_provider(self.resource_manager.text_cache_line)
         self.scene_manager = SceneManager(self.screen, self.resource_manager)
+        frame_profiler.add_stats_provider(self._memory_overlay_line)
         self.scene_manager.game_manager = self  # Pasa la  referencia al game_manager
         # Cargar recursos iniciales
         self._load_initial_resources()
@@ -37,105 +69,208 @@ class GameManager:
         self.resource_manager.set_sound_volume(0.7)
         
     def _load_initial_resources(self):
-        """Carga los recursos iniciales del juego"""
-        # imagenes estaticas
-        self.resource_manager.load_image("menu_background1","Assets/Imagenes/menubackground1.png")
-        self.resource_manager.load_image("menu_background2","Assets/Imagenes/menubackground2.png")
-        
-        self.resource_manager.load_image("bg_sky", "Assets/Imagenes/Background/bg_sky.png")
-        self.resource_manager.load_image("bg_mid", "Assets/Imagenes/Background/bg_mid.png")
-        self.resource_manager.load_image("bg_front", "Assets/Imagenes/Background/bg_front1.png")
-        self.resource_manager.load_image("bg_front2", "Assets/Imagenes/Background/bg_front2.png")
-        
-        self.resource_manager.load_image("bg_sky_night", "Assets/Imagenes/Background/background_back_night.png")
-        self.resource_manager.load_image("bg_mid_night", "Assets/Imagenes/Background/background_mid_night.png")
-        self.resource_manager.load_image("bg_front_night", "Assets/Imagenes/Background/background_front_night.png")
-        self.resource_manager.load_image("bg_front_night_2", "Assets/Imagenes/Background/backgorund_front_nigth_2.png")
-        
-        
-        self.resource_manager.load_image("pila", "Assets/Imagenes/bateria.png")
-        self.resource_manager.load_image("escudo", "Assets/Imagenes/escudo.png")
-        self.resource_manager.load_image("cartel", "Assets/Imagenes/Background/billboard.png")
-        self.resource_manager.load_image("cartel_uaibot", "Assets/Imagenes/cartel_uaibot.png")
-        self.resource_manager.load_image("cartel_uaibotina", "Assets/Imagenes/cartel_uaibotina.png")
-        self.resource_manager.load_image("cartel_uaibota", "Assets/Imagenes/cartel_uaibota.png")
-        self.resource_manager.load_image("cartel_uaibotino", "Assets/Imagenes/cartel_uaibotino.png")
-
-
-        #AVION PUBLICITARIO
-        self.resource_manager.load_spritesheet("avion", "Assets/Sprites/avion_publicidad.png", 384, 256)
-        
-        # PERSONAJES 
-        # UIAbot: tiene spritesheet con animacion
-        self.resource_manager.load_spritesheet("UIAbot_walk", "Assets/Sprites/uiabot2.png", 64, 86)
-        self.resource_manager.load_spritesheet("UAIBOTA_walk", "Assets/Sprites/Uiabota.png", 64, 86)
-        self.resource_manager.load_spritesheet("UAIBOTINA_walk", "Assets/Sprites/Uiabotina.png", 64, 86)
-        self.resource_manager.load_spritesheet("UAIBOTINO_walk", "Assets/Sprites/Uibotino.png", 64, 86)
-        
-        
-        #MISIONES
-        
-        #NPCS
-        self.resource_manager.load_spritesheet("character_a", "Assets/Sprites/Misiones/Uiabot_talk.png",450, 780)      
-        self.resource_manager.load_spritesheet("character_b", "Assets/Sprites/Misiones/npc_1.png",450, 780)      
-        
-        self.resource_manager.load_spritesheet("character_c", "Assets/Sprites/Misiones/npc_2.png",450, 780)
-        self.resource_manager.load_spritesheet("character_d", "Assets/Sprites/Misiones/npc_3.png",450, 780)
-        self.resource_manager.load_spritesheet("character_e", "Assets/Sprites/Misiones/npc_4.png",450, 780)
-        
-        #FONDOS DE MISIONES
-        self.resource_manager.load_image("level1_bg", "Assets/Imagenes/Background/fondo_mision_1.png")
-        self.resource_manager.load_image("level2_bg", "Assets/Imagenes/Background/fondo_mision_2.png")
-        self.resource_manager.load_image("level3_bg", "Assets/Imagenes/Background/fondo_mision_3.png")
-        self.resource_manager.load_image("level4_bg", "Assets/Imagenes/Background/fondo_mision_4.png")
-        # spritesheets de autos
-        self.resource_manager.load_spritesheet("Auto_azul", "Assets/Sprites/Autos/Auto-azul.png", 126, 86)
-        self.resource_manager.load_spritesheet("Auto_rojo", "Assets/Sprites/Autos/Auto-rojo.png", 126, 86)
-        
-        # sonidos
-        self.resource_manager.load_sound("boton_hover", "Assets/Music/mixkit-arcade-game-jump-coin-216.mp3")
-        self.resource_manager.load_sound("salto", "Assets/Music/Jump.mp3")
-        self.resource_manager.load_sound("dash", "Assets/Music/dash.mp3")
-        self.resource_manager.load_sound("game_over", "Assets/Music/Game-over.mp3")
-        self.resource_manager.load_sound("victoria", "Assets/Music/Win.mp3")
-        self.resource_manager.load_sound("cambio_personaje", "Assets/Music/cambio_personaje.mp3")
-        self.resource_manager.load_sound("reiniciar", "Assets/Music/reiniciar.mp3")
-        
-        # musica
-        self.resource_manager.load_music("menu", "Assets/Music/Music-menu.mp3")
-        self.resource_manager.load_music("game_music", "Assets/Music/Game-music.mp3")
-        self.resource_manager.load_music("level_music", "Assets/Music/Mission_music.mp3")
+        """
+        Registra el catalogo de recursos (Assets/manifest.json) y carga los persistentes
+        (decodificados en paralelo). El resto lo carga el SceneManager cuando una escena lo pide.
+        """
+        self.resource_manager.load_manifest(scene_names=scene_class_names())
+        self.resource_manager.load_persistent(self._draw_loading_progress)
+        sound_cache.report()
+        
         # Debug: mostrar cantidad de recursos cargados
         info = self.resource_manager.get_resource_info()
-        print(f"Recursos cargados: {info}")
+        game_log.channel("recursos").info("Recursos cargados: %s", info)
+    
+    def _memory_overlay_line(self) -> str:
+        """Memoria de recursos (incluye los caches de la escena actual) para el overlay"""
+        return self.resource_manager.memory_line(self.scene_manager.get_memory_caches())
+    
+    def _draw_loading_progress(self, loaded: int, total: int):
+        """Muestra el avance de la carga para que la ventana no parezca congelada"""
+        draw_loading_screen(self.screen, self.resource_manager.get_font('subtitulo'), loaded, total)
     
     def handle_events(self):
         """Maneja los eventos globales del juego"""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                # Overlay de tiempos por subsistema
+                frame_profiler.toggle()
+                self.force_full_redraw = True
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                # Memoria por categoria y por escena en el log
+                self.scene_manager.log_memory_report()
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                self._set_window_state(focused=False)
+            elif event.type == pygame.WINDOWFOCUSGAINED:
+                self._set_window_state(focused=True)
+            elif event.type in WINDOW_HIDE_EVENTS:
+                self._set_window_state(hidden=True)
+            elif event.type in WINDOW_REDRAW_EVENTS:
+                # El sistema pudo haber borrado la ventana: no alcanza con las regiones sucias
+                self.force_full_redraw = True
+                if event.type in WINDOW_SHOW_EVENTS:
+                    self._set_window_state(hidden=False)
             else:
                 # Pasar todos los eventos a la escena actual
                 self.scene_manager.handle_event(event)
 
+    def _set_window_state(self, focused: bool = None, hidden: bool = None):
+        """Registra cambios de foco/visibilidad y pausa la escena y el audio al pasar a segundo plano"""
+        was_background = self.window_hidden or not self.window_focused
+        if focused is not None:
+            self.window_focused = focused
+        if hidden is not None:
+            self.window_hidden = hidden
+        in_background = self.window_hidden or not self.window_focused
+        
+        if in_background and not was_background:
+            self.scene_manager.on_focus_lost()
+        
+        if PAUSE_AUDIO_IN_BACKGROUND:
+            if in_background and not self._audio_paused:
+                self.resource_manager.pause_all_audio()
+                self._audio_paused = True
+            elif not in_background and self._audio_paused:
+                self.resource_manager.resume_all_audio()
+                self._audio_paused = False
+    
+    def _get_frame_cap(self) -> int:
+        """Limite de frames para este frame segun la escena y el estado de la ventana"""
+        if self.window_hidden:
+            return HIDDEN_TICK_RATE
+        caps = [self.render_fps, self.scene_manager.get_fps_cap()]
+        if not self.window_focused:
+            caps.append(UNFOCUSED_FPS_CAP)
+        caps = [cap for cap in caps if cap]  # 0 / None = sin limite
+        return min(caps) if caps else 0
+    
     def update(self, dt):
         """Actualiza la logica del juego"""
         self.scene_manager.update(dt)
     
-    def draw(self):
-        """Dibuja todo en pantalla"""
-        self.screen.fill(COLOR_FONDO_BASE)
-        self.scene_manager.draw()
-        pygame.display.flip()
+    def draw(self, interpolation: float = 1.0):
+        """Dibuja todo en pantalla (o solo las regiones que cambiaron si la escena lo soporta)"""
+        dirty_rects = self.scene_manager.collect_dirty_rects()
+        # El overlay del profiler cambia cada frame: con el activo siempre se sube todo
+        if self.force_full_redraw or frame_profiler.enabled:
+            dirty_rects = None
+            self.force_full_redraw = False
+        if dirty_rects is not None and not dirty_rects:
+            return  # Nada cambio: ni se dibuja ni se sube la pantalla
+        
+        with frame_profiler.section("draw"):
+            if dirty_rects is not None:
+                # Lo que quede fuera de las regiones sucias no se toca
+                self.screen.set_clip(dirty_rects[0].unionall(dirty_rects[1:]))
+            self.screen.fill(COLOR_FONDO_BASE)
+            self.scene_manager.draw(interpolation)
+            self.screen.set_clip(None)
+        frame_profiler.draw_overlay(self.screen)
+        with frame_profiler.section("flip"):
+            if dirty_rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty_rects)
+        self.pacer.frame_presented()
+    
+    def set_tick_rate(self, tick_rate: int):
+        """Cambia la cantidad de ticks de simulacion por segundo"""
+        self.tick_rate = max(1, int(tick_rate))
+    
+    def set_render_fps(self, render_fps: int):
+        """Cambia el limite de frames de renderizado (0 = sin limite)"""
+        self.render_fps = max(0, int(render_fps))
     
     def run(self):
-        """Bucle principal del juego"""
+        """Bucle principal: simulacion a paso fijo con renderizado interpolado"""
+        accumulator = 0.0
+        self.pacer.reset_stats()
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0  # Delta time en segundos
+            frame_time = self.pacer.wait(self._get_frame_cap())  # Tiempo real del frame en segundos
+            fixed_dt = 1.0 / self.tick_rate
             
-            self.handle_events()
-            self.update(dt)
-            self.draw()
+            if self.window_hidden:
+                # Minimizada: un solo tick por vuelta (HIDDEN_TICK_RATE por segundo)
+                accumulator = fixed_dt
+            else:
+                # Si el render se trabo, no intentar simular todo el tiempo perdido
+                accumulator += min(frame_time, MAX_FRAME_TIME)
+            frame_profiler.begin_frame()
+            
+            with frame_profiler.section("eventos"):
+                self.handle_events()
+            
+            # Avanzar la simulacion en pasos fijos (puede ser 0, 1 o varios por frame)
+            with frame_profiler.section("update"):
+                while accumulator >= fixed_dt and self.running:
+                    self.update(fixed_dt)
+                    accumulator -= fixed_dt
+            
+            # Dibujar interpolando entre el tick anterior y el actual (nada si no se ve)
+            if not self.window_hidden:
+                self.draw(accumulator / fixed_dt)
+            frame_profiler.end_frame()
         
+        self.pacer.report()
         # Limpiar recursos al salir
-        self.resource_manager.cleanup()
\ No newline at end of file
+        self.resource_manager.cleanup()
+    
+    def run_headless(self, frames: int = None, seconds: float = None, before_update=None) -> dict:
+        """
+        Corre el juego sin esperas de reloj: un tick fijo y un draw por frame,
+        lo mas rapido posible. Pensado para benchmarks con los drivers dummy de SDL.
+        
+        Args:
+            frames: Cantidad de frames a simular
+            seconds: Segundos simulados (se usa si no se indica frames)
+            before_update: Funcion opcional que recibe la escena actual antes de cada tick
+                (los benchmarks la usan para forzar estados como escudo o dash)
+            
+        Returns:
+            Diccionario con tiempos de update/draw y los tiempos de cada frame en ms
+        """
+        fixed_dt = 1.0 / self.tick_rate
+        if frames is None:
+            if seconds is None:
+                seconds = HEADLESS_DEFAULT_SECONDS
+            frames = int(round(seconds * self.tick_rate))
+        
+        frame_times_ms = []
+        update_total = 0.0
+        draw_total = 0.0
+        start = time.perf_counter()
+        
+        for _ in range(frames):
+            if not self.running:
+                break
+            frame_start = time.perf_counter()
+            frame_profiler.begin_frame()
+            
+            with frame_profiler.section("eventos"):
+                self.handle_events()
+            if before_update is not None and self.scene_manager.current_scene:
+                before_update(self.scene_manager.current_scene)
+            with frame_profiler.section("update"):
+                self.update(fixed_dt)
+            update_end = time.perf_counter()
+            self.draw()
+            frame_profiler.end_frame()
+            
+            frame_end = time.perf_counter()
+            update_total += update_end - frame_start
+            draw_total += frame_end - update_end
+            frame_times_ms.append((frame_end - frame_start) * 1000.0)
+        
+        wall_seconds = time.perf_counter() - start
+        frames_run = len(frame_times_ms)
+        return {
+            "frames": frames_run,
+            "simulated_seconds": frames_run * fixed_dt,
+            "wall_seconds": wall_seconds,
+            "fps": frames_run / wall_seconds if wall_seconds > 0 else 0.0,
+            "avg_update_ms": update_total * 1000.0 / max(1, frames_run),
+            "avg_draw_ms": draw_total * 1000.0 / max(1, frames_run),
+            "frame_times_ms": frame_times_ms,
+        }
\ No newline at end of file
@@ -0,0 +1,60 @@
+import math
+from typing import Tuple
+import pygame
+from src.Constantes import *
+
+# Las velocidades de autos, jugador y coleccionables estan en pixeles por tick
+# de referencia (1 / SIMULATION_TICK_RATE). Estas funciones las pasan a cualquier
+# dt para que el juego se mueva igual con otra cantidad de ticks por segundo.
+
+
+def tick_scale(delta_time: float) -> float:
+    """Cuantos ticks de referencia hay en delta_time (1.0 a SIMULATION_TICK_RATE)"""
+    return delta_time * SIMULATION_TICK_RATE
+
+
+def substeps(delta_time: float) -> Tuple[int, float]:
+    """
+    Divide un tick largo en pasos de a lo sumo un tick de referencia
+
+    Returns:
+        (cantidad de pasos, dt de cada paso); (1, delta_time) si no hace falta
+        o si KINEMATICS_SUBSTEPS esta desactivado
+    """
+    if not KINEMATICS_SUBSTEPS:
+        return 1, delta_time
+    # El margen evita un paso extra por error de redondeo (0.01 * 100 = 1.0000000002)
+    count = min(KINEMATICS_MAX_SUBSTEPS, max(1, math.ceil(tick_scale(delta_time) - 1e-6)))
+    return count, delta_time / count
+
+
+def _axis_interval(a_min: float, a_max: float, b_min: float, b_max: float, d: float) -> Tuple[float, float]:
+    """Intervalo de t en el que [a_min, a_max] + t*d se superpone con [b_min, b_max]"""
+    if d == 0:
+        if a_max > b_min and a_min < b_max:
+            return -math.inf, math.inf
+        return math.inf, -math.inf
+    t1 = (b_min - a_max) / d
+    t2 = (b_max - a_min) / d
+    return (t1, t2) if t1 < t2 else (t2, t1)
+
+
+def swept_collide(a_prev: pygame.Rect, a_now: pygame.Rect,
+                  b_prev: pygame.Rect, b_now: pygame.Rect) -> bool:
+    """
+    Indica si dos rects se tocaron en algun momento del tick, suponiendo que
+    ambos se movieron en linea recta de *_prev a *_now. Un auto rapido no
+    puede atravesar al jugador entre dos chequeos aunque el tick sea largo.
+    """
+    if a_now.colliderect(b_now) or a_prev.colliderect(b_prev):
+        return True
+    # Movimiento de a visto desde b (b queda quieto en b_prev)
+    dx = (a_now.x - a_prev.x) - (b_now.x - b_prev.x)
+    dy = (a_now.y - a_prev.y) - (b_now.y - b_prev.y)
+    if dx == 0 and dy == 0:
+        return False
+    x_in, x_out = _axis_interval(a_prev.left, a_prev.right, b_prev.left, b_prev.right, dx)
+    y_in, y_out = _axis_interval(a_prev.top, a_prev.bottom, b_prev.top, b_prev.bottom, dy)
+    t_in = max(x_in, y_in)
+    t_out = min(x_out, y_out)
+    return t_in < t_out and t_in <= 1.0 and t_out >= 0.0
@@ -0,0 +1,152 @@
+import atexit
+import queue
+import sys
+import threading
+from typing import Dict, Optional
+from src.Constantes import *
+
+# Niveles de log (mismos valores que el modulo logging)
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+LEVELS = {"DEBUG": DEBUG, "INFO": INFO, "WARNING": WARNING, "ERROR": ERROR}
+
+
+class LogChannel:
+    """
+    Categoria de log (spawn, audio, ...). Cada metodo compara el nivel con un
+    entero ya calculado: si el mensaje esta deshabilitado no se formatea nada.
+
+    Los mensajes usan formato con % y argumentos aparte, que se formatean
+    en el hilo escritor: pasar valores inmutables (numeros, strings, tuplas).
+    """
+    __slots__ = ("name", "min_level", "_logger")
+
+    def __init__(self, name: str, min_level: int, logger):
+        self.name = name
+        self.min_level = min_level
+        self._logger = logger
+
+    def is_enabled(self, level: int) -> bool:
+        """Indica si se mostrarian mensajes de ese nivel"""
+        return level >= self.min_level
+
+    def debug(self, msg: str, *args):
+        if self.min_level <= DEBUG:
+            self._logger._enqueue(DEBUG, self.name, msg, args)
+
+    def info(self, msg: str, *args):
+        if self.min_level <= INFO:
+            self._logger._enqueue(INFO, self.name, msg, args)
+
+    def warning(self, msg: str, *args):
+        if self.min_level <= WARNING:
+            self._logger._enqueue(WARNING, self.name, msg, args)
+
+    def error(self, msg: str, *args):
+        if self.min_level <= ERROR:
+            self._logger._enqueue(ERROR, self.name, msg, args)
+
+
+class GameLogger:
+    """
+    Logger por niveles y categorias con escritura en un hilo aparte:
+    el bucle del juego solo encola, la consola lenta no frena los frames.
+    """
+
+    def __init__(self, level: str = LOG_LEVEL, enabled: bool = ENABLE_CONSOLE_LOGS,
+                 categories: Optional[Dict[str, bool]] = None):
+        self.level = LEVELS.get(level.upper(), INFO)
+        self.enabled = enabled
+        self.categories: Dict[str, bool] = dict(LOG_CATEGORIES if categories is None else categories)
+        self._channels: Dict[str, LogChannel] = {}
+        self._queue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def channel(self, name: str) -> LogChannel:
+        """Devuelve (creando si hace falta) el canal de una categoria"""
+        channel = self._channels.get(name)
+        if channel is None:
+            channel = LogChannel(name, self._min_level_for(name), self)
+            self._channels[name] = channel
+        return channel
+
+    def configure(self, level: str = None, enabled: bool = None, categories: Dict[str, bool] = None):
+        """Cambia nivel, habilitacion global o categorias y actualiza los canales ya creados"""
+        if level is not None:
+            self.level = LEVELS.get(level.upper(), self.level)
+        if enabled is not None:
+            self.enabled = enabled
+        if categories:
+            self.categories.update(categories)
+        for name, channel in self._channels.items():
+            channel.min_level = self._min_level_for(name)
+
+    def _min_level_for(self, name: str) -> int:
+        """Nivel minimo de una categoria: deshabilitada solo deja pasar advertencias y errores"""
+        if not self.enabled or not self.categories.get(name, True):
+            return max(self.level, WARNING)
+        return self.level
+
+    def _enqueue(self, level: int, category: str, msg: str, args: tuple):
+        """Encola un mensaje (arranca el hilo escritor la primera vez)"""
+        if self._thread is None:
+            self._start_writer()
+        self._queue.put((level, category, msg, args))
+
+    def _start_writer(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._writer_loop, name="game-logger", daemon=True)
+                self._thread.start()
+                atexit.register(self.shutdown)
+
+    def _writer_loop(self):
+        """Hilo escritor: formatea y escribe en consola, vaciando la cola de a tandas"""
+        while True:
+            item = self._queue.get()
+            while True:
+                if item is None:
+                    sys.stdout.flush()
+                    return
+                if isinstance(item, threading.Event):
+                    sys.stdout.flush()
+                    item.set()
+                else:
+                    self._write(*item)
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            sys.stdout.flush()
+
+    def _write(self, level: int, category: str, msg: str, args: tuple):
+        try:
+            text = msg % args if args else msg
+        except (TypeError, ValueError):
+            text = f"{msg} {args}"
+        prefix = "" if level < WARNING else ("ADVERTENCIA " if level == WARNING else "ERROR ")
+        try:
+            sys.stdout.write(f"{prefix}[{category}] {text}\n")
+        except (OSError, ValueError):
+            pass  # Consola cerrada: perder el mensaje antes que romper el hilo
+
+    def flush(self, timeout: float = 1.0):
+        """Espera a que se escriba todo lo encolado hasta ahora"""
+        if self._thread is not None and self._thread.is_alive():
+            done = threading.Event()
+            self._queue.put(done)
+            done.wait(timeout)
+
+    def shutdown(self):
+        """Escribe lo pendiente y termina el hilo escritor"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=1.0)
+
+
+# Instancia global del logger
+game_log = GameLogger()
@@ -0,0 +1,106 @@
+import mmap
+import os
+import struct
+import threading
+from typing import Optional
+import pygame
+from src.Constantes import *
+from src.core.disk_cache import cache_key, hash_file, rewrite_header, write_atomic
+from src.core.logger import game_log
+
+resource_log = game_log.channel("recursos")
+
+# Archivo de cache: cabecera fija + pixeles RGBA crudos (pygame.image.tobytes)
+_MAGIC = b"UPXC"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHIIqq20s")   # magic, version, ancho, alto, mtime_ns, tamaño y sha1 del PNG
+_DATA_OFFSET = 64                        # Pixeles alineados a 64 bytes
+
+
+class PixelCache:
+    """
+    Cache en disco de imagenes ya decodificadas. La primera vez el PNG se
+    decodifica normalmente y se guardan sus pixeles RGBA; las siguientes se
+    mapean a memoria y se arma la superficie con frombuffer, sin pasar por zlib.
+
+    Cada entrada guarda mtime, tamaño y sha1 del archivo original: si cambia
+    el mtime se recalcula el hash y solo se vuelve a decodificar si el
+    contenido es distinto.
+    """
+
+    def __init__(self, directory: str = PIXEL_CACHE_DIR, enabled: bool = PIXEL_CACHE_ENABLED):
+        self.directory = directory
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def load(self, path: str) -> pygame.Surface:
+        """
+        Devuelve la imagen de `path` (sin convert_alpha: eso lo hace el hilo principal)
+
+        Se puede llamar desde los hilos del AssetLoader.
+        """
+        if not self.enabled:
+            return pygame.image.load(path)
+        try:
+            stat = os.stat(path)
+            cache_path = self._cache_path(path)
+            surface = self._read(cache_path, path, stat)
+            if surface is not None:
+                self._count(hit=True)
+                return surface
+        except OSError:
+            return pygame.image.load(path)  # Que el error salga como siempre
+
+        self._count(hit=False)
+        surface = pygame.image.load(path)
+        try:
+            self._write(cache_path, path, stat, surface)
+        except OSError as e:
+            resource_log.warning("No se pudo guardar %s en el cache de pixeles: %s", path, e)
+        return surface
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _cache_path(self, path: str) -> str:
+        return os.path.join(self.directory, cache_key(path) + ".rgba")
+
+    def _read(self, cache_path: str, path: str, stat) -> Optional[pygame.Surface]:
+        """Mapea la entrada del cache si sigue valida (None si no existe o quedo vieja)"""
+        if not os.path.exists(cache_path):
+            return None
+        with open(cache_path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return None
+            magic, version, width, height, mtime_ns, size, digest = _HEADER.unpack(header)
+            if magic != _MAGIC or version != _VERSION or size != stat.st_size:
+                return None
+            if os.fstat(f.fileno()).st_size != _DATA_OFFSET + width * height * 4:
+                return None
+            if mtime_ns != stat.st_mtime_ns:
+                # Archivo tocado: solo es invalido si el contenido cambio
+                if hash_file(path) != digest:
+                    return None
+                rewrite_header(cache_path, _HEADER.pack(magic, version, width, height,
+                                                        stat.st_mtime_ns, size, digest))
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # La superficie referencia al mmap: sigue valido hasta que se libere (tras convert_alpha)
+        return pygame.image.frombuffer(memoryview(mapped)[_DATA_OFFSET:], (width, height), "RGBA")
+
+    def _write(self, cache_path: str, path: str, stat, surface: pygame.Surface):
+        """Guarda los pixeles de forma atomica (archivo temporal + replace)"""
+        width, height = surface.get_size()
+        header = _HEADER.pack(_MAGIC, _VERSION, width, height, stat.st_mtime_ns, stat.st_size,
+                              hash_file(path))
+        write_atomic(cache_path, (header.ljust(_DATA_OFFSET, b"\0"), pygame.image.tobytes(surface, "RGBA")))
+
+
+# Instancia global del cache
+pixel_cache = PixelCache()
@@ -0,0 +1,237 @@
+import time
+from array import array
+from typing import Callable, Dict, List, Optional
+import pygame
+from src.Constantes import *
+
+
+class RingBuffer:
+    """Buffer circular de tamaño fijo con los ultimos tiempos medidos (ms)"""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values = array('d', bytes(8 * size))
+        self.index = 0
+        self.count = 0
+
+    def push(self, value: float):
+        """Agrega un valor pisando el mas viejo si el buffer esta lleno"""
+        self.values[self.index] = value
+        self.index = (self.index + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+
+    def last(self) -> float:
+        """Ultimo valor agregado"""
+        if not self.count:
+            return 0.0
+        return self.values[(self.index - 1) % self.size]
+
+    def ordered(self) -> List[float]:
+        """Valores en orden cronologico (del mas viejo al mas nuevo)"""
+        if self.count < self.size:
+            return self.values[:self.count].tolist()
+        return self.values[self.index:].tolist() + self.values[:self.index].tolist()
+
+    def percentiles(self, *percents: float) -> List[float]:
+        """Calcula percentiles (0..100) sobre los valores guardados"""
+        if not self.count:
+            return [0.0 for _ in percents]
+        data = sorted(self.values[:self.count])
+        last_index = len(data) - 1
+        return [data[int(round(p / 100.0 * last_index))] for p in percents]
+
+    def clear(self):
+        """Vacia el buffer"""
+        self.index = 0
+        self.count = 0
+
+
+class _NullSection:
+    """Seccion vacia que se usa cuando el profiler esta apagado (costo casi nulo)"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _Section:
+    """Mide el tiempo de un bloque y lo acumula en el frame actual"""
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.profiler._depth += 1
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed_ms = (time.perf_counter() - self.start) * 1000.0
+        profiler = self.profiler
+        profiler._depth -= 1
+        profiler._frame_times[self.name] = profiler._frame_times.get(self.name, 0.0) + elapsed_ms
+        return False
+
+
+class FrameProfiler:
+    """Profiler por subsistema con buffers circulares y overlay en pantalla (F3)"""
+
+    def __init__(self, history_size: int = PROFILER_HISTORY_SIZE):
+        self.history_size = history_size
+        self.enabled = False
+
+        # Historial por seccion y orden/profundidad en que aparecen
+        self.buffers: Dict[str, RingBuffer] = {}
+        self.section_order: List[str] = []
+        self.section_depth: Dict[str, int] = {}
+        self.frame_buffer = RingBuffer(history_size)
+
+        # Estado del frame en curso
+        self._sections: Dict[str, _Section] = {}
+        self._frame_times: Dict[str, float] = {}
+        self._frame_start = 0.0
+        self._depth = 0
+
+        # Overlay: se recalcula cada cierta cantidad de frames
+        self._font: Optional[pygame.font.Font] = None
+        self._panel: Optional[pygame.Surface] = None
+        self._text_lines: List[List[pygame.Surface]] = []
+        self._frames_since_refresh = 0
+        
+        # Funciones que devuelven una linea de texto extra para el overlay (pacing, caches...)
+        self.stats_providers: List[Callable[[], str]] = []
+
+    def toggle(self):
+        """Muestra u oculta el overlay (y activa o apaga las mediciones)"""
+        self.enabled = not self.enabled
+        self.reset()
+
+    def add_stats_provider(self, provider: Callable[[], str]):
+        """Agrega una linea de estadisticas al overlay (se recalcula junto con los percentiles)"""
+        if provider not in self.stats_providers:
+            self.stats_providers.append(provider)
+
+    def reset(self):
+        """Descarta todo el historial medido"""
+        for buffer in self.buffers.values():
+            buffer.clear()
+        self.frame_buffer.clear()
+        self._frame_times.clear()
+        self._text_lines = []
+        self._frames_since_refresh = PROFILER_REFRESH_FRAMES
+
+    def section(self, name: str):
+        """Context manager que mide un bloque con el nombre dado"""
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self._sections.get(name)
+        if section is None:
+            section = _Section(self, name)
+            self._sections[name] = section
+            self.buffers[name] = RingBuffer(self.history_size)
+            self.section_order.append(name)
+            self.section_depth[name] = self._depth
+        return section
+
+    def begin_frame(self):
+        """Marca el inicio de un frame"""
+        if self.enabled:
+            self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Cierra el frame y guarda los tiempos acumulados en los buffers"""
+        if not self.enabled:
+            return
+        self.frame_buffer.push((time.perf_counter() - self._frame_start) * 1000.0)
+
+        # Las secciones que no corrieron este frame registran 0 para mantener alineado el historial
+        frame_times = self._frame_times
+        for name, buffer in self.buffers.items():
+            buffer.push(frame_times.get(name, 0.0))
+        frame_times.clear()
+        self._frames_since_refresh += 1
+
+    # ===== OVERLAY =====
+
+    def draw_overlay(self, screen: pygame.Surface):
+        """Dibuja el panel con percentiles y el grafico de tiempos de frame"""
+        if not self.enabled:
+            return
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+
+        if self._frames_since_refresh >= PROFILER_REFRESH_FRAMES:
+            self._refresh_text_lines()
+            self._frames_since_refresh = 0
+
+        line_height = 16
+        graph_height = 60
+        width = 400
+        height = 12 + line_height * len(self._text_lines) + graph_height + 10
+
+        if self._panel is None or self._panel.get_height() != height:
+            self._panel = pygame.Surface((width, height))
+            self._panel.set_alpha(190)
+            self._panel.fill((10, 10, 20))
+        screen.blit(self._panel, (8, 8))
+
+        # Columnas: nombre alineado a la izquierda, numeros alineados a la derecha
+        y = 14
+        for columns in self._text_lines:
+            screen.blit(columns[0], (14, y))
+            for i, surface in enumerate(columns[1:]):
+                right = 240 + i * 52
+                screen.blit(surface, (right - surface.get_width(), y))
+            y += line_height
+
+        self._draw_frame_graph(screen, pygame.Rect(14, y + 4, width - 12, graph_height))
+
+    def _refresh_text_lines(self):
+        """Recalcula percentiles y vuelve a renderizar las filas de texto"""
+        font = self._font
+        header = ["seccion (ms)", "ult", "p50", "p95", "p99"]
+        lines = [[font.render(text, True, COLOR_AMARILLO) for text in header]]
+
+        rows = [("frame", 0, self.frame_buffer)]
+        rows += [(name, self.section_depth[name] + 1, self.buffers[name]) for name in self.section_order]
+        for name, depth, buffer in rows:
+            p50, p95, p99 = buffer.percentiles(50, 95, 99)
+            color = COLOR_ROJO if p95 > PROFILER_FRAME_BUDGET_MS else COLOR_BLANCO
+            columns = ["  " * depth + name] + [f"{value:.2f}" for value in (buffer.last(), p50, p95, p99)]
+            lines.append([font.render(text, True, color) for text in columns])
+        for provider in self.stats_providers:
+            lines.append([font.render(provider(), True, COLOR_AMARILLO)])
+        self._text_lines = lines
+
+    def _draw_frame_graph(self, screen: pygame.Surface, area: pygame.Rect):
+        """Grafico de los ultimos tiempos de frame con la linea de presupuesto"""
+        values = self.frame_buffer.ordered()
+        scale_ms = max(PROFILER_FRAME_BUDGET_MS * 2, max(values) if values else 0.0)
+
+        # Linea de presupuesto (10 ms por defecto)
+        budget_y = area.bottom - int(PROFILER_FRAME_BUDGET_MS / scale_ms * area.height)
+        pygame.draw.line(screen, COLOR_ROJO, (area.left, budget_y), (area.right, budget_y), 1)
+        pygame.draw.rect(screen, (80, 80, 100), area, 1)
+
+        if len(values) < 2:
+            return
+        step = area.width / (self.history_size - 1)
+        points = [
+            (area.left + i * step, area.bottom - min(area.height, v / scale_ms * area.height))
+            for i, v in enumerate(values)
+        ]
+        pygame.draw.lines(screen, COLOR_VERDE, False, points, 1)
+
+
+# Instancia global del profiler
+frame_profiler = FrameProfiler()
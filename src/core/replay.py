@@ -0,0 +1,224 @@
+import json
+import os
+import struct
+from typing import Dict, List, Optional
+import pygame
+
+# Formato del archivo de replay (little endian):
+#   cabecera: magic, version, ticks por segundo, semilla, largo de metadatos
+#   metadatos: JSON utf-8 (escena, modo, personaje, mision, habilidades)
+#   cuerpo: corridas (cantidad de ticks, teclas mantenidas, teclas presionadas)
+_MAGIC = b"UAIR"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBHqH")
+_RUN = struct.Struct("<HBB")
+_MAX_RUN = 0xFFFF
+
+# Teclas que se graban, una por bit. Solo las que leen los handlers de juego
+# (KEYDOWN) y Player.update (teclas mantenidas)
+REPLAY_KEYS = (pygame.K_SPACE, pygame.K_z, pygame.K_c, pygame.K_p, pygame.K_ESCAPE)
+_KEY_BITS = {key: 1 << i for i, key in enumerate(REPLAY_KEYS)}
+
+
+def _keys_in_mask(mask: int) -> List[int]:
+    """Devuelve las teclas cuyos bits estan encendidos en la mascara"""
+    return [key for key, bit in _KEY_BITS.items() if mask & bit]
+
+
+class ReplayKeyState:
+    """Reemplazo de pygame.key.get_pressed() con las teclas de un tick grabado"""
+    __slots__ = ("mask",)
+
+    def __init__(self, mask: int = 0):
+        self.mask = mask
+
+    def __getitem__(self, key: int) -> bool:
+        return bool(self.mask & _KEY_BITS.get(key, 0))
+
+    def __bool__(self) -> bool:
+        # Player.update solo procesa teclas si el estado es "verdadero" (como la tupla de pygame)
+        return True
+
+
+class InputRecorder:
+    """Graba por tick las teclas mantenidas y los KEYDOWN de juego de una partida"""
+
+    def __init__(self, path: str, seed: int, tick_rate: int, meta: Dict):
+        self.path = path
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.meta = meta
+        self.runs: List[List[int]] = []  # [cantidad, mantenidas, presionadas]
+        self.tick_count = 0
+        self._held_mask = 0
+        self._pressed_mask = 0
+
+    @property
+    def finished(self) -> bool:
+        return False
+
+    def accept_keydown(self, event: pygame.event.Event) -> bool:
+        """Registra un KEYDOWN de juego; siempre deja pasar el evento"""
+        self._pressed_mask |= _KEY_BITS.get(event.key, 0)
+        return True
+
+    def begin_tick(self) -> List[int]:
+        """Al grabar no hay eventos que inyectar"""
+        return []
+
+    def get_pressed(self):
+        """Lee el teclado real y guarda las teclas que interesan para este tick"""
+        keys = pygame.key.get_pressed()
+        mask = 0
+        for key, bit in _KEY_BITS.items():
+            if keys[key]:
+                mask |= bit
+        self._held_mask = mask
+        return keys
+
+    def end_tick(self):
+        """Cierra el tick (si no se leyo el teclado se repite el estado anterior)"""
+        held, pressed = self._held_mask, self._pressed_mask
+        self._pressed_mask = 0
+        self.tick_count += 1
+
+        # Codificacion por corridas: ticks iguales consecutivos ocupan 4 bytes
+        last = self.runs[-1] if self.runs else None
+        if last and last[1] == held and last[2] == pressed and last[0] < _MAX_RUN:
+            last[0] += 1
+        else:
+            self.runs.append([1, held, pressed])
+
+    def save(self):
+        """Escribe el archivo de replay"""
+        meta_bytes = json.dumps(self.meta, separators=(",", ":")).encode("utf-8")
+        with open(self.path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, self.tick_rate, self.seed, len(meta_bytes)))
+            f.write(meta_bytes)
+            for count, held, pressed in self.runs:
+                f.write(_RUN.pack(count, held, pressed))
+        print(f"Replay guardado en {self.path}: {self.tick_count} ticks, semilla {self.seed}")
+
+
+class InputReplayer:
+    """Reproduce tick a tick la entrada de un archivo de replay"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            data = f.read()
+
+        magic, version, self.tick_rate, self.seed, meta_len = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path} no es un replay valido (version {version})")
+        offset = _HEADER.size
+        self.meta: Dict = json.loads(data[offset:offset + meta_len].decode("utf-8"))
+        offset += meta_len
+
+        # Expandir las corridas a un byte por tick para acceder en O(1)
+        held_ticks = bytearray()
+        pressed_ticks = bytearray()
+        for count, held, pressed in _RUN.iter_unpack(data[offset:]):
+            held_ticks += bytes((held,)) * count
+            pressed_ticks += bytes((pressed,)) * count
+        self.held_ticks = held_ticks
+        self.pressed_ticks = pressed_ticks
+        self.tick_count = len(held_ticks)
+        self.tick = 0
+        self._key_state = ReplayKeyState()
+
+    @property
+    def finished(self) -> bool:
+        return self.tick >= self.tick_count
+
+    def accept_keydown(self, event: pygame.event.Event) -> bool:
+        """Durante el replay solo se aceptan los eventos inyectados por el replay"""
+        return self.finished or getattr(event, "replayed", False)
+
+    def begin_tick(self) -> List[int]:
+        """Devuelve las teclas que se presionaron en este tick de la grabacion"""
+        if self.finished:
+            return []
+        return _keys_in_mask(self.pressed_ticks[self.tick])
+
+    def get_pressed(self):
+        """Teclas mantenidas en este tick (o el teclado real al terminar el replay)"""
+        if self.finished:
+            return pygame.key.get_pressed()
+        self._key_state.mask = self.held_ticks[self.tick]
+        return self._key_state
+
+    def end_tick(self):
+        """Avanza al siguiente tick de la grabacion"""
+        if self.finished:
+            return
+        self.tick += 1
+        if self.finished:
+            print(f"Replay terminado ({self.tick_count} ticks)")
+
+
+class ReplaySession:
+    """Coordina la grabacion (--record) o reproduccion (--replay) de partidas"""
+
+    def __init__(self):
+        self.mode: Optional[str] = None
+        self.path: Optional[str] = None
+        self.replayer: Optional[InputReplayer] = None
+        self._recorder: Optional[InputRecorder] = None
+        self._replay_used = False
+        self._runs_recorded = 0
+
+    def start_recording(self, path: str):
+        """Graba cada partida que se juegue en path (las siguientes en path-2, path-3...)"""
+        self.mode = "record"
+        self.path = path
+
+    def load_replay(self, path: str) -> InputReplayer:
+        """Carga un replay; la proxima partida que empiece lo va a reproducir"""
+        self.mode = "replay"
+        self.path = path
+        self.replayer = InputReplayer(path)
+        self._replay_used = False
+        return self.replayer
+
+    def begin_run(self, seed: int, tick_rate: int, meta: Dict):
+        """
+        Llamado por las escenas de juego al crear una partida
+
+        Args:
+            seed: Semilla de la partida (rng_service)
+            tick_rate: Ticks de simulacion por segundo
+            meta: Datos necesarios para reconstruir la partida
+
+        Returns:
+            El grabador o reproductor de entrada, o None si no hay replay activo
+        """
+        if self.mode == "record":
+            self.end_run()
+            self._runs_recorded += 1
+            path = self.path
+            if self._runs_recorded > 1:
+                root, ext = os.path.splitext(self.path)
+                path = f"{root}-{self._runs_recorded}{ext}"
+            self._recorder = InputRecorder(path, seed, tick_rate, meta)
+            return self._recorder
+
+        if self.mode == "replay" and not self._replay_used:
+            self._replay_used = True
+            if seed != self.replayer.seed:
+                print(f"Advertencia: la semilla {seed} no coincide con la del replay ({self.replayer.seed})")
+            return self.replayer
+        return None
+
+    def end_run(self):
+        """Guarda la grabacion en curso (si hay una)"""
+        if self._recorder is not None:
+            try:
+                self._recorder.save()
+            except OSError as e:
+                print(f"Error guardando replay: {e}")
+            self._recorder = None
+
+
+# Instancia global de la sesion de replay
+replay_session = ReplaySession()
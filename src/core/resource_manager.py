@@ -1,33 +1,99 @@
 import pygame
+import io
 import os
-from typing import Dict, Optional
+import sys
+from collections import OrderedDict
+from typing import Callable, Collection, Dict, Iterable, List, Optional, Set, Tuple
+from src.Constantes import *
+from src.core.logger import game_log
+from src.core.asset_loader import AssetLoader
+from src.core.asset_manifest import AssetIndex, AssetManifest
+from src.core.pixel_cache import pixel_cache
+from src.core.sound_cache import sound_cache
+from src.core.texture_atlas import AtlasRegion, TextureAtlas
+
+resource_log = game_log.channel("recursos")
+audio_log = game_log.channel("audio")
+
+# Referencias de una copia escalada que solo guarda el cache: el diccionario,
+# la variable que la recorre y el argumento de sys.getrefcount
+_CACHE_ONLY_REFS = 3
 
 class SpriteSheet:
-    """Maneja una hoja de sprites: calcula columnas/filas y recorta frames."""
+    """
+    Maneja una hoja de sprites: calcula columnas/filas y recorta todos los
+    frames una sola vez al cargarla (get_frame y compania no crean superficies).
+    """
     def __init__(self, surface, frame_width, frame_height):
         self.sheet = surface
         self.frame_width = frame_width
         self.frame_height = frame_height
         self.columns = self.sheet.get_width() // frame_width
         self.rows = self.sheet.get_height() // frame_height
+        # Tabla inmutable [fila][columna] de subsuperficies
+        self.frames = self._slice(self.sheet)
+        # Versiones escaladas/espejadas: (tamaño, espejo_x, espejo_y, suavizado) -> tabla
+        self._variants: Dict[Tuple, Tuple[Tuple[pygame.Surface, ...], ...]] = {}
+
+    def _slice(self, surface) -> Tuple[Tuple[pygame.Surface, ...], ...]:
+        width, height = self.frame_width, self.frame_height
+        return tuple(
+            tuple(surface.subsurface((col * width, row * height, width, height)) for col in range(self.columns))
+            for row in range(self.rows))
 
     def get_frame(self, col, row):
         """Devuelve un frame por (col, row)."""
-        x = col * self.frame_width
-        y = row * self.frame_height
-        return self.sheet.subsurface((x, y, self.frame_width, self.frame_height))
+        return self.frames[row][col]
 
     def get_row(self, row):
         """Devuelve todos los frames de una fila (para animaciones simples)."""
-        return [self.get_frame(col, row) for col in range(self.columns)]
+        return self.frames[row]
     
     def get_animation_frames(self, start_col, end_col, row):
         """Devuelve un rango de frames (col inicial→final) de una fila."""
-        frames = []
-        for col in range(start_col, end_col + 1):
-            if col < self.columns:
-                frames.append(self.get_frame(col, row))
-        return frames
+        return self.frames[row][start_col:end_col + 1]
+
+    def get_variant(self, size: Optional[Tuple[int, int]] = None, flip_x: bool = False, flip_y: bool = False,
+                    smooth: bool = False) -> Tuple[Tuple[pygame.Surface, ...], ...]:
+        """
+        Tabla de frames escalados a `size` y/o espejados; se calcula la primera vez y queda guardada
+        
+        Args:
+            size: Tamaño de cada frame (None = el original)
+            flip_x: Espejar horizontalmente (por ejemplo para mirar a la izquierda)
+            flip_y: Espejar verticalmente
+            smooth: Escalar con smoothscale
+        """
+        if size is not None and tuple(size) == (self.frame_width, self.frame_height):
+            size = None
+        if size is None and not flip_x and not flip_y:
+            return self.frames
+        key = (None if size is None else tuple(size), flip_x, flip_y, smooth)
+        variant = self._variants.get(key)
+        if variant is None:
+            variant = tuple(tuple(self._transform(frame, key) for frame in row) for row in self.frames)
+            self._variants[key] = variant
+        return variant
+
+    @staticmethod
+    def _transform(frame: pygame.Surface, key: Tuple) -> pygame.Surface:
+        size, flip_x, flip_y, smooth = key
+        if size is not None:
+            try:
+                frame = pygame.transform.smoothscale(frame, size) if smooth else pygame.transform.scale(frame, size)
+            except ValueError:
+                frame = pygame.transform.scale(frame, size)  # smoothscale solo acepta 24/32 bits
+        if flip_x or flip_y:
+            frame = pygame.transform.flip(frame, flip_x, flip_y)
+        return frame
+
+    def get_surfaces(self) -> List[pygame.Surface]:
+        """Superficies con pixeles propios: la hoja y los frames de cada variante (para medir memoria)."""
+        surfaces = [self.sheet]
+        for variant in self._variants.values():
+            for row in variant:
+                surfaces.extend(row)
+        return surfaces
 
 
 class ResourceManager:
@@ -50,72 +116,192 @@ class ResourceManager:
         self.sound_volume = 0.7
         self.sound_enabled = True
         
+        # Catalogo de recursos: se cargan cuando una escena los pide y se liberan
+        # cuando ninguna los usa (los persistentes quedan cargados siempre)
+        self.catalog: Dict[str, Tuple] = {}
+        self.persistent: Set[str] = set()
+        self.ref_counts: Dict[str, int] = {}
+        self.owners: Dict[str, Set[str]] = {}   # Escenas que tienen tomado cada recurso (reporte de memoria)
+        self._unused: "OrderedDict[str, None]" = OrderedDict()  # Cargados sin referencias (LRU)
+        
+        # Manifiesto (Assets/manifest.json): indice de archivos y datos declarados por recurso
+        self.asset_index: Optional[AssetIndex] = None
+        self.scene_assets: Dict[str, Tuple[str, ...]] = {}   # Escena -> recursos que siempre carga
+        self.expected_frames: Dict[str, int] = {}           # Hoja -> cantidad de frames declarada
+        self.missing_assets: Set[str] = set()                # Ya informados al validar el manifiesto
+        
+        # Atlas de los sprites de la partida: se rearma cuando cambian las superficies de origen
+        self.atlas: Optional[TextureAtlas] = None
+        self._atlas_sources: Tuple[pygame.Surface, ...] = ()
+        
+        # Copias escaladas: (nombre, ancho, alto, suavizado) -> superficie, en orden LRU
+        self.scaled_cache: "OrderedDict[Tuple[str, int, int, bool], pygame.Surface]" = OrderedDict()
+        self.scaled_cache_bytes = 0
+        self.scaled_hits = 0
+        self.scaled_misses = 0
+        
+        # Fuentes por (archivo, tamaño) leyendo cada TTF una sola vez, y textos ya renderizados:
+        # (fuente, texto, color, antialias, fondo) -> superficie, en orden LRU
+        self._font_files: Dict[str, bytes] = {}
+        self._sized_fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self.text_cache: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self.text_cache_bytes = 0
+        self.text_hits = 0
+        self.text_misses = 0
+        
         # Fuentes por defecto .
         self._load_default_fonts()
     
     def _load_default_fonts(self):
-        """Fuentes base para titulos, botones, HUD, etc."""
-        self.fonts['titulo'] = pygame.font.Font("Assets/Fuentes/C&C Red Alert [INET].ttf", 90)
-        self.fonts['subtitulo'] = pygame.font.Font("Assets/Fuentes/C&C Red Alert [INET].ttf", 40)
-        self.fonts['boton'] = pygame.font.Font("Assets/Fuentes/C&C Red Alert [INET].ttf", 55)
-        self.fonts['pequeña'] = pygame.font.Font("Assets/Fuentes/C&C Red Alert [INET].ttf", 32)
-        self.fonts['hud'] = pygame.font.Font("Assets/Fuentes/C&C Red Alert [INET].ttf", 32)
-        self.fonts['instrucciones'] = pygame.font.Font("Assets/Fuentes/C&C Red Alert [INET].ttf", 36)
+        """Fuentes base para titulos, botones, HUD, etc. (ver FUENTES en Constantes)"""
+        for name, (path, size) in FUENTES.items():
+            self.load_font(name, path, size)
 
     # ===== IMaGENES =====
     def load_image(self, name: str, path: str, convert_alpha: bool = True) -> bool:
         try:
-            if os.path.exists(path):
-                image = pygame.image.load(path)
-                if convert_alpha:
-                    image = image.convert_alpha()
-                else:
-                    image = image.convert()
-                self.images[name] = image
-                return True
+            resolved = self.resolve_path(path)
+            if resolved:
+                return self.add_image(name, pixel_cache.load(resolved), convert_alpha)
             else:
-                print(f"Advertencia: No se encontro la imagen en {path}")
+                self._report_missing(name, "No se encontro la imagen en %s", path)
                 return False
         except Exception as e:
-            print(f"Error cargando imagen {path}: {e}")
+            resource_log.error("Error cargando imagen %s: %s", path, e)
             return False
     
+    def add_image(self, name: str, image: pygame.Surface, convert_alpha: bool = True) -> bool:
+        """Registra una imagen ya decodificada (la convierte al formato de la pantalla)."""
+        self.images[name] = image.convert_alpha() if convert_alpha else image.convert()
+        self._drop_scaled(name)
+        return True
+    
     def get_image(self, name: str) -> Optional[pygame.Surface]:
         """Obtiene una imagen por nombre (o none si no existe)."""
-        return self.images.get(name)
+        image = self.images.get(name)
+        if image is None and name in self.catalog:
+            self._load_undeclared(name)
+            image = self.images.get(name)
+        return image
     
-    def get_scaled_image(self, name: str, size: tuple) -> Optional[pygame.Surface]:
-        """Devuelve una copia escalada si la imagen existe."""
+    def get_scaled_image(self, name: str, size: tuple, smooth: bool = False) -> Optional[pygame.Surface]:
+        """
+        Devuelve la imagen escalada a `size` (None si no existe)
+        
+        La copia queda en un cache LRU limitado a SCALED_CACHE_BUDGET_MB: pedir el
+        mismo tamaño otra vez es una busqueda en el diccionario. La superficie es
+        compartida: no modificarla (fill, etc.). Para dibujarla con otra opacidad,
+        guardar get_alpha() y volver a ese valor despues del blit; set_alpha(None)
+        no la restaura (en una superficie con alpha por pixel quita la transparencia).
+        
+        Args:
+            name: Nombre de la imagen
+            size: Tamaño final (ancho, alto)
+            smooth: Usar smoothscale en lugar de scale
+        """
+        key = (name, size[0], size[1], smooth)
+        scaled = self.scaled_cache.get(key)
+        if scaled is not None:
+            self.scaled_cache.move_to_end(key)
+            self.scaled_hits += 1
+            return scaled
+        
         image = self.get_image(name)
-        if image:
-            return pygame.transform.scale(image, size)
-        return None
+        if image is None:
+            return None
+        self.scaled_misses += 1
+        scaled = None
+        if smooth:
+            try:
+                scaled = pygame.transform.smoothscale(image, size)
+            except ValueError:
+                pass  # smoothscale solo acepta superficies de 24/32 bits
+        if scaled is None:
+            scaled = pygame.transform.scale(image, size)
+        
+        self.scaled_cache[key] = scaled
+        self.scaled_cache_bytes += self._surface_bytes(scaled)
+        budget = SCALED_CACHE_BUDGET_MB * 1024 * 1024
+        if self.scaled_cache_bytes > budget:
+            self._evict_unused_scaled(self.scaled_cache_bytes - budget)
+        return scaled
+    
+    def _evict_unused_scaled(self, excess: int) -> int:
+        """
+        Descarta copias escaladas (las menos usadas primero) hasta liberar `excess` bytes
+        
+        Se saltean las que alguien mas guarda (GameRenderer.scaled_backgrounds,
+        LevelScreen._char_frames_cache, la que se acaba de crear): sacarlas del
+        cache no libera memoria y el proximo pedido crearia una segunda copia.
+        
+        Returns:
+            Bytes liberados
+        """
+        freed = 0
+        for key in list(self.scaled_cache):
+            if freed >= excess:
+                break
+            surface = self.scaled_cache[key]
+            if sys.getrefcount(surface) > _CACHE_ONLY_REFS:
+                continue
+            del self.scaled_cache[key]
+            size = self._surface_bytes(surface)
+            self.scaled_cache_bytes -= size
+            freed += size
+        return freed
+    
+    def _drop_scaled(self, name: str):
+        """Olvida las copias escaladas de una imagen (se descargo o se reemplazo)."""
+        for key in [key for key in self.scaled_cache if key[0] == name]:
+            self.scaled_cache_bytes -= self._surface_bytes(self.scaled_cache.pop(key))
+    
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+    
+    def scaled_cache_line(self) -> str:
+        """Linea para el overlay del profiler."""
+        return (f"Escalado: {self.scaled_hits} aciertos / {self.scaled_misses} fallos, "
+                f"{len(self.scaled_cache)} copias ({self.scaled_cache_bytes / (1024 * 1024):.1f} MB)")
 
     # ===== SPRITE SHEETS =====
     def load_spritesheet(self, name: str, path: str, frame_width: int, frame_height: int) -> bool:
         """Carga una hoja de sprites. Si falta, crea placeholder magenta (debug)."""
         try:
-            if os.path.exists(path):
-                image = pygame.image.load(path).convert_alpha()
-                self.sprite_sheets[name] = SpriteSheet(image, frame_width, frame_height)
-                print(f"Sprite sheet '{name}' cargado exitosamente: {self.sprite_sheets[name].columns}x{self.sprite_sheets[name].rows} frames")
-                return True
+            resolved = self.resolve_path(path)
+            if resolved:
+                return self.add_spritesheet(name, pixel_cache.load(resolved), frame_width, frame_height)
             else:
-                print(f"Advertencia: No se encontro el sprite sheet en {path}")
+                self._report_missing(name, "No se encontro el sprite sheet en %s", path)
                 placeholder = pygame.Surface((frame_width, frame_height))
                 placeholder.fill((255, 0, 255))  # magenta = recurso faltante
                 self.sprite_sheets[name] = SpriteSheet(placeholder, frame_width, frame_height)
                 return False
         except Exception as e:
-            print(f"Error cargando sprite sheet {path}: {e}")
+            resource_log.error("Error cargando sprite sheet %s: %s", path, e)
             placeholder = pygame.Surface((frame_width, frame_height))
             placeholder.fill((255, 0, 255))
             self.sprite_sheets[name] = SpriteSheet(placeholder, frame_width, frame_height)
             return False
     
+    def add_spritesheet(self, name: str, image: pygame.Surface, frame_width: int, frame_height: int) -> bool:
+        """Registra una hoja de sprites ya decodificada."""
+        sheet = SpriteSheet(image.convert_alpha(), frame_width, frame_height)
+        self.sprite_sheets[name] = sheet
+        resource_log.debug("Sprite sheet '%s' cargado exitosamente: %dx%d frames", name, sheet.columns, sheet.rows)
+        expected = self.expected_frames.get(name)
+        if expected and sheet.columns * sheet.rows != expected:
+            resource_log.warning("Sprite sheet '%s': el manifiesto declara %d frames y la imagen tiene %d",
+                                 name, expected, sheet.columns * sheet.rows)
+        return True
+    
     def get_spritesheet(self, name: str) -> Optional[SpriteSheet]:
         """Obtiene la hoja de sprites por nombre."""
-        return self.sprite_sheets.get(name)
+        sheet = self.sprite_sheets.get(name)
+        if sheet is None and name in self.catalog:
+            self._load_undeclared(name)
+            sheet = self.sprite_sheets.get(name)
+        return sheet
     
     def get_sprite_frame(self, sheet_name: str, col: int, row: int) -> Optional[pygame.Surface]:
         """Atajo: devuelve un frame de una hoja si existe."""
@@ -124,36 +310,99 @@ class ResourceManager:
             return spritesheet.get_frame(col, row)
         return None
     
-    def get_sprite_row(self, sheet_name: str, row: int) -> list:
+    def get_sprite_row(self, sheet_name: str, row: int) -> tuple:
         """Atajo: devuelve todos los frames de una fila."""
         spritesheet = self.get_spritesheet(sheet_name)
         if spritesheet:
             return spritesheet.get_row(row)
-        return []
+        return ()
     
-    def get_animation_frames(self, sheet_name: str, start_col: int, end_col: int, row: int) -> list:
+    def get_animation_frames(self, sheet_name: str, start_col: int, end_col: int, row: int) -> tuple:
         """Atajo: devuelve un rango de frames para animar."""
         spritesheet = self.get_spritesheet(sheet_name)
         if spritesheet:
             return spritesheet.get_animation_frames(start_col, end_col, row)
-        return []
+        return ()
+
+    # ===== ATLAS =====
+    def get_atlas(self) -> TextureAtlas:
+        """Atlas con los ATLAS_SPRITES cargados (se rearma si alguno se cargo o descargo)."""
+        names, sources = self._atlas_source_surfaces()
+        if self.atlas is None or len(sources) != len(self._atlas_sources) or \
+                any(a is not b for a, b in zip(sources, self._atlas_sources)):
+            self.atlas = self._build_atlas(names)
+            self._atlas_sources = sources
+        return self.atlas
+    
+    def _atlas_source_surfaces(self):
+        names, sources = [], []
+        for name in ATLAS_SPRITES:
+            surface = self.images.get(name)
+            if surface is None and name in self.sprite_sheets:
+                surface = self.sprite_sheets[name].sheet
+            if surface is not None:
+                names.append(name)
+                sources.append(surface)
+        return names, tuple(sources)
+    
+    def _build_atlas(self, names) -> TextureAtlas:
+        atlas = TextureAtlas()
+        for name in names:
+            frame_size = ATLAS_SPRITES[name]
+            sheet = self.sprite_sheets.get(name)
+            if sheet is not None:
+                frames = [((col, row), sheet.get_frame(col, row))
+                          for row in range(sheet.rows) for col in range(sheet.columns)]
+            else:
+                frames = [((0, 0), self.images[name])]
+            for (col, row), frame in frames:
+                if frame_size:
+                    frame = pygame.transform.scale(frame, frame_size)
+                atlas.add_frame((name, col, row), frame)
+        atlas.build()
+        return atlas
+    
+    def get_frame_regions(self, sheet_name: str, start_col: int, end_col: int, row: int) -> list:
+        """Como get_animation_frames pero devuelve regiones del atlas (AtlasRegion)."""
+        spritesheet = self.get_spritesheet(sheet_name)
+        if spritesheet is None:
+            return []
+        if sheet_name not in ATLAS_SPRITES:
+            return [AtlasRegion.from_surface(frame)
+                    for frame in spritesheet.get_animation_frames(start_col, end_col, row)]
+        atlas = self.get_atlas()
+        end_col = min(end_col, spritesheet.columns - 1)
+        return [atlas.get((sheet_name, col, row)) for col in range(start_col, end_col + 1)]
+    
+    def get_image_region(self, name: str) -> Optional[AtlasRegion]:
+        """Region del atlas para una imagen suelta (o la imagen envuelta si no esta en el atlas)."""
+        image = self.get_image(name)
+        if image is None:
+            return None
+        if name not in ATLAS_SPRITES:
+            return AtlasRegion.from_surface(image)
+        return self.get_atlas().get((name, 0, 0))
 
     # ===== SONIDOS  =====
     def load_sound(self, name: str, path: str) -> bool:
         """Carga un efecto de sonido y aplica volumen actual"""
         try:
-            if os.path.exists(path):
-                sound = pygame.mixer.Sound(path)
-                sound.set_volume(self.sound_volume)  # NUEVO: Aplicar volumen
-                self.sounds[name] = sound
-                return True
+            resolved = self.resolve_path(path)
+            if resolved:
+                return self.add_sound(name, sound_cache.load(resolved))
             else:
-                print(f"Advertencia: No se encontro el sonido en {path}")
+                self._report_missing(name, "No se encontro el sonido en %s", path)
                 return False
         except Exception as e:
-            print(f"Error cargando sonido {path}: {e}")
+            resource_log.error("Error cargando sonido %s: %s", path, e)
             return False
         
+    def add_sound(self, name: str, sound: pygame.mixer.Sound) -> bool:
+        """Registra un sonido ya decodificado y le aplica el volumen actual."""
+        sound.set_volume(self.sound_volume)
+        self.sounds[name] = sound
+        return True
+    
     def get_sound(self, name: str) -> Optional[pygame.mixer.Sound]:
         """Obtiene un sonido por nombre (o None)."""
         return self.sounds.get(name)
@@ -162,7 +411,7 @@ class ResourceManager:
         self.sound_volume = max(0.0, min(1.0, volume))
         for sound in self.sounds.values():
             sound.set_volume(self.sound_volume)
-        print(f"Volumen de efectos establecido a: {self.sound_volume:.2f}")    
+        audio_log.debug("Volumen de efectos establecido a: %.2f", self.sound_volume)
     
     def get_sound_volume(self) -> float:
         """Obtiene el volumen actual de efectos"""
@@ -187,29 +436,30 @@ class ResourceManager:
         if not enabled:
             # Detener todos los sonidos
             pygame.mixer.stop()
-        print(f"Efectos de sonido {'activados' if enabled else 'desactivados'}")
+        audio_log.info("Efectos de sonido %s", "activados" if enabled else "desactivados")
 
     # ===== MUSICA =====
     def load_music(self, name: str, path: str) -> bool:
         """Registra la ruta de una pista para reproducirla luego."""
         try:
-            if os.path.exists(path):
-                self.music_tracks[name] = path
+            resolved = self.resolve_path(path)
+            if resolved:
+                self.music_tracks[name] = resolved
                 self.music_loaded = name  # recuerda la ultima
-                print(f"Musica '{name}' registrada: {path}")
+                resource_log.debug("Musica '%s' registrada: %s", name, resolved)
                 return True
             else:
-                print(f"Advertencia: No se encontro la musica en {path}")
+                self._report_missing(name, "No se encontro la musica en %s", path)
                 return False
         except Exception as e:
-            print(f"Error registrando musica {path}: {e}")
+            resource_log.error("Error registrando musica %s: %s", path, e)
             return False
     
     def play_music(self, name: str = None, loops: int = -1, volume: float = None, fade_ms: int = 0):
         """Reproduce una pista por nombre (con loops, volumen y fade opcionales)."""
         # Respeta el switch global de musica.
         if not getattr(self, 'music_enabled', True):
-            print("Musica desactivada - no se reproducira")
+            audio_log.info("Musica desactivada - no se reproducira")
             return False
             
         if volume is None:
@@ -239,21 +489,21 @@ class ResourceManager:
                     pygame.mixer.music.set_volume(self.music_volume)
                     pygame.mixer.music.play(loops)
                     self.current_music_track = name
-                    print(f"Reproduciendo musica: {name} con volumen: {self.music_volume:.2f}")
+                    audio_log.info("Reproduciendo musica: %s con volumen: %.2f", name, self.music_volume)
                     return True
                 else:
                     # Si es la misma pista, solo ajusta el volumen.
                     pygame.mixer.music.set_volume(self.music_volume)
                     return True
             except Exception as e:
-                print(f"Error reproduciendo musica {name}: {e}")
+                audio_log.error("Error reproduciendo musica %s: %s", name, e)
                 return False
         elif name is None and self.music_tracks:
             # Sin nombre: reproduce la primera disponible.
             first_track = list(self.music_tracks.keys())[0]
             return self.play_music(first_track, loops, volume, fade_ms)
         else:
-            print(f"Musica '{name}' no encontrada. Disponibles: {list(self.music_tracks.keys())}")
+            audio_log.warning("Musica '%s' no encontrada. Disponibles: %s", name, tuple(self.music_tracks))
             return False
     
     def switch_music(self, name: str, fade_out_ms: int = 1000, fade_in_ms: int = 1000):
@@ -281,10 +531,23 @@ class ResourceManager:
         """Reanuda la reproduccion si la musica esta habilitada."""
         if getattr(self, 'music_enabled', True):
             pygame.mixer.music.unpause()
-            print("Musica reanudada")
+            audio_log.info("Musica reanudada")
         else:
-            print("Musica desactivada - no se puede reanudar")
-    
+            audio_log.info("Musica desactivada - no se puede reanudar")
+
+    def pause_all_audio(self):
+        """Pausa musica y canales de efectos (ventana en segundo plano)."""
+        if pygame.mixer.get_init():
+            pygame.mixer.pause()
+            pygame.mixer.music.pause()
+
+    def resume_all_audio(self):
+        """Reanuda lo pausado con pause_all_audio respetando la configuracion de musica."""
+        if pygame.mixer.get_init():
+            pygame.mixer.unpause()
+            if getattr(self, 'music_enabled', True):
+                pygame.mixer.music.unpause()
+
     def set_music_volume(self, volume: float):
         """Fija el volumen global de musica (0.0–1.0)."""
         self.music_volume = max(0.0, min(1.0, volume))
@@ -311,37 +574,429 @@ class ResourceManager:
         self.music_enabled = enabled
         if not enabled:
             self.stop_music()
-            print("Musica desactivada globalmente")
+            audio_log.info("Musica desactivada globalmente")
         else:
-            print("Musica activada globalmente")
+            audio_log.info("Musica activada globalmente")
     
     # ===== FUENTES =====
     def get_font(self, name: str) -> Optional[pygame.font.Font]:
         """Obtiene una fuente por nombre (o None)."""
         return self.fonts.get(name)
     
-    def load_font(self, name: str, path: str, size: int) -> bool:
-        """Carga una fuente TTF/OTF; si falta, usa una por defecto del sistema."""
+    def load_font(self, name: str, path: Optional[str], size: int) -> bool:
+        """Registra una fuente TTF/OTF con nombre; si falta, usa una por defecto del sistema."""
         try:
-            if os.path.exists(path):
-                font = pygame.font.Font(path, size)
-                self.fonts[name] = font
+            resolved = self.resolve_path(path) if path else None
+            if resolved or path is None:
+                self.fonts[name] = self.get_sized_font(resolved, size)
                 return True
             else:
-                print(f"Advertencia: No se encontro la fuente en {path}")
-                self.fonts[name] = pygame.font.Font(None, size)
+                resource_log.warning("No se encontro la fuente en %s", path)
+                self.fonts[name] = self.get_sized_font(None, size)
                 return False
         except Exception as e:
-            print(f"Error cargando fuente {path}: {e}")
-            self.fonts[name] = pygame.font.Font(None, size)
+            resource_log.error("Error cargando fuente %s: %s", path, e)
+            self.fonts[name] = self.get_sized_font(None, size)
             return False
     
+    def get_sized_font(self, path: Optional[str], size: int) -> pygame.font.Font:
+        """
+        Fuente de `path` en `size` puntos (None = la de pygame), compartida por (archivo, tamaño)
+        
+        El archivo se lee una sola vez; cada tamaño se arma desde esos bytes en memoria.
+        """
+        key = (path, size)
+        font = self._sized_fonts.get(key)
+        if font is None:
+            if path is None:
+                font = pygame.font.Font(None, size)
+            else:
+                data = self._font_files.get(path)
+                if data is None:
+                    with open(path, "rb") as f:
+                        data = f.read()
+                    self._font_files[path] = data
+                font = pygame.font.Font(io.BytesIO(data), size)
+            self._sized_fonts[key] = font
+        return font
+    
+    def render_text(self, font_key, text: str, color, antialias: bool = True,
+                    background=None) -> Optional[pygame.Surface]:
+        """
+        Texto renderizado desde un cache LRU (limitado a TEXT_CACHE_BUDGET_MB)
+        
+        El mismo texto con la misma fuente y color no vuelve a pasar por FreeType. La
+        superficie es compartida: no modificarla (fill, etc.). Para dibujarla con otra
+        opacidad, guardar get_alpha() y volver a ese valor despues del blit;
+        set_alpha(None) no la restaura (al texto con antialias le quita la transparencia).
+        
+        Args:
+            font_key: Nombre de la fuente registrada o el objeto Font
+            text: Texto a dibujar
+            color: Color del texto
+            antialias: Suavizar bordes
+            background: Color de fondo opcional (None = transparente)
+        
+        Returns:
+            La superficie, o None si la fuente no existe
+        """
+        font = self.fonts.get(font_key) if isinstance(font_key, str) else font_key
+        if font is None:
+            return None
+        key = (font, text, tuple(color), antialias, None if background is None else tuple(background))
+        surface = self.text_cache.get(key)
+        if surface is not None:
+            self.text_cache.move_to_end(key)
+            self.text_hits += 1
+            return surface
+        
+        self.text_misses += 1
+        surface = font.render(text, antialias, color, background)
+        self.text_cache[key] = surface
+        self.text_cache_bytes += self._surface_bytes(surface)
+        budget = TEXT_CACHE_BUDGET_MB * 1024 * 1024
+        while self.text_cache_bytes > budget and len(self.text_cache) > 1:
+            _, evicted = self.text_cache.popitem(last=False)
+            self.text_cache_bytes -= self._surface_bytes(evicted)
+        return surface
+    
+    def text_cache_line(self) -> str:
+        """Linea para el overlay del profiler."""
+        return (f"Texto: {self.text_hits} aciertos / {self.text_misses} fallos, "
+                f"{len(self.text_cache)} superficies ({self.text_cache_bytes / (1024 * 1024):.1f} MB)")
+    
     def create_fallback_image(self, size: tuple, color: tuple) -> pygame.Surface:
         """Crea una imagen solida (placeholder o fondos simples)."""
         surface = pygame.Surface(size)
         surface.fill(color)
         return surface
     
+    # ===== MANIFIESTO Y RUTAS =====
+    def load_manifest(self, path: str = ASSET_MANIFEST, scene_names: Optional[Collection[str]] = None) -> bool:
+        """
+        Indexa la carpeta de recursos, valida el manifiesto en una pasada y registra sus entradas
+        
+        Args:
+            path: Archivo JSON con la lista de recursos
+            scene_names: Escenas que existen, para avisar de nombres desconocidos en "scenes"
+            
+        Returns:
+            False si el manifiesto no se pudo leer
+        """
+        self.asset_index = AssetIndex(ASSET_ROOT)
+        try:
+            manifest = AssetManifest.load(path)
+        except (OSError, ValueError) as e:
+            resource_log.error("No se pudo leer el manifiesto de recursos %s: %s", path, e)
+            return False
+        
+        entries = manifest.validate(self.asset_index, scene_names)
+        manifest.report()
+        scene_assets: Dict[str, List[str]] = {}
+        for entry in entries:
+            name, kind, asset_path = entry["name"], entry["type"], entry["path"]
+            if kind == "image":
+                self.register_image(name, asset_path, entry.get("convert_alpha", True),
+                                    persistent=entry.get("persistent", False))
+            elif kind == "spritesheet":
+                frame_width, frame_height = entry["frame_size"]
+                self.register_spritesheet(name, asset_path, frame_width, frame_height,
+                                          persistent=entry.get("persistent", False))
+                if entry.get("frames"):
+                    self.expected_frames[name] = entry["frames"]
+            elif kind == "sound":
+                self.register_sound(name, asset_path, persistent=entry.get("persistent", True))
+            else:
+                self.register_music(name, asset_path)
+            if entry["missing"]:
+                self.missing_assets.add(name)
+            for scene_name in entry.get("scenes", ()):
+                scene_assets.setdefault(scene_name, []).append(name)
+        self.scene_assets = {scene_name: tuple(names) for scene_name, names in scene_assets.items()}
+        
+        resource_log.info("Manifiesto: %d recursos, %d faltantes (%d archivos indexados en %.1f ms)",
+                          len(entries), len(manifest.missing), len(self.asset_index), self.asset_index.build_ms)
+        return True
+    
+    def get_scene_assets(self, scene_name: str) -> Tuple[str, ...]:
+        """Recursos que el manifiesto asigna a una escena"""
+        return self.scene_assets.get(scene_name, ())
+    
+    def resolve_path(self, path: str) -> Optional[str]:
+        """
+        Ruta real de un archivo o None si no existe. Dentro de la carpeta de recursos
+        se busca en el indice (sin stat y sin distinguir mayusculas).
+        """
+        if self.asset_index is not None:
+            covered, resolved = self.asset_index.lookup(path)
+            if covered:
+                return resolved
+        return path if os.path.exists(path) else None
+    
+    def _report_missing(self, name: str, message: str, path: str):
+        """Avisa de un archivo faltante (salvo que ya figure en el reporte del manifiesto)"""
+        if name in self.missing_assets:
+            resource_log.debug(message, path)
+        else:
+            resource_log.warning(message, path)
+    
+    # ===== CATALOGO Y CARGA POR ESCENA =====
+    def register_image(self, name: str, path: str, convert_alpha: bool = True, persistent: bool = False):
+        """Agrega una imagen al catalogo (no la carga)."""
+        self._register(("image", name, path, convert_alpha), persistent)
+    
+    def register_spritesheet(self, name: str, path: str, frame_width: int, frame_height: int,
+                             persistent: bool = False):
+        """Agrega una hoja de sprites al catalogo (no la carga)."""
+        self._register(("spritesheet", name, path, frame_width, frame_height), persistent)
+    
+    def register_sound(self, name: str, path: str, persistent: bool = True):
+        """Agrega un efecto de sonido al catalogo (por defecto persistente: son chicos)."""
+        self._register(("sound", name, path), persistent)
+    
+    def register_music(self, name: str, path: str):
+        """Agrega una pista al catalogo (solo es una ruta: siempre persistente)."""
+        self._register(("music", name, path), True)
+    
+    def _register(self, job: Tuple, persistent: bool):
+        name = job[1]
+        self.catalog[name] = job
+        if persistent:
+            self.persistent.add(name)
+    
+    def load_job(self, job: Tuple) -> bool:
+        """Carga sincronica de una entrada del catalogo."""
+        kind, name, path = job[0], job[1], job[2]
+        if kind == "image":
+            return self.load_image(name, path, job[3])
+        if kind == "spritesheet":
+            return self.load_spritesheet(name, path, job[3], job[4])
+        if kind == "sound":
+            return self.load_sound(name, path)
+        return self.load_music(name, path)
+    
+    def is_loaded(self, name: str) -> bool:
+        """Indica si un recurso del catalogo esta en memoria."""
+        return (name in self.images or name in self.sprite_sheets
+                or name in self.sounds or name in self.music_tracks)
+    
+    def load_persistent(self, on_progress: Optional[Callable[[int, int], None]] = None):
+        """Carga en paralelo todos los recursos persistentes (al iniciar el juego)."""
+        self._load_missing(self.persistent, on_progress)
+    
+    def acquire(self, names: Iterable[str], on_progress: Optional[Callable[[int, int], None]] = None,
+                owner: Optional[str] = None):
+        """
+        Suma una referencia a cada recurso y carga en paralelo los que falten
+        
+        Args:
+            names: Claves del catalogo que va a usar una escena
+            on_progress: Funcion opcional (cargados, total) para mostrar el avance
+            owner: Nombre de la escena que los pide (para el reporte de memoria)
+        """
+        names = [name for name in names if name in self.catalog]
+        for name in names:
+            self.ref_counts[name] = self.ref_counts.get(name, 0) + 1
+            self._unused.pop(name, None)
+            if owner:
+                self.owners.setdefault(name, set()).add(owner)
+        self._load_missing(names, on_progress)
+        self.enforce_memory_budget()
+    
+    def release(self, names: Iterable[str], owner: Optional[str] = None):
+        """Resta una referencia a cada recurso; los que quedan sin uso pasan al cache limitado por presupuesto."""
+        for name in names:
+            if owner and name in self.owners:
+                self.owners[name].discard(owner)
+                if not self.owners[name]:
+                    del self.owners[name]
+            count = self.ref_counts.get(name, 0) - 1
+            if count > 0:
+                self.ref_counts[name] = count
+                continue
+            self.ref_counts.pop(name, None)
+            if name not in self.persistent and self.is_loaded(name):
+                self._unused[name] = None
+        self._enforce_budget()
+        self.enforce_memory_budget()
+    
+    def _load_missing(self, names: Iterable[str], on_progress=None):
+        loader = AssetLoader(self)
+        for name in names:
+            if not self.is_loaded(name):
+                loader.add_job(self.catalog[name])
+        if len(loader):
+            loader.load_all(on_progress)
+    
+    def _load_undeclared(self, name: str):
+        """Carga sincronica de un recurso que la escena no declaro (queda sin referencias)."""
+        resource_log.debug("Carga tardia de '%s': la escena no lo declaro en sus assets", name)
+        self.load_job(self.catalog[name])
+        if name not in self.persistent and name not in self.ref_counts:
+            self._unused[name] = None
+    
+    def _enforce_budget(self):
+        """Descarga los recursos sin uso mas viejos hasta entrar en ASSET_CACHE_BUDGET_MB."""
+        budget = ASSET_CACHE_BUDGET_MB * 1024 * 1024
+        unused_bytes = sum(self.get_asset_bytes(name) for name in self._unused)
+        while self._unused and unused_bytes > budget:
+            name, _ = self._unused.popitem(last=False)
+            unused_bytes -= self.get_asset_bytes(name)
+            self.unload(name)
+    
+    def unload(self, name: str):
+        """Saca un recurso de memoria (sigue en el catalogo y se puede volver a cargar)."""
+        self.images.pop(name, None)
+        self.sprite_sheets.pop(name, None)
+        self.sounds.pop(name, None)
+        self._unused.pop(name, None)
+        self._drop_scaled(name)
+        resource_log.debug("Recurso '%s' descargado", name)
+    
+    def get_asset_bytes(self, name: str) -> int:
+        """Memoria que ocupa un recurso cargado (pixeles de la superficie o muestras del sonido)."""
+        if name in self.sprite_sheets:
+            return sum(self._surface_bytes(surface) for surface in self.sprite_sheets[name].get_surfaces())
+        surface = self.images.get(name)
+        if surface is not None:
+            return self._surface_bytes(surface)
+        sound = self.sounds.get(name)
+        if sound is not None:
+            return memoryview(sound).nbytes
+        return 0
+    
+    # ===== MEMORIA =====
+    def get_memory_report(self, scene_caches: Optional[Dict[str, Iterable[pygame.Surface]]] = None,
+                          scene_name: Optional[str] = None) -> Dict:
+        """
+        Memoria de superficies y sonidos agrupada por categoria y por escena
+        
+        Args:
+            scene_caches: Superficies que la escena actual guarda por su cuenta
+                (etiqueta -> superficies), ver Scene.get_memory_caches
+            scene_name: Escena a la que se le atribuyen esos caches
+        
+        Returns:
+            {"total": bytes, "categorias": {...}, "escenas": {...}, "recursos": {nombre: bytes}}
+        """
+        categories: Dict[str, int] = {}
+        scenes: Dict[str, int] = {}
+        assets: Dict[str, int] = {}
+        counted: Set[int] = set()  # Superficies ya sumadas (los caches comparten muchas)
+        
+        def add(category: str, owner: str, size: int):
+            categories[category] = categories.get(category, 0) + size
+            scenes[owner] = scenes.get(owner, 0) + size
+        
+        for name, size in self._asset_sizes(counted):
+            assets[name] = size
+            add(self._memory_category(name), self._memory_owner(name), size)
+        
+        surfaces = {"atlas": self.atlas.pages if self.atlas else [],
+                    "copias escaladas": list(self.scaled_cache.values()),
+                    "textos": list(self.text_cache.values())}
+        for label, items in (scene_caches or {}).items():
+            surfaces[label] = items
+        for label, items in surfaces.items():
+            owner = "compartido" if label in ("atlas", "copias escaladas", "textos") else (scene_name or "escena")
+            add(label, owner, self._new_surface_bytes(items, counted))
+        
+        return {"total": sum(categories.values()), "categorias": categories,
+                "escenas": scenes, "recursos": assets}
+    
+    def _asset_sizes(self, counted: Set[int]):
+        """Genera (nombre, bytes) de cada recurso y marca sus superficies en `counted`"""
+        for name in list(self.images) + list(self.sprite_sheets) + list(self.sounds):
+            if name in self.sprite_sheets:
+                counted.update(id(surface) for surface in self.sprite_sheets[name].get_surfaces())
+            elif name in self.images:
+                counted.add(id(self.images[name]))
+            yield name, self.get_asset_bytes(name)
+    
+    def _new_surface_bytes(self, surfaces: Iterable[pygame.Surface], counted: Set[int]) -> int:
+        """Bytes de las superficies que todavia no estan en `counted` (y las agrega)"""
+        size = 0
+        for surface in surfaces:
+            # Las subsuperficies comparten los pixeles de su padre
+            if id(surface) in counted or surface.get_parent() is not None:
+                continue
+            counted.add(id(surface))
+            size += self._surface_bytes(surface)
+        return size
+    
+    def _memory_category(self, name: str) -> str:
+        if name in self.sounds:
+            return "sonidos"
+        if name in self.sprite_sheets:
+            return "hojas de sprites"
+        return "imagenes"
+    
+    def _memory_owner(self, name: str) -> str:
+        if name in self.owners:
+            return "+".join(sorted(self.owners[name]))
+        if name in self.persistent:
+            return "persistente"
+        if name in self._unused:
+            return "sin uso (cache)"
+        return "sin declarar"
+    
+    def log_memory_report(self, scene_caches=None, scene_name: Optional[str] = None, top: int = 5):
+        """Escribe el reporte de memoria en el log de recursos."""
+        report = self.get_memory_report(scene_caches, scene_name)
+        mb = 1024 * 1024
+        resource_log.info("Memoria de recursos: %.1f MB (presupuesto %d MB)", report["total"] / mb, MEMORY_BUDGET_MB)
+        for title in ("categorias", "escenas"):
+            parts = sorted(report[title].items(), key=lambda item: item[1], reverse=True)
+            resource_log.info("  por %s: %s", title[:-1] if title == "escenas" else "categoria",
+                              ", ".join(f"{label} {size / mb:.1f}" for label, size in parts if size))
+        largest = sorted(report["recursos"].items(), key=lambda item: item[1], reverse=True)[:top]
+        resource_log.info("  mas grandes: %s", ", ".join(f"{name} {size / mb:.1f}" for name, size in largest))
+    
+    def memory_line(self, scene_caches=None) -> str:
+        """Linea para el overlay del profiler."""
+        report = self.get_memory_report(scene_caches)
+        mb = 1024 * 1024
+        largest = sorted(report["categorias"].items(), key=lambda item: item[1], reverse=True)[:3]
+        return (f"Memoria: {report['total'] / mb:.1f}/{MEMORY_BUDGET_MB} MB (" +
+                ", ".join(f"{label} {size / mb:.1f}" for label, size in largest) + ")")
+    
+    def _memory_total(self) -> int:
+        """El total de get_memory_report sin armar el detalle por categoria y escena."""
+        counted: Set[int] = set()
+        total = sum(size for _, size in self._asset_sizes(counted))
+        total += self._new_surface_bytes(self.atlas.pages if self.atlas else [], counted)
+        # Las copias escaladas y los textos son superficies propias: sus contadores ya son su tamaño
+        return total + self.scaled_cache_bytes + self.text_cache_bytes
+    
+    def enforce_memory_budget(self):
+        """
+        Si superficies y sonidos pasan MEMORY_BUDGET_MB descarta lo que se puede
+        volver a generar: primero recursos sin uso (los mas viejos), despues copias
+        escaladas que ninguna escena guarda.
+        """
+        budget = MEMORY_BUDGET_MB * 1024 * 1024
+        total = self._memory_total()
+        if total <= budget:
+            return
+        evicted: List[str] = []
+        while total > budget and self._unused:
+            name = next(iter(self._unused))
+            # unload tambien se lleva sus copias escaladas: se descuentan las dos cosas
+            scaled_bytes = self.scaled_cache_bytes
+            total -= self.get_asset_bytes(name)
+            self.unload(name)
+            total -= scaled_bytes - self.scaled_cache_bytes
+            evicted.append(name)
+        copies = len(self.scaled_cache)
+        if total > budget:
+            total -= self._evict_unused_scaled(total - budget)
+        evicted.extend(["(copia escalada)"] * (copies - len(self.scaled_cache)))
+        if total > budget:
+            resource_log.warning("Memoria de recursos %.1f MB por encima del presupuesto (%d MB) con todo en uso",
+                                 total / (1024 * 1024), MEMORY_BUDGET_MB)
+        elif evicted:
+            resource_log.info("Presupuesto de memoria: %d recursos descartados", len(evicted))
+    
     def get_resource_info(self) -> Dict[str, int]:
         """Resumen de recursos cargados (para logs o debug rapido)."""
         return {
@@ -351,7 +1006,8 @@ class ResourceManager:
             "sprite_sheets": len(self.sprite_sheets),
             "music_tracks": len(self.music_tracks),
             "music_loaded": self.music_loaded is not None,
-            "current_music": getattr(self, 'current_music_track', None)
+            "current_music": getattr(self, 'current_music_track', None),
+            "memory_mb": round(self.get_memory_report()["total"] / (1024 * 1024), 1)
         }
     
     def cleanup(self):
@@ -361,7 +1017,16 @@ class ResourceManager:
         self.fonts.clear()
         self.sprite_sheets.clear()
         self.music_tracks.clear()
+        self.ref_counts.clear()
+        self.owners.clear()
+        self._unused.clear()
+        self.atlas = None
+        self._atlas_sources = ()
+        self.scaled_cache.clear()
+        self.scaled_cache_bytes = 0
+        self.text_cache.clear()
+        self.text_cache_bytes = 0
         self.current_music_track = None
         self.music_loaded = None
         pygame.mixer.music.stop()
-        print("Recursos limpiados")
+        resource_log.info("Recursos limpiados")
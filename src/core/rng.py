@@ -0,0 +1,47 @@
+import random
+from typing import Dict, Optional
+
+
+class RandomService:
+    """Numeros aleatorios reproducibles: una semilla por partida y un stream
+    independiente (random.Random) por cada subsistema que lo pida.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self.seed = 0
+        self._streams: Dict[str, random.Random] = {}
+        self.new_run(seed)
+
+    def new_run(self, seed: Optional[int] = None) -> int:
+        """
+        Empieza una partida nueva y descarta los streams anteriores
+
+        Args:
+            seed: Semilla de la partida; si es None se genera una nueva
+
+        Returns:
+            La semilla usada (para poder repetir la partida)
+        """
+        if seed is None:
+            # No tocar el random global: la semilla sale del sistema operativo
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = int(seed)
+        self._streams.clear()
+        return self.seed
+
+    def stream(self, name: str) -> random.Random:
+        """
+        Devuelve el generador del subsistema indicado para la partida actual.
+        Cada nombre tiene su propia secuencia derivada de la semilla, asi que
+        lo que consuma un subsistema no cambia lo que ve otro.
+        """
+        rng = self._streams.get(name)
+        if rng is None:
+            # Semilla string: Python la deriva con sha512, estable entre ejecuciones
+            rng = random.Random(f"{self.seed}:{name}")
+            self._streams[name] = rng
+        return rng
+
+
+# Instancia global del servicio
+rng_service = RandomService()
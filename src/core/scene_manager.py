@@ -1,13 +1,65 @@
+import os
+import re
 import pygame
-from typing import Optional, Type
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type
 
 class Scene:
     """Clase base para todas las escenas del juego"""
     
+    # Fraccion (0..1) entre el ultimo tick de simulacion y el siguiente,
+    # la actualiza el SceneManager antes de cada draw para interpolar posiciones
+    interpolation = 1.0
+    
+    # Actualizacion por regiones: las escenas que lo activan informan con mark_dirty()
+    # que partes de la pantalla cambiaron y el GameManager sube solo esas regiones.
+    # Las que no lo activan se redibujan y se suben completas cada frame
+    uses_dirty_rects = False
+    
+    # Limite de frames propio de la escena (None = el del GameManager)
+    fps_cap: Optional[int] = None
+    
+    # Claves del catalogo de recursos que usa la escena, ademas de las que le asigna el
+    # manifiesto ("scenes"): el SceneManager las carga antes de crearla y las libera al salir
+    # (los recursos persistentes no hace falta declararlos)
+    assets: Tuple[str, ...] = ()
+    
     def __init__(self, screen: pygame.Surface, resource_manager, scene_manager):
         self.screen = screen
         self.resource_manager = resource_manager
         self.scene_manager = scene_manager  
+        self._dirty_rects: List[pygame.Rect] = []
+        self._full_redraw = True  # El primer frame de la escena siempre es completo
+        self.acquired_assets: Tuple[str, ...] = ()  # Los asigna el SceneManager
+    
+    @classmethod
+    def required_assets(cls, game_manager) -> Iterable[str]:
+        """Recursos a cargar antes de crear la escena (las que dependen de shared_data lo redefinen)"""
+        resource_manager = getattr(game_manager, 'resource_manager', None)
+        declared = resource_manager.get_scene_assets(cls.__name__) if resource_manager else ()
+        return cls.assets + tuple(name for name in declared if name not in cls.assets)
+    
+    def mark_dirty(self, rect: pygame.Rect):
+        """Marca una region de la pantalla para redibujar en el proximo frame"""
+        self._dirty_rects.append(pygame.Rect(rect))
+    
+    def request_full_redraw(self):
+        """Pide redibujar y subir la pantalla completa en el proximo frame"""
+        self._full_redraw = True
+    
+    def collect_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """
+        Devuelve y limpia las regiones cambiadas desde el ultimo frame
+        
+        Returns:
+            None si hay que redibujar todo, o la lista de regiones (vacia si nada cambio)
+        """
+        if not self.uses_dirty_rects or self._full_redraw:
+            self._full_redraw = False
+            self._dirty_rects = []
+            return None
+        rects = self._dirty_rects
+        self._dirty_rects = []
+        return rects
     
     def on_enter(self):
         """Se llama cuando se entra a la escena"""
@@ -17,6 +69,14 @@ class Scene:
         """Se llama cuando se sale de la escena"""
         pass
     
+    def on_focus_lost(self):
+        """Se llama cuando la ventana pasa a segundo plano (pierde el foco o se minimiza)"""
+        pass
+    
+    def get_memory_caches(self) -> Dict[str, Iterable[pygame.Surface]]:
+        """Superficies que la escena guarda por su cuenta, por etiqueta (para el reporte de memoria)"""
+        return {}
+    
     def handle_event(self, event: pygame.event.Event):
         """Maneja los eventos de la escena"""
         pass
@@ -29,6 +89,43 @@ class Scene:
         """Dibuja la escena"""
         pass
 
+# Declaraciones "class Nombre(Base, ...):" en el codigo de las pantallas
+_CLASS_PATTERN = re.compile(r"^class\s+(\w+)\s*\(([^)]*)\)\s*:", re.MULTILINE)
+_SCREENS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "screens")
+
+def scene_class_names(directory: str = _SCREENS_DIR) -> Set[str]:
+    """
+    Nombres de todas las clases Scene (los que usa "scenes" en el manifiesto)
+    
+    Las pantallas se leen como texto en vez de importarlas: se importan recien al
+    usarlas e importarlas todas al iniciar sumaba ~45 ms (y sus efectos de carga).
+    """
+    bases: Dict[str, List[str]] = {}
+    for entry in os.scandir(directory):
+        if entry.name.endswith(".py"):
+            with open(entry.path, "r", encoding="utf-8") as f:
+                for name, parents in _CLASS_PATTERN.findall(f.read()):
+                    bases[name] = [parent.strip().split(".")[-1] for parent in parents.split(",")]
+    
+    # Las ya importadas cuentan aunque esten declaradas en otro lado
+    names: Set[str] = set()
+    pending = list(Scene.__subclasses__())
+    while pending:
+        cls = pending.pop()
+        names.add(cls.__name__)
+        pending.extend(cls.__subclasses__())
+    
+    # Subclases de subclases: repetir hasta que no aparezcan nuevas
+    changed = True
+    while changed:
+        changed = False
+        for name, parents in bases.items():
+            if name not in names and any(parent == "Scene" or parent in names for parent in parents):
+                names.add(name)
+                changed = True
+    return names
+
+
 class SceneManager:
     """Gestor de escenas del juego"""
     
@@ -48,13 +145,22 @@ class SceneManager:
         """Realiza el cambio de escena pendiente"""
         if self.next_scene:
             # Salir de la escena actual
-            if self.current_scene:
-                self.current_scene.on_exit()
+            previous_scene = self.current_scene
+            if previous_scene:
+                previous_scene.on_exit()
+            
+            # Cargar lo que necesita la nueva escena antes de liberar lo de la anterior,
+            # asi los recursos compartidos (por ejemplo al reiniciar) no se recargan
+            assets = tuple(self.next_scene.required_assets(getattr(self, 'game_manager', None)))
+            self.resource_manager.acquire(assets, owner=self.next_scene.__name__)
             
             # Crear la nueva escena
             args, kwargs = self.next_scene_args if self.next_scene_args else ((), {})
             self.current_scene = self.next_scene(self.screen, self.resource_manager, self, *args, **kwargs)
             self.current_scene.scene_manager = self
+            self.current_scene.acquired_assets = assets
+            if previous_scene:
+                self.resource_manager.release(previous_scene.acquired_assets, owner=type(previous_scene).__name__)
             
             # Pasar referencia al game_manager si existe
             if hasattr(self, 'game_manager'):
@@ -81,7 +187,36 @@ class SceneManager:
         if self.current_scene:
             self.current_scene.update(dt)
     
-    def draw(self):
+    def on_focus_lost(self):
+        """Avisa a la escena actual que la ventana paso a segundo plano"""
+        if self.current_scene:
+            self.current_scene.on_focus_lost()
+    
+    def get_memory_caches(self) -> Dict[str, Iterable[pygame.Surface]]:
+        """Caches propios de la escena actual (ver Scene.get_memory_caches)"""
+        if self.current_scene:
+            return self.current_scene.get_memory_caches()
+        return {}
+    
+    def log_memory_report(self):
+        """Reporte de memoria del ResourceManager incluyendo los caches de la escena actual"""
+        scene_name = type(self.current_scene).__name__ if self.current_scene else None
+        self.resource_manager.log_memory_report(self.get_memory_caches(), scene_name)
+    
+    def get_fps_cap(self) -> Optional[int]:
+        """Limite de frames pedido por la escena actual (None = sin limite propio)"""
+        if self.current_scene:
+            return self.current_scene.fps_cap
+        return None
+    
+    def collect_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Regiones a actualizar de la escena actual (None = pantalla completa)"""
+        if self.current_scene:
+            return self.current_scene.collect_dirty_rects()
+        return None
+    
+    def draw(self, interpolation: float = 1.0):
         """Dibuja la escena actual"""
         if self.current_scene:
+            self.current_scene.interpolation = interpolation
             self.current_scene.draw()
@@ -0,0 +1,118 @@
+import os
+import struct
+import threading
+import time
+from typing import Dict, Tuple
+import pygame
+from src.Constantes import *
+from src.core.disk_cache import cache_key, hash_file, rewrite_header, write_atomic
+from src.core.logger import game_log
+
+resource_log = game_log.channel("recursos")
+
+# Archivo de cache: cabecera fija + PCM crudo en el formato del mixer (Sound.get_raw)
+_MAGIC = b"UPCM"
+_VERSION = 1
+# magic, version, frecuencia, bits con signo, canales, mtime_ns, tamaño y sha1 del original,
+# milisegundos que tardo la decodificacion original (para el reporte)
+_HEADER = struct.Struct("<4sHihHqq20sf")
+
+
+class SoundCache:
+    """
+    Cache en disco de efectos de sonido ya decodificados. La clave incluye
+    el formato del mixer (frecuencia, bits, canales): si cambia la
+    configuracion de audio se decodifica de nuevo. Las entradas se validan
+    igual que el cache de pixeles (mtime, tamaño y sha1 del archivo original).
+    """
+
+    def __init__(self, directory: str = SOUND_CACHE_DIR, enabled: bool = SOUND_CACHE_ENABLED):
+        self.directory = directory
+        self.enabled = enabled
+        # nombre de archivo -> (ms decodificando el original, ms de esta carga, vino del cache)
+        self.timings: Dict[str, Tuple[float, float, bool]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: str) -> pygame.mixer.Sound:
+        """Devuelve el sonido de `path` (se puede llamar desde los hilos del AssetLoader)"""
+        mixer_format = pygame.mixer.get_init()
+        if not self.enabled or not mixer_format:
+            return pygame.mixer.Sound(path)
+
+        start = time.perf_counter()
+        try:
+            stat = os.stat(path)
+            cache_path = self._cache_path(path, mixer_format)
+            cached = self._read(cache_path, path, stat, mixer_format)
+        except OSError:
+            return pygame.mixer.Sound(path)  # Que el error salga como siempre
+        if cached is not None:
+            sound, decode_ms = cached
+            self._record(path, decode_ms, (time.perf_counter() - start) * 1000.0, True)
+            return sound
+
+        sound = pygame.mixer.Sound(path)
+        decode_ms = (time.perf_counter() - start) * 1000.0
+        self._record(path, decode_ms, decode_ms, False)
+        try:
+            self._write(cache_path, path, stat, mixer_format, sound, decode_ms)
+        except OSError as e:
+            resource_log.warning("No se pudo guardar %s en el cache de sonidos: %s", path, e)
+        return sound
+
+    def report(self):
+        """Muestra cuanto tardo cada sonido frente a decodificarlo desde el MP3"""
+        if not self.timings:
+            return
+        for filename, (decode_ms, load_ms, hit) in sorted(self.timings.items()):
+            if hit:
+                resource_log.info("Sonido %-40s cache %6.1f ms  (decodificar: %6.1f ms)",
+                                  filename, load_ms, decode_ms)
+            else:
+                resource_log.info("Sonido %-40s decodificado %6.1f ms  (guardado en cache)",
+                                  filename, decode_ms)
+        total_decode = sum(t[0] for t in self.timings.values())
+        total_load = sum(t[1] for t in self.timings.values())
+        resource_log.info("Sonidos: %.1f ms en esta carga, %.1f ms decodificando todo", total_load, total_decode)
+
+    def _record(self, path: str, decode_ms: float, load_ms: float, hit: bool):
+        with self._lock:
+            self.timings[os.path.basename(path)] = (decode_ms, load_ms, hit)
+
+    def _cache_path(self, path: str, mixer_format) -> str:
+        frequency, size, channels = mixer_format
+        return os.path.join(self.directory, f"{cache_key(path)}_{frequency}_{size}_{channels}.pcm")
+
+    def _read(self, cache_path: str, path: str, stat, mixer_format):
+        """Lee la entrada si sigue valida: (Sound, ms de la decodificacion original) o None"""
+        if not os.path.exists(cache_path):
+            return None
+        with open(cache_path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            return None
+        magic, version, frequency, size, channels, mtime_ns, src_size, digest, decode_ms = \
+            _HEADER.unpack_from(data, 0)
+        if (magic != _MAGIC or version != _VERSION or src_size != stat.st_size
+                or (frequency, size, channels) != tuple(mixer_format)):
+            return None
+        if mtime_ns != stat.st_mtime_ns:
+            # Archivo tocado: solo es invalido si el contenido cambio
+            if hash_file(path) != digest:
+                return None
+            rewrite_header(cache_path, _HEADER.pack(magic, version, frequency, size, channels,
+                                                    stat.st_mtime_ns, src_size, digest, decode_ms))
+        sound = pygame.mixer.Sound(buffer=memoryview(data)[_HEADER.size:])
+        return sound, decode_ms
+
+    def _write(self, cache_path: str, path: str, stat, mixer_format, sound: pygame.mixer.Sound,
+               decode_ms: float):
+        """Guarda el PCM de forma atomica (archivo temporal + replace)"""
+        frequency, size, channels = mixer_format
+        header = _HEADER.pack(_MAGIC, _VERSION, frequency, size, channels, stat.st_mtime_ns,
+                              stat.st_size, hash_file(path), decode_ms)
+        write_atomic(cache_path, (header, sound.get_raw()))
+
+
+# Instancia global del cache
+sound_cache = SoundCache()
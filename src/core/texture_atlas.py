@@ -0,0 +1,144 @@
+import time
+from typing import Dict, Hashable, List, Optional, Tuple
+import pygame
+from src.Constantes import *
+from src.core.logger import game_log
+
+resource_log = game_log.channel("recursos")
+
+
+class AtlasRegion:
+    """
+    Frame guardado dentro de una pagina del atlas. `rect` es la zona recortada
+    (sin bordes transparentes) y `offset_x`/`offset_y` donde va esa zona dentro
+    del frame original de `width` x `height`.
+    """
+    __slots__ = ("page", "rect", "offset_x", "offset_y", "width", "height", "_surface")
+
+    def __init__(self, page: pygame.Surface, rect: pygame.Rect, offset_x: int = 0, offset_y: int = 0,
+                 width: Optional[int] = None, height: Optional[int] = None):
+        self.page = page
+        self.rect = rect
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.width = rect.width if width is None else width
+        self.height = rect.height if height is None else height
+        self._surface: Optional[pygame.Surface] = None
+
+    @classmethod
+    def from_surface(cls, surface: pygame.Surface) -> "AtlasRegion":
+        """Envuelve una superficie suelta (placeholders o recursos fuera del atlas)"""
+        return cls(surface, surface.get_rect())
+
+    @property
+    def surface(self) -> pygame.Surface:
+        """Zona recortada como subsuperficie (para copiar o escalar; al dibujar conviene blit_args)"""
+        if self._surface is None:
+            self._surface = self.page.subsurface(self.rect)
+        return self._surface
+
+    def get_rect(self, **kwargs) -> pygame.Rect:
+        """Rect del frame original (sin recortar), como Surface.get_rect"""
+        rect = pygame.Rect(0, 0, self.width, self.height)
+        for attribute, value in kwargs.items():
+            setattr(rect, attribute, value)
+        return rect
+
+    def blit_args(self, x: float, y: float) -> Tuple[pygame.Surface, Tuple[float, float], pygame.Rect]:
+        """(origen, destino, area) para dibujar el frame con su esquina en (x, y) usando Surface.blits"""
+        return self.page, (x + self.offset_x, y + self.offset_y), self.rect
+
+
+class TextureAtlas:
+    """
+    Empaqueta muchos frames chicos en pocas superficies grandes. Cada frame se
+    recorta a su zona visible y se acomoda por estantes (filas ordenadas por alto);
+    cuando una pagina se llena se abre otra. Los frames se dibujan con
+    (pagina, destino, area), asi que un lote de sprites sale de una sola superficie.
+    """
+
+    def __init__(self, page_size: int = ATLAS_PAGE_SIZE, padding: int = ATLAS_PADDING):
+        self.page_size = page_size
+        self.padding = padding
+        self.pages: List[pygame.Surface] = []
+        self.frames: Dict[Hashable, AtlasRegion] = {}
+        self._pending: List[Tuple[Hashable, pygame.Surface]] = []
+
+    def add_frame(self, key: Hashable, surface: pygame.Surface):
+        """Encola un frame para el proximo build()"""
+        self._pending.append((key, surface))
+
+    def get(self, key: Hashable) -> Optional[AtlasRegion]:
+        """Region de un frame (None si no esta en el atlas)"""
+        return self.frames.get(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.frames
+
+    def get_memory_bytes(self) -> int:
+        """Memoria que ocupan las paginas"""
+        return sum(page.get_width() * page.get_height() * page.get_bytesize() for page in self.pages)
+
+    def build(self):
+        """Recorta, ubica y copia todos los frames encolados"""
+        start = time.perf_counter()
+        pending, self._pending = self._pending, []
+
+        trimmed = []
+        for key, surface in pending:
+            bounds = surface.get_bounding_rect()
+            if bounds.width % 2:
+                # pygame mezcla el alpha de a dos pixeles: un ancho impar cae al camino lento del blit
+                if bounds.right < surface.get_width():
+                    bounds.width += 1
+                elif bounds.x > 0:
+                    bounds.x -= 1
+                    bounds.width += 1
+            trimmed.append((key, surface, bounds))
+        # Estantes: primero los mas altos para desperdiciar menos espacio
+        trimmed.sort(key=lambda item: (item[2].height, item[2].width), reverse=True)
+
+        placements = self._pack([bounds.size for _, _, bounds in trimmed])
+        page_heights: Dict[int, int] = {}
+        for (page_index, x, y), (_, _, bounds) in zip(placements, trimmed):
+            page_heights[page_index] = max(page_heights.get(page_index, 0), y + bounds.height)
+
+        # Cada pagina solo tan alta como lo que usa
+        self.pages = []
+        for page_index in range(len(page_heights)):
+            page = pygame.Surface((self.page_size, max(1, page_heights[page_index])), pygame.SRCALPHA, 32)
+            if pygame.display.get_surface() is not None:
+                page = page.convert_alpha()
+            page.fill((0, 0, 0, 0))
+            self.pages.append(page)
+
+        self.frames = {}
+        for (page_index, x, y), (key, surface, bounds) in zip(placements, trimmed):
+            page = self.pages[page_index]
+            if bounds.width and bounds.height:
+                # MAX sobre pagina vacia = copia exacta (un blit normal mezclaria el alpha)
+                page.blit(surface, (x, y), bounds, special_flags=pygame.BLEND_RGBA_MAX)
+            self.frames[key] = AtlasRegion(page, pygame.Rect(x, y, bounds.width, bounds.height),
+                                           bounds.x, bounds.y, surface.get_width(), surface.get_height())
+
+        resource_log.info("Atlas: %d frames en %d paginas (%.1f MB) en %.1f ms", len(self.frames),
+                          len(self.pages), self.get_memory_bytes() / (1024 * 1024),
+                          (time.perf_counter() - start) * 1000.0)
+
+    def _pack(self, sizes: List[Tuple[int, int]]) -> List[Tuple[int, int, int]]:
+        """Ubica cada tamaño como (pagina, x, y) llenando estantes de izquierda a derecha"""
+        placements = []
+        page_index, shelf_x, shelf_y, shelf_height = 0, 0, 0, 0
+        for width, height in sizes:
+            if width > self.page_size or height > self.page_size:
+                raise ValueError(f"Frame de {width}x{height} no entra en una pagina de {self.page_size}")
+            if shelf_x + width > self.page_size:
+                # Estante lleno: abrir otro debajo
+                shelf_x, shelf_y, shelf_height = 0, shelf_y + shelf_height + self.padding, 0
+            if shelf_y + height > self.page_size:
+                # Pagina llena: abrir otra
+                page_index, shelf_x, shelf_y, shelf_height = page_index + 1, 0, 0, 0
+            placements.append((page_index, shelf_x, shelf_y))
+            shelf_x += (width + self.padding + 1) & ~1  # Columnas pares (ver build)
+            shelf_height = max(shelf_height, height)
+        return placements
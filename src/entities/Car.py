@@ -1,7 +1,10 @@
 import pygame
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from src.Constantes import *
-import random
+from src.core.rng import rng_service
+from src.core.entity_store import EntityStore
+from src.core.texture_atlas import AtlasRegion
+from src.core.kinematics import tick_scale
 
 # Constantes para los autos - movidas desde numeros magicos
 
@@ -19,61 +22,82 @@ SLOW_CAR_BLUE_WEIGHT = 80
 SLOW_CAR_RED_WEIGHT = 20
 ANIMATION_SPEED_DIVISOR = 13.0
 
-class Car(pygame.sprite.Sprite):
-    """Auto enemigo optimizado con soporte para object pooling"""
+class Car:
+    """
+    Auto enemigo optimizado con soporte para object pooling.
+    
+    Tiene la interfaz de un Sprite (rect, image, update) pero no hereda de
+    pygame.sprite.Sprite para poder declarar __slots__ (ningun grupo lo usa).
+    """
     
     CAR_TYPES = ["Auto_azul", "Auto_rojo"]
     
+    __slots__ = (
+        "resource_manager", "rng", "width", "height", "slot", "pool_index", "generation",
+        "active", "rect", "x", "previous_x", "animation_frames", "_frames_by_type",
+        "_cached_car_type", "movement_speed", "car_type", "animation_frame",
+        "animation_timer", "animation_speed", "current_sprite",
+        # Cache del GameRenderer: rect del dibujo de respaldo
+        "fallback_rect",
+    )
+    
     def __init__(self, initial_x: int, initial_y: int, resource_manager, 
                  speed: int = 15, 
                  width: int = DEFAULT_CAR_WIDTH, 
                  height: int = DEFAULT_CAR_HEIGHT):
-        super().__init__()
         self.resource_manager = resource_manager
+        self.rng = rng_service.stream("cars")
         self.width = width
         self.height = height
         
-        # Pool support
-        self.active = True
+        # Datos del CarPool: slot en cars, posicion en su lista de activos (-1 = libre)
+        # y generacion del handle
+        self.slot = -1
+        self.pool_index = -1
+        self.generation = 0
         
         # Crear rect una sola vez y reutilizar
         self.rect = pygame.Rect(initial_x, initial_y, width, height)
         
         # Cache para frames de animacion (se carga una vez por tipo de auto)
-        self.animation_frames: List[pygame.Surface] = []
-        
-        # Variables de animacion
-        self.animation_frame = 0
-        self.animation_timer = 0
-        self.animation_speed = ANIMATION_SPEED
-        
-        self.current_sprite: Optional[pygame.Surface] = None
+        self.animation_frames: Tuple[AtlasRegion, ...] = ()
+        self._frames_by_type: Dict[str, Tuple[AtlasRegion, ...]] = {}
+        self._cached_car_type: Optional[str] = None
+        self.fallback_rect: Optional[pygame.Rect] = None
         
         # Inicializar con los parametros dados
         self._initialize_car(initial_x, initial_y, speed)
+        self.active = True
+    
+    @property
+    def image(self) -> Optional[pygame.Surface]:
+        sprite = self.current_sprite
+        return sprite.surface if sprite else None
     
     def _initialize_car(self, x: int, y: int, speed: int):
         """Inicializa o reinicializa el auto con nuevos parametros"""
-        self.rect.x = x
-        self.rect.y = y
         self.movement_speed = speed
         
         # Elegir tipo basado en velocidad
         self.car_type = self._choose_car_type_by_speed(speed)
         
-        # Ajustar velocidad de animacion
-        self.animation_speed = ANIMATION_SPEED * (ANIMATION_SPEED_DIVISOR / max(speed, 8))
-        
-        # Resetear animacion
-        self.animation_frame = 0
-        self.animation_timer = 0
-        
         # Cargar frames si no estan cacheados para este tipo
-        if not self.animation_frames or getattr(self, '_cached_car_type', None) != self.car_type:
+        if not self.animation_frames or self._cached_car_type != self.car_type:
             self._load_animation_frames()
             self._cached_car_type = self.car_type
         
-        self._update_sprite()
+        self._reset_motion(x, y, ANIMATION_SPEED * (ANIMATION_SPEED_DIVISOR / max(speed, 8)))
+    
+    def _reset_motion(self, x: int, y: int, animation_speed: float):
+        """Posicion en pixeles enteros sin rastro de interpolacion y animacion desde el frame 0"""
+        self.rect.x = x
+        self.rect.y = y
+        self.x = float(self.rect.x)    # Posicion real (el rect queda redondeado a pixeles)
+        self.previous_x = self.rect.x  # Posicion del tick anterior (interpolacion y colision barrida)
+        self.animation_speed = animation_speed
+        self.animation_frame = 0
+        self.animation_timer = 0.0
+        self.current_sprite: Optional[AtlasRegion] = self.animation_frames[0] if self.animation_frames else None
     
     def reset_for_reuse(self, x: int, y: int, speed: int):
         """Resetea el auto para reutilizacion desde el pool"""
@@ -84,69 +108,60 @@ class Car(pygame.sprite.Sprite):
         """Autos rojos = mas rapidos, azules = mas lentos"""
         if speed >= CAR_SPEED_THRESHOLD_FAST:
             # Autos rapidos: 80% rojos
-            return random.choices(
+            return self.rng.choices(
                 ["Auto_rojo", "Auto_azul"], 
                 weights=[FAST_CAR_RED_WEIGHT, FAST_CAR_BLUE_WEIGHT], 
                 k=1
             )[0]
         elif speed <= CAR_SPEED_THRESHOLD_SLOW:
             # Autos lentos: 80% azules  
-            return random.choices(
+            return self.rng.choices(
                 ["Auto_azul", "Auto_rojo"], 
                 weights=[SLOW_CAR_BLUE_WEIGHT, SLOW_CAR_RED_WEIGHT], 
                 k=1
             )[0]
         else:
             # Velocidad media: 50/50
-            return random.choice(self.CAR_TYPES)
+            return self.rng.choice(self.CAR_TYPES)
     
     def _load_animation_frames(self):
-        """Carga los frames de animacion"""
-        spritesheet = self.resource_manager.get_spritesheet(self.car_type)
-        
-        if spritesheet:
-            self.animation_frames = self.resource_manager.get_animation_frames(
-                self.car_type, 
-                SPRITESHEET_START_COLUMN, 
-                SPRITESHEET_END_COLUMN, 
-                SPRITESHEET_ROW
-            )
-        
-        # Fallback si no hay frames
-        if not self.animation_frames:
-            color = (255, 50, 50) if self.car_type == "Auto_rojo" else (50, 50, 255)
-            placeholder = self.resource_manager.create_fallback_image((self.width, self.height), color)
-            self.animation_frames = [placeholder]
-    
-    def _update_sprite(self):
-        """Actualiza el sprite actual para evitar calculos innecesarios"""
-        if self.animation_frames:
-            frame_index = int(self.animation_frame) % len(self.animation_frames)
-            new_sprite = self.animation_frames[frame_index]
+        """Carga los frames de animacion (una vez por tipo; al reusar el auto del pool es solo una busqueda)"""
+        frames = self._frames_by_type.get(self.car_type)
+        if frames is None:
+            frames = ()
+            spritesheet = self.resource_manager.get_spritesheet(self.car_type)
+            if spritesheet:
+                frames = tuple(self.resource_manager.get_frame_regions(
+                    self.car_type, 
+                    SPRITESHEET_START_COLUMN, 
+                    SPRITESHEET_END_COLUMN, 
+                    SPRITESHEET_ROW
+                ))
             
-            # Solo actualizar si el sprite cambio
-            if self.current_sprite != new_sprite:
-                self.current_sprite = new_sprite
-                self.image = self.current_sprite
+            # Fallback si no hay frames
+            if not frames:
+                color = (255, 50, 50) if self.car_type == "Auto_rojo" else (50, 50, 255)
+                placeholder = self.resource_manager.create_fallback_image((self.width, self.height), color)
+                frames = (AtlasRegion.from_surface(placeholder),)
+            self._frames_by_type[self.car_type] = frames
+        self.animation_frames = frames
     
-    def update(self, delta_time: float = 1/60):
+    def update(self, delta_time: float = 1 / SIMULATION_TICK_RATE):
         """Actualiza posicion y animacion - solo si esta activo"""
         if not self.active:
             return
-            
-        # Movimiento horizontal
-        self.rect.x -= self.movement_speed
         
-        # Animacion
+        # Movimiento horizontal (movement_speed esta en pixeles por tick de referencia)
+        self.previous_x = self.rect.x
+        self.x -= self.movement_speed * tick_scale(delta_time)
+        self.rect.x = round(self.x)
+        
+        # Animacion (animation_frames nunca esta vacio: hay un placeholder de respaldo)
         self.animation_timer += delta_time
         if self.animation_timer >= self.animation_speed:
-            self.animation_timer = 0
-            old_frame = self.animation_frame
+            self.animation_timer = 0.0
             self.animation_frame = (self.animation_frame + 1) % len(self.animation_frames)
-            
-            # Solo actualizar sprite si el frame cambio
-            if old_frame != self.animation_frame:
-                self._update_sprite()
+            self.current_sprite = self.animation_frames[self.animation_frame]
     
     def draw(self, screen: pygame.Surface):
         """Dibuja el auto - solo si esta activo"""
@@ -154,12 +169,16 @@ class Car(pygame.sprite.Sprite):
             return
             
         if self.current_sprite:
-            screen.blit(self.current_sprite, self.rect)
+            screen.blit(*self.current_sprite.blit_args(self.rect.x, self.rect.y))
         else:
             # Fallback
             color = (255, 50, 50) if self.car_type == "Auto_rojo" else (50, 50, 255)
             pygame.draw.rect(screen, color, self.rect)
     
+    def get_previous_rect(self) -> pygame.Rect:
+        """Rect del auto al empezar el ultimo tick"""
+        return self.rect.move(self.previous_x - self.rect.x, 0)
+    
     def get_position(self) -> tuple:
         """Retorna posicion actual"""
         return (self.rect.x, self.rect.y)
@@ -172,4 +191,91 @@ class Car(pygame.sprite.Sprite):
         """Cambia velocidad y reajusta animacion"""
         self.movement_speed = max(1, new_speed)
         # Reajustar velocidad de animacion
-        self.animation_speed = ANIMATION_SPEED * (ANIMATION_SPEED_DIVISOR / max(new_speed, 8))
\ No newline at end of file
+        self.animation_speed = ANIMATION_SPEED * (ANIMATION_SPEED_DIVISOR / max(new_speed, 8))
+
+
+class StoreCar(Car):
+    """
+    Auto del modo almacen (ENTITY_STORE_ENABLED): posicion, velocidad,
+    animacion y flag de activo viven en un slot del EntityStore del pool,
+    que los mueve a todos juntos con step(). rect, previous_x y el sprite
+    actual se derivan de las columnas al leerlos (nada se copia por tick).
+    """
+    
+    __slots__ = ("store", "_rect")
+    
+    def __init__(self, initial_x: int, initial_y: int, resource_manager,
+                 speed: int = 15,
+                 width: int = DEFAULT_CAR_WIDTH,
+                 height: int = DEFAULT_CAR_HEIGHT, *,
+                 store: EntityStore):
+        self.store = store  # El slot se ocupa en el primer _reset_motion
+        super().__init__(initial_x, initial_y, resource_manager, speed, width, height)
+    
+    def _reset_motion(self, x: int, y: int, animation_speed: float):
+        self.rect.y = y
+        if self.slot < 0:
+            self.slot = self.store.spawn(int(x), y, -self.movement_speed, self.width,
+                                         animation_speed, len(self.animation_frames))
+        else:
+            self.store.reset(self.slot, int(x), y, -self.movement_speed, self.width,
+                             animation_speed, len(self.animation_frames))
+    
+    @property
+    def rect(self) -> pygame.Rect:
+        rect = self._rect
+        if self.slot >= 0:
+            rect.x = round(self.store.x[self.slot])
+        return rect
+    
+    @rect.setter
+    def rect(self, value: pygame.Rect):
+        self._rect = value
+    
+    @property
+    def x(self) -> float:
+        """Posicion real (el rect queda redondeado a pixeles)"""
+        return self.store.x[self.slot]
+    
+    @x.setter
+    def x(self, value: float):
+        self.store.x[self.slot] = value
+    
+    @property
+    def previous_x(self) -> int:
+        return round(self.store.prev_x[self.slot])
+    
+    @property
+    def active(self) -> bool:
+        return bool(self.store.alive[self.slot])
+    
+    @active.setter
+    def active(self, value: bool):
+        self.store.alive[self.slot] = 1 if value else 0
+    
+    @property
+    def animation_frame(self) -> int:
+        return self.store.frame[self.slot]
+    
+    @property
+    def animation_timer(self) -> float:
+        return self.store.anim_timer[self.slot]
+    
+    @property
+    def animation_speed(self) -> float:
+        return self.store.anim_speed[self.slot]
+    
+    @property
+    def current_sprite(self) -> Optional[AtlasRegion]:
+        # frame_count del slot es len(animation_frames): el frame siempre es un indice valido
+        return self.animation_frames[self.store.frame[self.slot]]
+    
+    def update(self, delta_time: float = 1 / SIMULATION_TICK_RATE):
+        """Mueve y anima solo este slot (el pool mueve a todos juntos con store.step)"""
+        self.store.step_slot(self.slot, delta_time)
+    
+    def set_speed(self, new_speed: int):
+        """Cambia velocidad y reajusta animacion"""
+        self.movement_speed = max(1, new_speed)
+        self.store.vx[self.slot] = -self.movement_speed
+        self.store.anim_speed[self.slot] = ANIMATION_SPEED * (ANIMATION_SPEED_DIVISOR / max(new_speed, 8))
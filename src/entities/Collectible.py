@@ -1,10 +1,26 @@
 import pygame
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from src.Constantes import *
 from abc import ABC, abstractmethod
+from src.core.texture_atlas import AtlasRegion
+from src.core.entity_store import EntityStore
+from src.core.kinematics import tick_scale
 
-class Collectible(pygame.sprite.Sprite, ABC):
-    """Clase base para todos los objetos coleccionables del juego"""
+DEFAULT_COLLECTIBLE_SPEED = 8  # Pixeles por tick de referencia hacia la izquierda
+
+class Collectible(ABC):
+    """
+    Clase base para todos los objetos coleccionables del juego.
+    
+    Tiene la interfaz de un Sprite (rect, image, update) pero no hereda de
+    pygame.sprite.Sprite para poder declarar __slots__ (ningun grupo lo usa).
+    """
+    
+    __slots__ = ("resource_manager", "region", "image", "rect", "x", "previous_x", "collected", "speed",
+                 "effect_duration", "pool_index")
+    
+    # Placeholder por tamaño, compartido por todas las instancias (no se modifica)
+    _placeholders: Dict[Tuple[int, int], pygame.Surface] = {}
     
     def __init__(self, resource_manager, image_name: str, *groups, 
                  width: int = DEFAULT_PILAS_WIDTH, height: int = DEFAULT_PILAS_HEIGHT):
@@ -16,33 +32,68 @@ class Collectible(pygame.sprite.Sprite, ABC):
             height = groups_list.pop()
             width = groups_list.pop()
         
-        # Llamar a pygame.sprite.Sprite.__init__ con los grupos correctos (sin ints)
-        super().__init__(*groups_list)
+        if groups_list:
+            raise TypeError("Los coleccionables no se pueden agregar a grupos de sprites")
         
         self.resource_manager = resource_manager
         
-        # Cargar imagen
-        collectible_image = resource_manager.get_image(image_name)
-        if collectible_image:
-            # Si la imagen existe, asegurarse de tener un tamaño consistente
-            self.image = collectible_image.convert_alpha()
-            # Opcional: ajustar rect al tamaño actual de la imagen (mantener original si se quiere)
-            self.rect = self.image.get_rect()
+        # Region del atlas (la dibuja el GameRenderer); image queda por compatibilidad con Sprite.
+        # Todas las instancias de un tipo comparten la misma superficie: nunca se copia ni se modifica
+        self.region = resource_manager.get_image_region(image_name)
+        if self.region:
+            self.image = resource_manager.get_image(image_name)
         else:
-            # Crear imagen placeholder si no se encuentra (usar width/height correctamente)
-            self.image = pygame.Surface((width, height), pygame.SRCALPHA)
-            self.image.fill((255, 255, 0))  # Amarillo por defecto
-            self.rect = self.image.get_rect()
+            self.image = self._get_placeholder(width, height)
+            self.region = AtlasRegion.from_surface(self.image)
+        # El rect conserva el tamaño original de la imagen (sin el recorte del atlas)
+        self.rect = self.region.get_rect()
         
-        # Estado del objeto coleccionable
+        # Posicion real en float y posicion del tick anterior (interpolacion y colision barrida)
+        self.x = float(self.rect.x)
+        self.previous_x = self.rect.x
+        
+        # Estado del objeto coleccionable (speed en pixeles por tick de referencia)
         self.collected = False
-        self.speed = 8
+        self.speed = DEFAULT_COLLECTIBLE_SPEED
         self.effect_duration = 0.0  # Para efectos temporales
-        
-    def update(self):
+        self.pool_index = -1        # Posicion en la lista de activos del CollectiblePool (-1 = libre)
+    
+    @classmethod
+    def _get_placeholder(cls, width: int, height: int) -> pygame.Surface:
+        """Imagen de respaldo si falta el recurso (una por tamaño)"""
+        surface = cls._placeholders.get((width, height))
+        if surface is None:
+            surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            surface.fill((255, 255, 0))  # Amarillo por defecto
+            cls._placeholders[(width, height)] = surface
+        return surface
+    
+    def set_position(self, x: int, y: int):
+        """Coloca el objeto en el mundo sin dejar rastro de interpolacion"""
+        self.rect.x = x
+        self.rect.y = y
+        self.x = float(self.rect.x)
+        self.previous_x = self.rect.x
+    
+    def reset_for_reuse(self, x: int, y: int):
+        """Vuelve a poner en juego un objeto liberado"""
+        self.collected = False
+        self.speed = DEFAULT_COLLECTIBLE_SPEED
+        self.set_position(x, y)
+    
+    def update(self, delta_time: float = 1 / SIMULATION_TICK_RATE):
         """Actualiza la posicion del objeto coleccionable"""
+        self.previous_x = self.rect.x
         if not self.collected:
-            self.rect.x -= self.speed
+            self.x -= self.speed * tick_scale(delta_time)
+            self.rect.x = round(self.x)
+    
+    def release(self):
+        """Lo llama el pool al sacarlo de juego (el objeto suelto no ocupa nada afuera)"""
+    
+    def get_previous_rect(self) -> pygame.Rect:
+        """Rect del objeto al empezar el ultimo tick"""
+        return self.rect.move(self.previous_x - self.rect.x, 0)
     
     def collect(self, robot):
         """Metodo para recolectar el objeto - debe ser implementado por las subclases
@@ -71,4 +122,85 @@ class Collectible(pygame.sprite.Sprite, ABC):
         
     def get_effect_info(self) -> str:
         """Retorna informacion sobre el efecto del objeto"""
-        return "Objeto coleccionable base"
\ No newline at end of file
+        return "Objeto coleccionable base"
+
+
+class CollectibleStoreView:
+    """
+    Mezcla para los coleccionables del modo almacen (ENTITY_STORE_ENABLED):
+    posicion, velocidad y estado viven en un slot del EntityStore del spawner,
+    que los mueve a todos juntos con step(). rect y previous_x se derivan de
+    las columnas al leerlos. La clase concreta declara los slots
+    ("store", "slot", "_rect"), ej. StorePilas(CollectibleStoreView, pilas).
+    """
+    
+    __slots__ = ()
+    
+    def __init__(self, resource_manager, *groups, store: EntityStore, **kwargs):
+        # El slot existe antes de que Collectible.__init__ asigne rect, x y el estado
+        self.store = store
+        self.slot = store.spawn(0, 0, -DEFAULT_COLLECTIBLE_SPEED, 0)
+        super().__init__(resource_manager, *groups, **kwargs)
+    
+    @property
+    def rect(self) -> pygame.Rect:
+        rect = self._rect
+        rect.x = round(self.store.x[self.slot])
+        return rect
+    
+    @rect.setter
+    def rect(self, value: pygame.Rect):
+        self._rect = value
+        self.store.width[self.slot] = value.width
+    
+    @property
+    def x(self) -> float:
+        """Posicion real (el rect queda redondeado a pixeles)"""
+        return self.store.x[self.slot]
+    
+    @x.setter
+    def x(self, value: float):
+        self.store.x[self.slot] = value
+    
+    @property
+    def previous_x(self) -> int:
+        return round(self.store.prev_x[self.slot])
+    
+    @previous_x.setter
+    def previous_x(self, value: int):
+        self.store.prev_x[self.slot] = value
+    
+    @property
+    def speed(self) -> float:
+        return -self.store.vx[self.slot]
+    
+    @speed.setter
+    def speed(self, value: float):
+        self.store.vx[self.slot] = -value
+    
+    @property
+    def collected(self) -> bool:
+        return not self.store.alive[self.slot]
+    
+    @collected.setter
+    def collected(self, value: bool):
+        self.store.alive[self.slot] = 0 if value else 1
+    
+    def set_position(self, x: int, y: int):
+        """Coloca el objeto en el mundo sin dejar rastro de interpolacion"""
+        self._rect.y = y
+        self.store.place(self.slot, int(x))
+        self.store.y[self.slot] = y
+    
+    def reset_for_reuse(self, x: int, y: int):
+        """Vuelve a poner en juego un objeto liberado (toma un slot nuevo del almacen)"""
+        self._rect.y = y
+        self.slot = self.store.spawn(int(x), y, -DEFAULT_COLLECTIBLE_SPEED, self._rect.width)
+    
+    def update(self, delta_time: float = 1 / SIMULATION_TICK_RATE):
+        """Mueve solo este slot (el spawner mueve a todos juntos con store.step)"""
+        self.store.step_slot(self.slot, delta_time)
+    
+    def release(self):
+        """Devuelve el slot al almacen (hasta reset_for_reuse el objeto no esta en juego)"""
+        self.store.release(self.slot)
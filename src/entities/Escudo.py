@@ -1,11 +1,16 @@
 import pygame
 from typing import List, Optional
 from src.Constantes import *
-from src.entities.Collectible import Collectible
+from src.entities.Collectible import Collectible, CollectibleStoreView
+from src.core.logger import game_log
+
+collision_log = game_log.channel("colisiones")
 
 class Escudo(Collectible):
     """Clase de escudo que hereda de Collectible - proporciona proteccion temporal"""
     
+    __slots__ = ("protection_duration",)
+    
     def __init__(self, resource_manager, *groups, width: int = DEFAULT_PILAS_WIDTH, height: int = DEFAULT_PILAS_HEIGHT):
         super().__init__(resource_manager, "escudo", *groups, width, height)
         
@@ -18,9 +23,9 @@ class Escudo(Collectible):
         if hasattr(robot, 'shield_time'):
             robot.shield_time = self.protection_duration
             robot.has_shield = True
-            print(f"¡Escudo activado! Proteccion por {self.protection_duration} segundos")
+            collision_log.debug("Escudo activado. Proteccion por %s segundos", self.protection_duration)
         else:
-            print("Robot no compatible con sistema de escudo")
+            collision_log.warning("Robot no compatible con sistema de escudo")
     
     def _play_collection_sound(self):
         """Reproduce el sonido de recoleccion de escudo"""
@@ -93,4 +98,10 @@ class Escudo(Collectible):
                 
                 # Dibujar en pantalla
                 ring_rect = ring_surface.get_rect(center=(screen_x, screen_y))
-                screen.blit(ring_surface, ring_rect)
\ No newline at end of file
+                screen.blit(ring_surface, ring_rect)
+
+
+class StoreEscudo(CollectibleStoreView, Escudo):
+    """Escudo del modo almacen (ENTITY_STORE_ENABLED): vista sobre un slot del EntityStore"""
+    
+    __slots__ = ("store", "slot", "_rect")
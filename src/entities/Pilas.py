@@ -1,11 +1,16 @@
 import pygame
 from typing import List, Optional
 from src.Constantes import *
-from src.entities.Collectible import Collectible
+from src.entities.Collectible import Collectible, CollectibleStoreView
+from src.core.logger import game_log
+
+collision_log = game_log.channel("colisiones")
 
 class pilas(Collectible):
     """Clase de pilas que hereda de Collectible"""
     
+    __slots__ = ("energy_amount",)
+    
     def __init__(self, resource_manager, *groups, width: int = DEFAULT_PILAS_WIDTH, height: int = DEFAULT_PILAS_HEIGHT):
         super().__init__(resource_manager, "pila", *groups, width, height)
         
@@ -21,9 +26,9 @@ class pilas(Collectible):
         if hasattr(robot, 'energia_maxima'):
             nueva_energia = min(robot.energia + self.energy_amount, robot.energia_maxima)
             robot.energia = nueva_energia
-            print(f"Energia del robot: {energia_anterior} -> {nueva_energia}")
+            collision_log.debug("Energia del robot: %s -> %s", energia_anterior, nueva_energia)
         
-        print(f"¡Pila recolectada! +{self.energy_amount} segundos de energia")
+        collision_log.debug("Pila recolectada: +%s segundos de energia", self.energy_amount)
     
     def _play_collection_sound(self):
         """Reproduce el sonido de recoleccion de pila"""
@@ -33,4 +38,10 @@ class pilas(Collectible):
     
     def get_effect_info(self) -> str:
         """Retorna informacion sobre el efecto de la pila"""
-        return f"Restaura {self.energy_amount} puntos de energia"
\ No newline at end of file
+        return f"Restaura {self.energy_amount} puntos de energia"
+
+
+class StorePilas(CollectibleStoreView, pilas):
+    """Pila del modo almacen (ENTITY_STORE_ENABLED): vista sobre un slot del EntityStore"""
+    
+    __slots__ = ("store", "slot", "_rect")
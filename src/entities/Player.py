@@ -1,10 +1,37 @@
 import pygame
-from typing import Callable, List, Optional, Dict
+from typing import Callable, List, Optional, Dict, Tuple
 from src.Constantes import *
+from src.core.logger import game_log
+from src.core.kinematics import substeps, tick_scale
+from src.core.texture_atlas import AtlasRegion
+
+player_log = game_log.channel("jugador")
 
 class Player:
     """Player con sistema de escudo integrado"""
     
+    # Todos los campos declarados de antemano: sin __dict__ por instancia y acceso mas rapido
+    __slots__ = (
+        # Posicion y recursos
+        "rect", "resource_manager", "x", "y", "previous_x", "previous_y",
+        "original_position_x", "original_position_y",
+        # Personajes
+        "personajes", "stats", "personaje_actual",
+        # Entrada (anti-spam)
+        "c_key_pressed", "space_key_pressed", "z_key_pressed",
+        # Fisica
+        "velocity_y", "gravity", "on_ground", "double_jump_used", "can_double_jump", "jump_strength",
+        # Animacion
+        "animation_frame", "animation_timer", "animation_speed", "animation_frames", "has_animation",
+        "_character_frames", "_cached_character", "current_sprite",
+        # Dash
+        "dash_speed", "dash_duration", "dash_timer", "is_dashing", "dash_cooldown", "dash_cooldown_timer",
+        # Escudo
+        "has_shield", "shield_time", "shield_collision_effect_time", "max_shield_time",
+        # Cache del GameRenderer: rect del frame actual en pantalla
+        "current_sprite_rect",
+    )
+    
     def __init__(self, initial_x: int, initial_y: int, gravity: float, resource_manager, initial_character: str = 'UIAbot'):
         """
         Args:
@@ -18,6 +45,14 @@ class Player:
         self.rect = pygame.Rect(initial_x, initial_y, 32, 32)
         self.resource_manager = resource_manager
         
+        # Posicion real en float (el rect queda redondeado a pixeles)
+        self.x = float(self.rect.x)
+        self.y = float(self.rect.y)
+        
+        # Posicion en el tick anterior (para interpolar el renderizado)
+        self.previous_x = initial_x
+        self.previous_y = initial_y
+        
         # Posicion original para volver tras el dash
         self.original_position_x = initial_x
         self.original_position_y = initial_y
@@ -63,7 +98,7 @@ class Player:
         else:
             self.personaje_actual = 0  # Default a UIAbot si no se encuentra
 
-        print(f"Player iniciado con personaje: {self.personajes[self.personaje_actual]} (indice: {self.personaje_actual})")
+        player_log.info("Player iniciado con personaje: %s (indice: %d)", self.personajes[self.personaje_actual], self.personaje_actual)
         self.on_ground = True  
         
         # Variable para detectar tecla C presionada (evitar spam)
@@ -83,9 +118,11 @@ class Player:
         #Sistema de escudo
         self._init_shield_system()
         
-        # Cargar sprites y preparar animacion
+        # Cargar sprites de todos los personajes y preparar animacion
+        self._prewarm_characters()
         self._load_animation_frames()
         self.current_sprite = None
+        self.current_sprite_rect: Optional[pygame.Rect] = None
         self._update_sprite()
     
     def _init_shield_system(self):
@@ -102,7 +139,7 @@ class Player:
             if self.shield_time <= 0:
                 self.has_shield = False
                 self.shield_time = 0.0
-                print("Escudo desactivado")
+                player_log.debug("Escudo desactivado")
         
         # Actualizar efecto de colision del escudo
         if self.shield_collision_effect_time > 0:
@@ -114,7 +151,7 @@ class Player:
             self.shield_collision_effect_time = SHIELD_EFFECT_DURATION
             # Reducir un poco el tiempo de escudo al usarse
             self.shield_time = max(0, self.shield_time - 0.5)
-            print("¡Escudo absorbe colision!")
+            player_log.debug("Escudo absorbe colision")
             
             # Reproducir sonido de impacto del escudo
             self.resource_manager.play_sound("shield_hit")
@@ -163,10 +200,11 @@ class Player:
         self.animation_frame = 0
         self.animation_timer = 0
         self.animation_speed = PLAYER_ANIMATION_SPEED  # Usar constante
-        self.animation_frames: List[pygame.Surface] = []
+        self.animation_frames: Tuple[AtlasRegion, ...] = ()  # Regiones del atlas de sprites
         self.has_animation = False
         
-        # Cache para evitar recargar innecesariamente
+        # Frames de cada personaje: nombre -> (frames, tiene_animacion); se llena en _prewarm_characters
+        self._character_frames: Dict[str, Tuple[Tuple[AtlasRegion, ...], bool]] = {}
         self._cached_character = None
     
     def _init_dash_system(self):
@@ -181,46 +219,55 @@ class Player:
         self.dash_cooldown = stats["dash_cooldown"]
         self.dash_cooldown_timer = 0
     
-    def _load_animation_frames(self):
-        """Carga los frames de animacion - optimizado para evitar recargas innecesarias"""
-        current_character_name = self.personajes[self.personaje_actual]
-        
-        # Solo recargar si cambio el personaje
-        if self._cached_character == current_character_name:
-            return
-            
-        spritesheet_name = f"{current_character_name}_walk"
+    def _prewarm_characters(self):
+        """Prepara los frames de los cuatro personajes para que cambiar con C no cargue nada"""
+        for character_name in self.personajes:
+            self._character_frames[character_name] = self._build_character_frames(character_name)
 
-        print(f"Cargando animacion para personaje: {current_character_name}")
+    def _build_character_frames(self, character_name: str) -> Tuple[Tuple[AtlasRegion, ...], bool]:
+        """Arma la tabla de frames de un personaje: (frames, tiene_animacion)"""
+        spritesheet_name = f"{character_name}_walk"
         
         # intentar cargar spritesheet con animacion
         spritesheet = self.resource_manager.get_spritesheet(spritesheet_name)
-        
         if spritesheet:
-            frames = self.resource_manager.get_animation_frames(
+            frames = self.resource_manager.get_frame_regions(
                 spritesheet_name, 
                 SPRITESHEET_START_COLUMN, 
                 SPRITESHEET_END_COLUMN, 
                 SPRITESHEET_ROW
             )
-            self.animation_frames = frames
-            self.has_animation = True
-        else:
-            # intenta cargar imagen estatica
-            character_image = self.resource_manager.get_image(spritesheet_name)
-            if character_image:
-                scaled_image = pygame.transform.scale(
-                    character_image, 
-                    (PLAYER_SPRITE_WIDTH, PLAYER_SPRITE_HEIGHT)
-                )
-                self.animation_frames = [scaled_image]
-                self.has_animation = False
-            else:
-                # crear placeholder si no se encuentra la imagen
-                placeholder = pygame.Surface((PLAYER_SPRITE_WIDTH, PLAYER_SPRITE_HEIGHT))
-                placeholder.fill((255, 0, 255))  # Magenta para debug
-                self.animation_frames = [placeholder]
-                self.has_animation = False
+            if frames:
+                return tuple(frames), True
+
+        # intenta cargar imagen estatica
+        character_image = self.resource_manager.get_image(spritesheet_name)
+        if character_image:
+            scaled_image = pygame.transform.scale(
+                character_image, 
+                (PLAYER_SPRITE_WIDTH, PLAYER_SPRITE_HEIGHT)
+            )
+            return (AtlasRegion.from_surface(scaled_image),), False
+
+        # crear placeholder si no se encuentra la imagen
+        player_log.debug("Sin sprites para personaje: %s, usando placeholder", character_name)
+        placeholder = pygame.Surface((PLAYER_SPRITE_WIDTH, PLAYER_SPRITE_HEIGHT))
+        placeholder.fill((255, 0, 255))  # Magenta para debug
+        return (AtlasRegion.from_surface(placeholder),), False
+
+    def _load_animation_frames(self):
+        """Activa los frames del personaje actual (ya preparados, no crea superficies)"""
+        current_character_name = self.personajes[self.personaje_actual]
+        
+        # Solo cambiar si cambio el personaje
+        if self._cached_character == current_character_name:
+            return
+
+        entry = self._character_frames.get(current_character_name)
+        if entry is None:
+            entry = self._build_character_frames(current_character_name)
+            self._character_frames[current_character_name] = entry
+        self.animation_frames, self.has_animation = entry
         
         self._cached_character = current_character_name
         self.animation_frame = 0  # Resetear animacion
@@ -298,14 +345,23 @@ class Player:
             self.velocity_y = self.jump_strength * 0.8  # Doble salto es un poco mas debil
             self.double_jump_used = True
             self.resource_manager.play_sound("salto")
-    def update(self, delta_time: float = 1/60, keys_pressed=None, energy_callback: Callable[[float], bool] = None):    
+    def update(self, delta_time: float = 1 / SIMULATION_TICK_RATE, keys_pressed=None, energy_callback: Callable[[float], bool] = None):    
         """
         Actualiza la fisica y animacion del jugador - mejorado con anti-spam y sistema de escudo
         """
-        self._update_cooldowns(delta_time)
-        self._update_dash_movement(delta_time)
-        self._update_return_to_origin(delta_time)
-        self._update_vertical_physics(delta_time)
+        self._sync_position()
+        self.previous_x = self.rect.x
+        self.previous_y = self.rect.y
+        
+        # Con ticks largos la fisica avanza en subpasos: el salto y el dash quedan iguales
+        step_count, step_dt = substeps(delta_time)
+        for _ in range(step_count):
+            self._update_cooldowns(step_dt)
+            self._update_dash_movement(step_dt)
+            self._update_return_to_origin(step_dt)
+            self._update_vertical_physics(step_dt)
+        self.rect.x = round(self.x)
+        self.rect.y = round(self.y)
         self._update_animation_if_grounded(delta_time)
         
         #Actualizar sistema de escudo
@@ -340,6 +396,17 @@ class Player:
             
             self.resource_manager.play_sound("cambio_personaje")
 
+    def _sync_position(self):
+        """Si algo movio el rect desde afuera (empuje del escudo), la posicion real lo sigue"""
+        if self.rect.x != round(self.x):
+            self.x = float(self.rect.x)
+        if self.rect.y != round(self.y):
+            self.y = float(self.rect.y)
+    
+    def get_previous_rect(self) -> pygame.Rect:
+        """Rect del jugador al empezar el ultimo tick"""
+        return self.rect.move(self.previous_x - self.rect.x, self.previous_y - self.rect.y)
+
     def get_current_character(self):
         """Retorna el nombre del personaje actual"""
         return self.personajes[self.personaje_actual]
@@ -353,7 +420,7 @@ class Player:
         """Maneja el movimiento durante el dash"""
         if self.is_dashing:
             self.dash_timer -= delta_time
-            self.rect.x += self.dash_speed
+            self.x += self.dash_speed * tick_scale(delta_time)
             
             if self.dash_timer <= 0:
                 self.is_dashing = False
@@ -361,30 +428,33 @@ class Player:
     def _update_return_to_origin(self, delta_time: float):
         """Maneja el retorno gradual a la posicion original usando constantes"""
         if not self.is_dashing:
-            distance_from_origin = self.rect.x - self.original_position_x
+            distance_from_origin = self.x - self.original_position_x
             
             if abs(distance_from_origin) > POSITION_TOLERANCE:
-                self._move_towards_origin(distance_from_origin)
+                self._move_towards_origin(distance_from_origin, delta_time)
     
-    def _move_towards_origin(self, distance_from_origin: float):
+    def _move_towards_origin(self, distance_from_origin: float, delta_time: float = 1 / SIMULATION_TICK_RATE):
         """Mueve al jugador gradualmente hacia su posicion original usando constantes"""
+        max_step = RETURN_TO_ORIGIN_SPEED * tick_scale(delta_time)
         if distance_from_origin > 0:
-            return_speed = min(RETURN_TO_ORIGIN_SPEED, distance_from_origin)
-            self.rect.x -= return_speed
+            return_speed = min(max_step, distance_from_origin)
+            self.x -= return_speed
         else:
-            return_speed = min(RETURN_TO_ORIGIN_SPEED, abs(distance_from_origin))
-            self.rect.x += return_speed
+            return_speed = min(max_step, abs(distance_from_origin))
+            self.x += return_speed
     
     def _update_vertical_physics(self, delta_time: float):
         """Actualiza la fisica vertical (gravedad y colision con suelo)"""
-        self.velocity_y += self.gravity
-        self.rect.y += self.velocity_y
+        scale = tick_scale(delta_time)
+        self.velocity_y += self.gravity * scale
+        self.y += self.velocity_y * scale
         
-        if self.rect.y >= self.original_position_y:
+        if self.y >= self.original_position_y:
             self._land_on_ground()
     
     def _land_on_ground(self):
         """Maneja el aterrizaje del jugador en el suelo"""
+        self.y = float(self.original_position_y)
         self.rect.y = self.original_position_y
         self.velocity_y = 0
         self.on_ground = True
@@ -6,6 +6,10 @@ from src.UI.button import Button
 class ModeScreen(Scene):
     """Pantalla para elegir modo de juego"""
     
+    # Solo cambian los botones y el fondo: se suben a pantalla solo esas regiones
+    uses_dirty_rects = True
+    fps_cap = MENU_FPS_CAP
+    
     def __init__(self, screen, resource_manager,scene_manager):
         super().__init__(screen, resource_manager,scene_manager)
         self.buttons = []
@@ -46,15 +50,15 @@ class ModeScreen(Scene):
         """Dibuja texto con borde"""
         x, y = pos
         # Dibujar el borde
+        border_surface = self.resource_manager.render_text(font, text, border_color)
         for dx, dy in [(dx, dy) for dx in range(-border_size, border_size + 1) 
                                 for dy in range(-border_size, border_size + 1)
                                 if dx*dx + dy*dy <= border_size*border_size]:
-            text_surface = font.render(text, True, border_color)
-            text_rect = text_surface.get_rect(center=(x + dx, y + dy))
-            self.screen.blit(text_surface, text_rect)
+            text_rect = border_surface.get_rect(center=(x + dx, y + dy))
+            self.screen.blit(border_surface, text_rect)
         
         # Dibujar el texto principal
-        text_surface = font.render(text, True, text_color)
+        text_surface = self.resource_manager.render_text(font, text, text_color)
         text_rect = text_surface.get_rect(center=(x, y))
         self.screen.blit(text_surface, text_rect)
 
@@ -99,36 +103,39 @@ class ModeScreen(Scene):
         """Actualiza la pantalla de configuracion"""
         # Actualizar botones
         for button in self.buttons:
-            button.update(dt)
+            if button.update(dt):
+                self.mark_dirty(button.get_bounds())
         
         # ACTUALIZAR ANIMACIoN DE FONDO
         self.background_timer += dt
         if self.background_timer >= self.animation_speed:
             self.background_timer = 0.0
             self.current_background = 1 - self.current_background  # Alternar entre 0 y 1
+            self.request_full_redraw()
         
 
     def draw(self):
         """Dibuja la pantalla de configuracion con fondo animado"""
         # DIBUJAR FONDO ANIMADO
         background_name = f"menu_background{self.current_background + 1}"
-        background_image = self.resource_manager.get_image(background_name)
+        background_image = self.resource_manager.get_scaled_image(background_name, (ANCHO_PANTALLA, ALTO_PANTALLA))
         
         if background_image:
-            # Escalar la imagen al tamaño de la pantalla
-            scaled_background = pygame.transform.scale(background_image, (ANCHO_PANTALLA, ALTO_PANTALLA))
-            self.screen.blit(scaled_background, (0, 0))
+            self.screen.blit(background_image, (0, 0))
             
             fade_duration = 0.5  
             if self.background_timer <= fade_duration:
                 # Mostrar la imagen anterior con fade out
                 other_bg_name = f"settings_bg{(1 - self.current_background) + 1}"
-                other_bg = self.resource_manager.get_image(other_bg_name)
+                other_bg = self.resource_manager.get_scaled_image(other_bg_name, (ANCHO_PANTALLA, ALTO_PANTALLA))
                 if other_bg:
                     alpha = int(255 * (1 - self.background_timer / fade_duration))
-                    other_bg_scaled = pygame.transform.scale(other_bg, (ANCHO_PANTALLA, ALTO_PANTALLA))
-                    other_bg_scaled.set_alpha(alpha)
-                    self.screen.blit(other_bg_scaled, (0, 0))
+                    # La copia escalada es compartida: despues del blit vuelve a su alpha original
+                    # (set_alpha(None) le quitaria la transparencia por pixel)
+                    original_alpha = other_bg.get_alpha()
+                    other_bg.set_alpha(alpha)
+                    self.screen.blit(other_bg, (0, 0))
+                    other_bg.set_alpha(original_alpha)
         else:
             # Si no hay imagen, usar color de fondo por defecto
             self.screen.fill(COLOR_FONDO_BASE)
@@ -148,7 +155,7 @@ class ModeScreen(Scene):
         # Ayuda - tambien a la izquierda
         font_pequeña = self.resource_manager.get_font('pequeña')
         if font_pequeña:
-            help_surface = font_pequeña.render("Presiona ESC para volver", True, COLOR_TEXTO_SUTIL_EN_FONDO)
+            help_surface = self.resource_manager.render_text(font_pequeña, "Presiona ESC para volver", COLOR_TEXTO_SUTIL_EN_FONDO)
             help_rect = help_surface.get_rect(center=(ANCHO_PANTALLA // 5, 180))
             self.screen.blit(help_surface, help_rect)
 
@@ -6,6 +6,10 @@ from src.UI.button import Button
 class CharacterScreen(Scene):
     """Pantalla de seleccion de personaje con carrusel manual"""
     
+    # Solo cambian los botones y el cartel: se suben a pantalla solo esas regiones
+    uses_dirty_rects = True
+    fps_cap = MENU_FPS_CAP
+    
     def __init__(self, screen, resource_manager,scene_manager):
         super().__init__(screen, resource_manager,scene_manager)
         self.selected_character = None
@@ -24,11 +28,12 @@ class CharacterScreen(Scene):
             int(original_area.height * scale_y)
         )
 
+        # (personaje, imagen del cartel)
         self.characters = [
-            ("UIAbot", self.resource_manager.get_image("cartel_uaibot")),
-            ("UAIBOTA", self.resource_manager.get_image("cartel_uaibota")),
-            ("UAIBOTINA", self.resource_manager.get_image("cartel_uaibotina")),
-            ("UAIBOTINO", self.resource_manager.get_image("cartel_uaibotino")),
+            ("UIAbot", "cartel_uaibot"),
+            ("UAIBOTA", "cartel_uaibota"),
+            ("UAIBOTINA", "cartel_uaibotina"),
+            ("UAIBOTINO", "cartel_uaibotino"),
         ]
         self.current_index = 0
 
@@ -42,7 +47,8 @@ class CharacterScreen(Scene):
 
     def _update_current_character(self):
         """Carga y escala el personaje actual al billboard"""
-        name, image = self.characters[self.current_index]
+        name, image_name = self.characters[self.current_index]
+        image = self.resource_manager.get_image(image_name)
         if image:
             card_rect = image.get_rect()
             scale_ratio = min(
@@ -52,7 +58,8 @@ class CharacterScreen(Scene):
             new_width = int(card_rect.width * scale_ratio * 1.16)
             new_height = int(card_rect.height * scale_ratio)
 
-            self.character_scaled = pygame.transform.scale(image, (new_width, new_height))
+            # Volver a un personaje ya visto no lo reescala
+            self.character_scaled = self.resource_manager.get_scaled_image(image_name, (new_width, new_height))
             self.character_rect = self.character_scaled.get_rect(center=self.billboard_area.center)
             self.selected_character = name  
         else:
@@ -95,11 +102,13 @@ class CharacterScreen(Scene):
         """Muestra el siguiente personaje"""
         self.current_index = (self.current_index + 1) % len(self.characters)
         self._update_current_character()
+        self.request_full_redraw()
 
     def _prev_character(self):
         """Muestra el personaje anterior"""
         self.current_index = (self.current_index - 1) % len(self.characters)
         self._update_current_character()
+        self.request_full_redraw()
     
     def _select_character(self):
         """Confirma la seleccion del personaje y guarda la eleccion"""
@@ -157,30 +166,30 @@ class CharacterScreen(Scene):
     def update(self, dt):
         """Actualiza la pantalla"""
         for button in self.buttons:
-            button.update(dt)
+            if button.update(dt):
+                self.mark_dirty(button.get_bounds())
     
     def _draw_bordered_text(self, text: str, font: pygame.font.Font, pos: tuple,
                            text_color: tuple, border_color: tuple, border_size: int = 2):
         """Dibuja texto con borde"""
         x, y = pos
+        border_surface = self.resource_manager.render_text(font, text, border_color)
         for dx, dy in [(dx, dy) for dx in range(-border_size, border_size + 1)
                                 for dy in range(-border_size, border_size + 1)
                                 if dx*dx + dy*dy <= border_size*border_size]:
-            text_surface = font.render(text, True, border_color)
-            text_rect = text_surface.get_rect(center=(x + dx, y + dy))
-            self.screen.blit(text_surface, text_rect)
+            text_rect = border_surface.get_rect(center=(x + dx, y + dy))
+            self.screen.blit(border_surface, text_rect)
 
-        text_surface = font.render(text, True, text_color)
+        text_surface = self.resource_manager.render_text(font, text, text_color)
         text_rect = text_surface.get_rect(center=(x, y))
         self.screen.blit(text_surface, text_rect)
     
     def draw(self):
         """Dibuja la pantalla de seleccion de personaje"""
         # Fondo 
-        billboard_image = self.resource_manager.get_image("cartel")
+        billboard_image = self.resource_manager.get_scaled_image("cartel", (ANCHO_PANTALLA, ALTO_PANTALLA))
         if billboard_image:
-            scaled_billboard = pygame.transform.scale(billboard_image, (ANCHO_PANTALLA, ALTO_PANTALLA))
-            self.screen.blit(scaled_billboard, (0, 0))
+            self.screen.blit(billboard_image, (0, 0))
         else:
             self.screen.fill(COLOR_FONDO_BASE)
         
@@ -6,6 +6,10 @@ from src.UI.button import Button
 class ControlsScreen(Scene):
     """Pantalla que muestra los controles del juego"""
     
+    # Solo cambian los botones y el fondo: se suben a pantalla solo esas regiones
+    uses_dirty_rects = True
+    fps_cap = MENU_FPS_CAP
+    
     def __init__(self, screen, resource_manager, scene_manager):
         super().__init__(screen, resource_manager, scene_manager)
         self.buttons = []
@@ -46,16 +50,16 @@ class ControlsScreen(Scene):
             
             # Crear superficie para la tecla
             if font_controles:
-                tecla_surface = font_controles.render(f"[{tecla}]", True, COLOR_AMARILLO)
+                tecla_surface = self.resource_manager.render_text(font_controles, f"[{tecla}]", COLOR_AMARILLO)
                 tecla_rect = tecla_surface.get_rect(center=(start_x - 200, y_pos))
                 
                 # Crear superficie para la accion
-                accion_surface = font_controles.render(accion, True, COLOR_BLANCO)
+                accion_surface = self.resource_manager.render_text(font_controles, accion, COLOR_BLANCO)
                 accion_rect = accion_surface.get_rect(center=(start_x, y_pos))
                 
                 # Crear superficie para la descripcion
                 if font_descripcion:
-                    desc_surface = font_descripcion.render(descripcion, True, COLOR_TEXTO_SUTIL_EN_FONDO)
+                    desc_surface = self.resource_manager.render_text(font_descripcion, descripcion, COLOR_TEXTO_SUTIL_EN_FONDO)
                     desc_rect = desc_surface.get_rect(center=(start_x, y_pos + 25))
                     
                     self.control_elements.extend([
@@ -97,24 +101,24 @@ class ControlsScreen(Scene):
         """Actualiza la pantalla de controles"""
         # Actualizar botones
         for button in self.buttons:
-            button.update(dt)
+            if button.update(dt):
+                self.mark_dirty(button.get_bounds())
         
         # Actualizar animacion de fondo
         self.background_timer += dt
         if self.background_timer >= self.animation_speed:
             self.background_timer = 0.0
             self.current_background = 1 - self.current_background  # Alternar entre 0 y 1
+            self.request_full_redraw()
     
     def draw(self):
         """Dibuja la pantalla de controles con fondo animado"""
         # Dibujar fondo animado
         background_name = f"menu_background{self.current_background + 1}"
-        background_image = self.resource_manager.get_image(background_name)
+        background_image = self.resource_manager.get_scaled_image(background_name, (ANCHO_PANTALLA, ALTO_PANTALLA))
         
         if background_image:
-            # Escalar la imagen al tamaño de la pantalla
-            scaled_background = pygame.transform.scale(background_image, (ANCHO_PANTALLA, ALTO_PANTALLA))
-            self.screen.blit(scaled_background, (0, 0))
+            self.screen.blit(background_image, (0, 0))
         else:
             # Si no hay imagen, usar color de fondo por defecto
             self.screen.fill(COLOR_FONDO_BASE)
@@ -122,7 +126,7 @@ class ControlsScreen(Scene):
         # Titulo principal
         font_titulo = self.resource_manager.get_font('titulo')
         if font_titulo:
-            title_surface = font_titulo.render("Controles", True, COLOR_AMARILLO)
+            title_surface = self.resource_manager.render_text(font_titulo, "Controles", COLOR_AMARILLO)
             title_rect = title_surface.get_rect(center=(ANCHO_PANTALLA // 2, 80))
             self.screen.blit(title_surface, title_rect)
         
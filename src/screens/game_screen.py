@@ -8,10 +8,18 @@ from src.systems.car_spawner import CarSpawner
 from src.systems.Collectible_spawner import CollectibleSpawner
 from src.systems.game_renderer import GameRenderer
 from src.systems.avion_spawn import PlaneSpawner
+from src.core.profiler import frame_profiler
+from src.core.rng import rng_service
+from src.core.replay import replay_session
+from src.core.logger import game_log
 import csv
 import os
 from datetime import datetime
 
+collision_log = game_log.channel("colisiones")
+run_log = game_log.channel("partida")
+player_log = game_log.channel("jugador")
+
 class GameScreen(Scene):
     """Pantalla principal del juego donde UAIBOT corre, esquiva autos y usa escudos"""
     
@@ -20,6 +28,13 @@ class GameScreen(Scene):
         
         self.scene_manager = scene_manager
         
+        # Semilla de la partida: se fija antes de crear los sistemas que usan aleatoriedad.
+        # shared_data['run_seed'] permite repetir exactamente la misma partida
+        gm = getattr(self.scene_manager, 'game_manager', None)
+        shared = getattr(gm, 'shared_data', None) or {}
+        self.run_seed = rng_service.new_run(shared.get('run_seed'))
+        run_log.info("Semilla de partida: %d", self.run_seed)
+        
         # Sistemas principales
         self.camera = Camera(PANTALLA_ANCHO, PANTALLA_ALTO)
         self.car_spawner = CarSpawner(resource_manager)
@@ -82,6 +97,11 @@ class GameScreen(Scene):
         else:
             self.kilometers_remaining = KILOMETROS_OBJETIVO
             print(f"Modo normal {KILOMETROS_OBJETIVO} km")
+        
+        # Grabacion o reproduccion de la entrada (--record / --replay); None si no hay
+        self.input_tape = replay_session.begin_run(
+            self.run_seed, getattr(gm, 'tick_rate', SIMULATION_TICK_RATE),
+            {"scene": "game", "game_mode": self.game_mode, "selected_character": selected_character})
     
     def _inicializar_distancias_personajes(self):
         """Inicializa el tracking de distancia para cada personaje"""
@@ -106,6 +126,8 @@ class GameScreen(Scene):
     def _handle_gameplay_events(self, event: pygame.event.Event):
         """Maneja eventos durante el juego activo"""
         if event.type == pygame.KEYDOWN:
+            if self.input_tape and not self.input_tape.accept_keydown(event):
+                return
             if event.key == pygame.K_SPACE and not self.pause:
                 self.player.jump()
             elif event.key == pygame.K_z and not self.pause:
@@ -129,13 +151,22 @@ class GameScreen(Scene):
         self.energy_remaining = self.energias_individuales[personaje_actual] 
         self.player.obtener_autonomia_maxima()
         
-        print(f"Cambio a {personaje_actual}")
-        print(f"Energia {personaje_actual}: {self.energy_remaining}")
+        player_log.debug("Cambio a %s (energia %s)", personaje_actual, self.energy_remaining)
         
         # Actualizar el ultimo personaje activo para el tracking
         self.ultimo_personaje_activo = personaje_actual
     
     def update(self, delta_time: float):
+        """Avanza un tick, inyectando o grabando la entrada si hay un replay activo"""
+        if self.input_tape is None:
+            self._update_tick(delta_time)
+            return
+        for key in self.input_tape.begin_tick():
+            self.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, replayed=True))
+        self._update_tick(delta_time)
+        self.input_tape.end_tick()
+    
+    def _update_tick(self, delta_time: float):
         """Para que no se reinicie al entrar en pausa"""
         if self.pause:
             return
@@ -150,6 +181,10 @@ class GameScreen(Scene):
             # Actualizar tracking de distancias
             self._update_distance_tracking(delta_time)
        
+    def _is_simulating(self) -> bool:
+        """Indica si el mundo se esta moviendo (no pausado ni terminado)"""
+        return not self.pause and not self.game_over and not self.victory
+    
     def _update_distance_tracking(self, delta_time: float):
         """Actualiza el tracking de distancia del personaje actual"""
         personaje_actual = self.player.get_current_character()
@@ -177,7 +212,7 @@ class GameScreen(Scene):
 
     def _update_entities(self, delta_time: float):
         """Actualiza entidades del juego"""
-        keys = pygame.key.get_pressed()
+        keys = self.input_tape.get_pressed() if self.input_tape else pygame.key.get_pressed()
         
         personaje_antes = self.player.get_current_character()   
         self.energias_individuales[personaje_antes] = self.energy_remaining
@@ -205,7 +240,8 @@ class GameScreen(Scene):
             self.camera.x, 
             self.player.rect.x, 
             self.player.rect, 
-            collectible_callback
+            collectible_callback,
+            self.player.get_previous_rect()
         )
     
     def agregar_energia(self, cantidad):
@@ -230,7 +266,7 @@ class GameScreen(Scene):
             pass
         else:
             # Verificar colisiones
-            if self.car_spawner.check_collisions(self.player.rect):
+            if self.car_spawner.check_collisions(self.player.rect, self.player.get_previous_rect()):
                 # Considerar absorbida si el jugador tiene escudo activo O si
                 # aun esta el efecto visual de absorcion (por timing)
                 if self.player.is_protected() or self.player.should_show_collision_effect():
@@ -245,7 +281,7 @@ class GameScreen(Scene):
                     except Exception:
                         pass
 
-                    print("¡Escudo protegio de la colision!")
+                    collision_log.debug("Escudo protegio de la colision")
                     # No procesar game over
                     return
                 else:
@@ -309,9 +345,21 @@ class GameScreen(Scene):
         self.resource_manager.play_music("game_music", volume=0.6)
     
     def on_exit(self):
+        replay_session.end_run()
         pygame.mixer.stop()  
         print("Sonidos detenidos al salir del juego")
     
+    def get_memory_caches(self):
+        """Fondos escalados del renderer y frames del avion"""
+        return {"fondos de la partida": list(self.renderer.scaled_backgrounds.values()),
+                "aviones": [frame.page for frame in self.plane_spawner.plane_frames]}
+    
+    def on_focus_lost(self):
+        """Pausa automaticamente si la ventana pasa a segundo plano en plena partida"""
+        # Con un replay activo la pausa no quedaria en la grabacion y romperia la reproduccion
+        if self._is_simulating() and self.input_tape is None:
+            self.pause = True
+    
     def _save_game_statistics(self):
         """Guarda las estadisticas de la partida en un archivo CSV"""
         try:
@@ -398,41 +446,55 @@ class GameScreen(Scene):
     
     def draw(self):
         """Dibuja todos los elementos visuales"""
-        self.renderer.draw_background(self.camera.x)
-        self.renderer.draw_floor()
-        self.renderer.draw_player(self.player, self.camera.x)
-        self.renderer.draw_cars(self.car_spawner.get_cars(), self.camera.x)
-        self.renderer.draw_planes(self.plane_spawner.get_planes(), self.camera.x)
+        # Interpolar solo mientras la simulacion avanza; en pausa o fin de juego
+        # las posiciones estan congeladas en el ultimo tick
+        alpha = self.interpolation if self._is_simulating() else 1.0
+        self.renderer.set_interpolation(alpha)
+        camera_x = self.camera.get_interpolated_x(alpha)
+        
+        with frame_profiler.section("draw_background"):
+            self.renderer.draw_background(camera_x)
+        with frame_profiler.section("draw_floor"):
+            self.renderer.draw_floor()
+        with frame_profiler.section("draw_player"):
+            self.renderer.draw_player(self.player, camera_x)
+        with frame_profiler.section("draw_cars"):
+            self.renderer.draw_cars(self.car_spawner.get_visible_cars(camera_x), camera_x)
+        with frame_profiler.section("draw_planes"):
+            self.renderer.draw_planes(self.plane_spawner.get_planes(), camera_x)
         
         #Usar el metodo unificado para dibujar todos los coleccionables
-        self.renderer.draw_collectibles(self.collectible_spawner.get_collectibles(), self.camera.x)
+        with frame_profiler.section("draw_collectibles"):
+            self.renderer.draw_collectibles(self.collectible_spawner.get_visible_collectibles(camera_x), camera_x)
         
         # Dibujar UI
         if not self.game_over and not self.victory:
             autonomia_maxima_actual = self.player.obtener_autonomia_maxima()
             #Pasar informacion del escudo al HUD
-            self.hud.draw(self.screen, self.energy_remaining, 
-                         autonomia_maxima_actual, self.kilometers_remaining,
-                         self.distancias_personajes, self.game_mode,
-                         self.player.get_shield_time_remaining())  # Tiempo de escudo restante
+            with frame_profiler.section("hud"):
+                self.hud.draw(self.screen, self.energy_remaining, 
+                             autonomia_maxima_actual, self.kilometers_remaining,
+                             self.distancias_personajes, self.game_mode,
+                             self.player.get_shield_time_remaining())  # Tiempo de escudo restante
         
         # Dibujar pantallas de fin de juego
         if self.game_over:
-            self.renderer.draw_game_over_screen()
+            with frame_profiler.section("draw_game_over_screen"):
+                self.renderer.draw_game_over_screen()
         elif self.victory:
-            self.renderer.draw_victory_screen()
+            with frame_profiler.section("draw_victory_screen"):
+                self.renderer.draw_victory_screen()
         if self.pause and not self.game_over and not self.victory:
             overlay = pygame.Surface((PANTALLA_ANCHO, PANTALLA_ALTO))
             overlay.set_alpha(150)
             overlay.fill((0, 0, 0))
             self.screen.blit(overlay, (0, 0))
 
-            font = pygame.font.SysFont(None, 60)
-            text = font.render("Juego Pausado", True, (255, 255, 255))
+            text = self.resource_manager.render_text('pausa', "Juego Pausado", (255, 255, 255))
             rect = text.get_rect(center=(PANTALLA_ANCHO // 2, PANTALLA_ALTO // 2))
             self.screen.blit(text, rect)
 
-            font_small = pygame.font.SysFont(None, 36)
-            text2 = font_small.render("Presiona R para continuar o ESC para volver al menu", True, (200, 200, 200))
+            text2 = self.resource_manager.render_text('pausa_detalle', "Presiona R para continuar o ESC para volver al menu",
+                                                      (200, 200, 200))
             rect2 = text2.get_rect(center=(PANTALLA_ANCHO // 2, PANTALLA_ALTO // 2 + 60))
             self.screen.blit(text2, rect2)
\ No newline at end of file
@@ -11,15 +11,38 @@ from src.systems.car_spawner import CarSpawner
 from src.systems.Collectible_spawner import CollectibleSpawner
 from src.systems.game_renderer import GameRenderer
 from src.systems.ability_system import ability_system
+from src.core.profiler import frame_profiler
+from src.core.rng import rng_service
+from src.core.replay import replay_session
+from src.core.logger import game_log
+
+collision_log = game_log.channel("colisiones")
+run_log = game_log.channel("partida")
 
 class MissionGameScreen(Scene):
     """Pantalla de juego especifica para misiones con sistema de habilidades"""
     
+    @classmethod
+    def required_assets(cls, game_manager):
+        """La mision 4 se juega de noche: suma esos fondos"""
+        assets = tuple(super().required_assets(game_manager))
+        shared_data = getattr(game_manager, 'shared_data', None) or {}
+        if shared_data.get('selected_level', 'level_1') == 'level_4':
+            return assets + NIGHT_ASSETS
+        return assets
+    
     def __init__(self, screen: pygame.Surface, resource_manager, scene_manager):
         super().__init__(screen, resource_manager, scene_manager)
         
         self.scene_manager = scene_manager
         
+        # Semilla de la partida: se fija antes de crear los sistemas que usan aleatoriedad.
+        # shared_data['run_seed'] permite repetir exactamente la misma partida
+        gm = getattr(self.scene_manager, 'game_manager', None)
+        shared = getattr(gm, 'shared_data', None) or {}
+        self.run_seed = rng_service.new_run(shared.get('run_seed'))
+        run_log.info("Semilla de partida: %d", self.run_seed)
+        
         # Sistemas principales
         self.camera = Camera(PANTALLA_ANCHO, PANTALLA_ALTO)
         self.car_spawner = CarSpawner(resource_manager)
@@ -47,6 +70,15 @@ class MissionGameScreen(Scene):
         except Exception as e:
             print(f"Error al obtener datos de mision: {e}")
         
+        # Grabacion o reproduccion de la entrada (--record / --replay); None si no hay.
+        # Las habilidades se guardan porque cambian la partida (dash, doble salto, pilas)
+        self.input_tape = replay_session.begin_run(
+            self.run_seed, getattr(gm, 'tick_rate', SIMULATION_TICK_RATE),
+            {"scene": "mission", "selected_level": self.mission_key,
+             "selected_character": selected_character,
+             "unlocked_abilities": sorted(ability_system.get_unlocked_abilities()),
+             "completed_missions": sorted(ability_system.get_completed_missions())})
+        
         # Configurar modo noche SOLO después de tener mission_key
         if self.mission_key == 'level_4':
             self.renderer.set_night_mode(True)
@@ -128,6 +160,8 @@ class MissionGameScreen(Scene):
     def _handle_gameplay_events(self, event: pygame.event.Event):
         """Maneja eventos durante el juego activo"""
         if event.type == pygame.KEYDOWN:
+            if self.input_tape and not self.input_tape.accept_keydown(event):
+                return
             if event.key == pygame.K_SPACE and not self.pause:
                 # El manejo del doble salto ahora esta en el Player._handle_jump_input
                 # que se llama automaticamente en player.update()
@@ -159,6 +193,16 @@ class MissionGameScreen(Scene):
         self.ultimo_personaje_activo = personaje_actual
     
     def update(self, delta_time: float):
+        """Avanza un tick, inyectando o grabando la entrada si hay un replay activo"""
+        if self.input_tape is None:
+            self._update_tick(delta_time)
+            return
+        for key in self.input_tape.begin_tick():
+            self.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, replayed=True))
+        self._update_tick(delta_time)
+        self.input_tape.end_tick()
+    
+    def _update_tick(self, delta_time: float):
         """Actualiza toda la logica del juego"""
         if self.pause or self.mission_completed:
             return
@@ -169,6 +213,11 @@ class MissionGameScreen(Scene):
             self._check_game_conditions()
             self._update_distance_tracking(delta_time)
     
+    def _is_simulating(self) -> bool:
+        """Indica si el mundo se esta moviendo (no pausado ni terminado)"""
+        return (not self.pause and not self.game_over and not self.victory
+                and not self.mission_completed)
+    
     def _update_distance_tracking(self, delta_time: float):
         """Actualiza el tracking de distancia del personaje actual"""
         personaje_actual = self.player.get_current_character()
@@ -193,7 +242,7 @@ class MissionGameScreen(Scene):
     
     def _update_entities(self, delta_time: float):
         """Actualiza entidades del juego"""
-        keys = pygame.key.get_pressed()
+        keys = self.input_tape.get_pressed() if self.input_tape else pygame.key.get_pressed()
         
         personaje_antes = self.player.get_current_character()
         self.energias_individuales[personaje_antes] = self.energy_remaining
@@ -215,7 +264,8 @@ class MissionGameScreen(Scene):
         
         self.collectible_spawner.update(
             delta_time, self.camera.x, self.player.rect.x, 
-            self.player.rect, collectible_callback
+            self.player.rect, collectible_callback,
+            self.player.get_previous_rect()
         )
     
     def agregar_energia(self, cantidad):
@@ -234,7 +284,7 @@ class MissionGameScreen(Scene):
         if self.shield_collision_just_happened:
             pass
         else:
-            if self.car_spawner.check_collisions(self.player.rect):
+            if self.car_spawner.check_collisions(self.player.rect, self.player.get_previous_rect()):
                 if self.player.is_protected() or self.player.should_show_collision_effect():
                     self.player.activate_shield_collision_effect()
                     self.shield_collision_just_happened = True
@@ -244,7 +294,7 @@ class MissionGameScreen(Scene):
                     except Exception:
                         pass
                     
-                    print("¡Escudo protegió de la colisión!")
+                    collision_log.debug("Escudo protegio de la colision")
                     return
                 else:
                     self._trigger_game_over()
@@ -312,8 +362,19 @@ class MissionGameScreen(Scene):
     
     def on_exit(self):
         """Se ejecuta al salir de la pantalla"""
+        replay_session.end_run()
         pygame.mixer.stop()
     
+    def get_memory_caches(self):
+        """Fondos escalados del renderer"""
+        return {"fondos de la partida": list(self.renderer.scaled_backgrounds.values())}
+    
+    def on_focus_lost(self):
+        """Pausa automaticamente si la ventana pasa a segundo plano en plena partida"""
+        # Con un replay activo la pausa no quedaria en la grabacion y romperia la reproduccion
+        if self._is_simulating() and self.input_tape is None:
+            self.pause = True
+    
     def _restart_mission(self):
         """Reinicia la mision actual"""
         pygame.mixer.stop()
@@ -334,10 +395,12 @@ class MissionGameScreen(Scene):
         overlay.fill((0, 50, 0))
         self.screen.blit(overlay, (0, 0))
         
+        render_text = self.resource_manager.render_text
+        
         # Titulo de mision completada
         font_titulo = self.resource_manager.get_font('titulo')
         if font_titulo:
-            title_text = font_titulo.render("¡MISION COMPLETADA!", True, COLOR_AMARILLO)
+            title_text = render_text(font_titulo, "¡MISION COMPLETADA!", COLOR_AMARILLO)
             title_rect = title_text.get_rect(center=(PANTALLA_ANCHO // 2, 150))
             self.screen.blit(title_text, title_rect)
         
@@ -348,7 +411,7 @@ class MissionGameScreen(Scene):
         
         if self.new_abilities:
             if font_habilidad:
-                unlock_text = font_habilidad.render("¡NUEVAS HABILIDADES!", True, COLOR_VERDE)
+                unlock_text = render_text(font_habilidad, "¡NUEVAS HABILIDADES!", COLOR_VERDE)
                 unlock_rect = unlock_text.get_rect(center=(PANTALLA_ANCHO // 2, y_offset))
                 self.screen.blit(unlock_text, unlock_rect)
                 y_offset += 60
@@ -358,49 +421,64 @@ class MissionGameScreen(Scene):
                 
                 # Nombre de la habilidad
                 if font_habilidad:
-                    name_text = font_habilidad.render(ability_info.get("name", ability_name), True, COLOR_AMARILLO)
+                    name_text = render_text(font_habilidad, ability_info.get("name", ability_name), COLOR_AMARILLO)
                     name_rect = name_text.get_rect(center=(PANTALLA_ANCHO // 2, y_offset))
                     self.screen.blit(name_text, name_rect)
                     y_offset += 40
                 
                 # Descripcion
                 if font_desc:
-                    desc_text = font_desc.render(ability_info.get("description", ""), True, COLOR_BLANCO)
+                    desc_text = render_text(font_desc, ability_info.get("description", ""), COLOR_BLANCO)
                     desc_rect = desc_text.get_rect(center=(PANTALLA_ANCHO // 2, y_offset))
                     self.screen.blit(desc_text, desc_rect)
                     y_offset += 50
         
         # Instrucciones
         if font_desc:
-            instr_text = font_desc.render("Presiona ENTER para continuar", True, COLOR_BLANCO)
+            instr_text = render_text(font_desc, "Presiona ENTER para continuar", COLOR_BLANCO)
             instr_rect = instr_text.get_rect(center=(PANTALLA_ANCHO // 2, PANTALLA_ALTO - 100))
             self.screen.blit(instr_text, instr_rect)
     
     def draw(self):
         """Dibuja todos los elementos visuales"""
-        self.renderer.draw_background(self.camera.x)
-        self.renderer.draw_floor()
-        self.renderer.draw_player(self.player, self.camera.x)
-        self.renderer.draw_cars(self.car_spawner.get_cars(), self.camera.x)
-        self.renderer.draw_collectibles(self.collectible_spawner.get_collectibles(), self.camera.x)
+        # Interpolar solo mientras la simulacion avanza; en pausa o fin de juego
+        # las posiciones estan congeladas en el ultimo tick
+        alpha = self.interpolation if self._is_simulating() else 1.0
+        self.renderer.set_interpolation(alpha)
+        camera_x = self.camera.get_interpolated_x(alpha)
+        
+        with frame_profiler.section("draw_background"):
+            self.renderer.draw_background(camera_x)
+        with frame_profiler.section("draw_floor"):
+            self.renderer.draw_floor()
+        with frame_profiler.section("draw_player"):
+            self.renderer.draw_player(self.player, camera_x)
+        with frame_profiler.section("draw_cars"):
+            self.renderer.draw_cars(self.car_spawner.get_visible_cars(camera_x), camera_x)
+        with frame_profiler.section("draw_collectibles"):
+            self.renderer.draw_collectibles(self.collectible_spawner.get_visible_collectibles(camera_x), camera_x)
         
         # Dibujar UI
         if not self.game_over and not self.victory and not self.mission_completed:
             autonomia_maxima_actual = self.player.obtener_autonomia_maxima()
             # Corregido: pasar el tiempo real de escudo restante
             shield_time = self.player.get_shield_time_remaining()
-            self.hud.draw(self.screen, self.energy_remaining, 
-                         autonomia_maxima_actual, self.kilometers_remaining,
-                         self.distancias_personajes, 'mission',
-                         shield_time)
+            with frame_profiler.section("hud"):
+                self.hud.draw(self.screen, self.energy_remaining, 
+                             autonomia_maxima_actual, self.kilometers_remaining,
+                             self.distancias_personajes, 'mission',
+                             shield_time)
         
         # Pantalla de mision completada
         if self.mission_completed:
-            self._draw_mission_completion_screen()
+            with frame_profiler.section("draw_mission_completion"):
+                self._draw_mission_completion_screen()
         elif self.game_over:
-            self.renderer.draw_game_over_screen()
+            with frame_profiler.section("draw_game_over_screen"):
+                self.renderer.draw_game_over_screen()
         elif self.victory:
-            self.renderer.draw_victory_screen()
+            with frame_profiler.section("draw_victory_screen"):
+                self.renderer.draw_victory_screen()
         
         # Pausa
         if self.pause and not self.game_over and not self.victory and not self.mission_completed:
@@ -409,8 +487,7 @@ class MissionGameScreen(Scene):
             overlay.fill((0, 0, 0))
             self.screen.blit(overlay, (0, 0))
             
-            font = pygame.font.SysFont(None, 60)
-            text = font.render("Mision Pausada", True, (255, 255, 255))
+            text = self.resource_manager.render_text('pausa', "Mision Pausada", (255, 255, 255))
             rect = text.get_rect(center=(PANTALLA_ANCHO // 2, PANTALLA_ALTO // 2))
             self.screen.blit(text, rect)
             
\ No newline at end of file
@@ -6,6 +6,14 @@ from src.core.scene_manager import Scene
 class LevelScreen(Scene):
     """Pantalla de nivel con sistema de dialogos dinamico"""
     
+    @classmethod
+    def required_assets(cls, game_manager):
+        """Fondo y personajes del nivel elegido (vienen en shared_data['level_data'])"""
+        shared_data = getattr(game_manager, 'shared_data', None) or {}
+        level_data = shared_data.get('level_data') or {"background": "level1_bg",
+                                                       "characters": ["character_a", "character_b"]}
+        return (level_data.get("background"), *level_data.get("characters", ()))
+    
     def __init__(self, screen, resource_manager, scene_manager):
         super().__init__(screen, resource_manager, scene_manager)
         
@@ -199,7 +207,9 @@ class LevelScreen(Scene):
         self.enter_pressed = False
         
         # cache de frames por personaje (frames ya escalados a character_size)
-        self._char_frames_cache = {}  # key -> [Surface, Surface, ...]
+        self._char_frames_cache = {}  # (key, tamaño) -> (Surface, Surface, ...)
+        # ultimo corte en lineas del dialogo: (texto visible, ancho) -> lineas
+        self._dialog_lines = (None, [])
         # intervalo (ms) entre alternar boca abierta/cerrada mientras habla
         self._talk_frame_interval_ms = 160
     
@@ -377,7 +387,7 @@ class LevelScreen(Scene):
         # Nombre del hablante
         font_name = self.resource_manager.get_font('boton')
         if font_name:
-            name_surface = font_name.render(dialog_data["name"], True, color_amarillo)
+            name_surface = self.resource_manager.render_text(font_name, dialog_data["name"], color_amarillo)
             self.screen.blit(name_surface, (text_x, text_y))
         
         # Texto del dialogo (con animacion)
@@ -386,36 +396,15 @@ class LevelScreen(Scene):
             # Obtener texto hasta el progreso actual
             full_text = dialog_data["text"]
             displayed_text = full_text[:self.text_animation_progress]
+            lines = self._wrap_dialog_text(font_dialog, displayed_text, text_area_width - 40)
             
-            # Dividir en lineas para texto multilinea
-            words = displayed_text.split(' ')
-            lines = []
-            current_line = ""
-            
-            for word in words:
-                test_line = current_line + word + " "
-                test_surface = font_dialog.render(test_line, True, color_blanco)
-                
-                if test_surface.get_width() <= text_area_width - 40:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        lines.append(current_line.strip())
-                        current_line = word + " "
-                    else:
-                        lines.append(word)
-                        current_line = ""
-            
-            if current_line:
-                lines.append(current_line.strip())
-            
-            # Dibujar lineas
+            # Dibujar lineas (las que no cambiaron salen del cache de textos)
             line_height = font_dialog.get_height() + 5
             start_y = text_y + 50  # Debajo del nombre
             
             for i, line in enumerate(lines):
                 if line.strip():
-                    line_surface = font_dialog.render(line, True, color_blanco)
+                    line_surface = self.resource_manager.render_text(font_dialog, line, color_blanco)
                     self.screen.blit(line_surface, (text_x, start_y + i * line_height))
         
         # Indicador de "presiona Enter"
@@ -426,54 +415,71 @@ class LevelScreen(Scene):
                 alpha = int(127 * (1 + math.sin(pygame.time.get_ticks() * 0.005)))
                 
                 continue_text = "Presiona ENTER para continuar..."
-                continue_surface = font_small.render(continue_text, True, color_amarillo)
-                continue_surface.set_alpha(alpha)
+                continue_surface = self.resource_manager.render_text(font_small, continue_text, color_amarillo)
                 
                 continue_x = dialog_rect.right - continue_surface.get_width() - 30
                 continue_y = dialog_rect.bottom - continue_surface.get_height() - 15
+                # La superficie es compartida: despues del blit vuelve a su alpha original
+                # (set_alpha(None) le quitaria la transparencia por pixel al texto)
+                original_alpha = continue_surface.get_alpha()
+                continue_surface.set_alpha(alpha)
                 self.screen.blit(continue_surface, (continue_x, continue_y))
+                continue_surface.set_alpha(original_alpha)
     
-    def _get_scaled_frames_for(self, key: str):
+    def _wrap_dialog_text(self, font_dialog, displayed_text: str, max_width: int) -> list:
+        """Divide el texto visible en lineas; solo se recalcula cuando aparece una letra nueva"""
+        cache_key = (displayed_text, max_width)
+        if self._dialog_lines[0] == cache_key:
+            return self._dialog_lines[1]
+        
+        words = displayed_text.split(' ')
+        lines = []
+        current_line = ""
+        
+        for word in words:
+            test_line = current_line + word + " "
+            
+            if font_dialog.size(test_line)[0] <= max_width:
+                current_line = test_line
+            else:
+                if current_line:
+                    lines.append(current_line.strip())
+                    current_line = word + " "
+                else:
+                    lines.append(word)
+                    current_line = ""
+        
+        if current_line:
+            lines.append(current_line.strip())
+        
+        self._dialog_lines = (cache_key, lines)
+        return lines
+    
+    def get_memory_caches(self):
+        """Frames de personajes ya escalados para el dialogo"""
+        return {"personajes escalados": [frame for frames in self._char_frames_cache.values() for frame in frames]}
+    
+    def _get_scaled_frames_for(self, key: str, size=None):
         """
-        Obtiene lista de frames escalados a self.character_size para 'key'.
-        Busca hoja de sprites con resource_manager.get_spritesheet(key) o imagen simple.
+        Obtiene los frames de 'key' escalados a `size` (por defecto self.character_size).
+        Usa la variante precalculada de la hoja de sprites o, si no hay hoja, la imagen simple.
         """
-        if key in self._char_frames_cache:
-            return self._char_frames_cache[key]
+        size = tuple(size or self.character_size)
+        cache_key = (key, size)
+        if cache_key in self._char_frames_cache:
+            return self._char_frames_cache[cache_key]
 
-        frames = []
+        frames = ()
         # intentar spritesheet primero (ResourceManager.load_spritesheet guarda en sprite_sheets)
-        sheet = None
-        try:
-            sheet = self.resource_manager.get_spritesheet(key)
-        except Exception:
-            sheet = None
-
+        sheet = self.resource_manager.get_spritesheet(key)
         if sheet:
-            # obtener todos los frames de la primera fila (row 0)
-            cols = sheet.columns
-            for c in range(cols):
-                try:
-                    f = sheet.get_frame(c, 0).copy()
-                except Exception:
-                    continue
-                # escalar al tamaño objetivo
-                try:
-                    f = pygame.transform.smoothscale(f, self.character_size)
-                except Exception:
-                    f = pygame.transform.scale(f, self.character_size)
-                frames.append(f.convert_alpha() if f.get_flags() & pygame.SRCALPHA else f.convert())
-        else:
+            # frames de la primera fila (row 0); si el tamaño coincide no se copia nada
+            frames = sheet.get_variant(size, smooth=True)[0]
+        elif self.resource_manager.get_image(key):
             # fallback: usar imagen estatica si existe
-            img = self.resource_manager.get_image(key)
-            if img:
-                try:
-                    f = pygame.transform.smoothscale(img, self.character_size)
-                except Exception:
-                    f = pygame.transform.scale(img, self.character_size)
-                frames = [f.convert_alpha() if f.get_flags() & pygame.SRCALPHA else f.convert()]
+            frames = (self.resource_manager.get_scaled_image(key, size, smooth=True),)
 
-        self._char_frames_cache[key] = frames
+        self._char_frames_cache[cache_key] = frames
         return frames
 
     def _draw_characters(self):
@@ -497,6 +503,11 @@ class LevelScreen(Scene):
         # obtener frames escalados (cache)
         left_frames = self._get_scaled_frames_for(left_key)
         right_frames = self._get_scaled_frames_for(right_key)
+        # quien no habla se dibuja al 90%: esos frames tambien salen ya escalados
+        target_w, target_h = self.character_size
+        small_size = (max(1, int(target_w * 0.90)), max(1, int(target_h * 0.90)))
+        left_small = self._get_scaled_frames_for(left_key, small_size)
+        right_small = self._get_scaled_frames_for(right_key, small_size)
 
         # SOLUCION: Determinar quien habla basado en position y aplicar emotion solo al hablante
         dialog_speaker_key = dialog_data.get("speaker")
@@ -560,20 +571,13 @@ class LevelScreen(Scene):
 
         # renderizado para quien NO habla: dibuja version reducida y aplica mascara oscurecedora
         def render_not_speaking(frames, pos_x, pos_y, emotion_idx):
-            # si hay frames, usar closed frame y reescalar un poco mas chiquito
-            target_w, target_h = self.character_size
-            scale = 0.90
-            small_w = max(1, int(target_w * scale))
-            small_h = max(1, int(target_h * scale))
+            # si hay frames, usar closed frame en su version reducida
+            small_w, small_h = small_size
             if frames:
                 _, closed_i = _frame_indices(frames, emotion_idx)
                 if closed_i is None or closed_i >= len(frames):
                     closed_i = 0
-                frame = frames[closed_i]
-                try:
-                    small_frame = pygame.transform.smoothscale(frame, (small_w, small_h))
-                except Exception:
-                    small_frame = pygame.transform.scale(frame, (small_w, small_h))
+                small_frame = frames[closed_i]
                 offset_x = pos_x + (target_w - small_w) // 2
                 offset_y = pos_y + (target_h - small_h) // 2
                 self.screen.blit(small_frame, (offset_x, offset_y))
@@ -599,21 +603,18 @@ class LevelScreen(Scene):
         # Dibujar izquierdo / derecho segun quien habla
         if speaker_position == "left":
             render_speaking(left_frames, left_char_x, char_y, left_emotion)
-            render_not_speaking(right_frames, right_char_x, char_y, right_emotion)
+            render_not_speaking(right_small, right_char_x, char_y, right_emotion)
         else:
-            render_not_speaking(left_frames, left_char_x, char_y, left_emotion)
+            render_not_speaking(left_small, left_char_x, char_y, left_emotion)
             render_speaking(right_frames, right_char_x, char_y, right_emotion)
     
     def draw(self):
         """Dibuja la pantalla del nivel"""
         # Fondo del nivel
-        background_image = self.resource_manager.get_image(self.level_data["background"])
+        background_image = self.resource_manager.get_scaled_image(
+            self.level_data["background"], (ANCHO_PANTALLA, ALTO_PANTALLA), smooth=True)
         if background_image:
-            try:
-                scaled_background = pygame.transform.smoothscale(background_image, (ANCHO_PANTALLA, ALTO_PANTALLA))
-            except Exception:
-                scaled_background = pygame.transform.scale(background_image, (ANCHO_PANTALLA, ALTO_PANTALLA))
-            self.screen.blit(scaled_background, (0, 0))
+            self.screen.blit(background_image, (0, 0))
         else:
             # Fondo gradiente como fallback
             for y in range(ALTO_PANTALLA):
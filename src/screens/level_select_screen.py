@@ -7,6 +7,10 @@ from src.systems.ability_system import ability_system  # agregado
 class LevelSelectScreen(Scene):
     """Pantalla de seleccion de niveles con arquitectura extensible"""
     
+    # Solo cambian los botones y el fondo: se suben a pantalla solo esas regiones
+    uses_dirty_rects = True
+    fps_cap = MENU_FPS_CAP
+    
     def __init__(self, screen, resource_manager, scene_manager):
         super().__init__(screen, resource_manager, scene_manager)
         
@@ -60,6 +64,7 @@ class LevelSelectScreen(Scene):
         self.level_card_width = 780
         self.level_card_height = 360
         self.card_spacing = 50
+        self._desc_lines_cache = {}  # (descripcion, ancho) -> lineas ya cortadas
         
         self._create_buttons()
     
@@ -118,11 +123,13 @@ class LevelSelectScreen(Scene):
         """Navega al nivel anterior"""
         self.selected_level_index = (self.selected_level_index - 1) % len(self.level_keys)
         self.resource_manager.play_sound("boton_hover")
+        self.request_full_redraw()
     
     def _next_level(self):
         """Navega al siguiente nivel"""
         self.selected_level_index = (self.selected_level_index + 1) % len(self.level_keys)
         self.resource_manager.play_sound("boton_hover")
+        self.request_full_redraw()
     
     def _select_level(self):
         """Selecciona el nivel actual"""
@@ -153,6 +160,7 @@ class LevelSelectScreen(Scene):
         try:
             ability_system.reset_progress()
             ability_system.load_progress()
+            self.request_full_redraw()  # La tarjeta puede perder el "COMPLETADO"
             # feedback audible si existe el sonido
             try:
                 self.resource_manager.play_sound("boton_hover")
@@ -180,29 +188,60 @@ class LevelSelectScreen(Scene):
     def update(self, dt):
         """Actualiza la pantalla"""
         for button in self.buttons:
-            button.update(dt)
+            if button.update(dt):
+                self.mark_dirty(button.get_bounds())
         
         # Actualizar animacion de fondo
         self.background_timer += dt
         if self.background_timer >= self.animation_speed:
             self.background_timer = 0.0
             self.current_background = 1 - self.current_background
+            self.request_full_redraw()
     
     def _draw_bordered_text(self, text: str, font: pygame.font.Font, pos: tuple,
                            text_color: tuple, border_color: tuple, border_size: int = 2):
         """Dibuja texto con borde"""
         x, y = pos
+        border_surface = self.resource_manager.render_text(font, text, border_color)
         for dx, dy in [(dx, dy) for dx in range(-border_size, border_size + 1)
                                 for dy in range(-border_size, border_size + 1)
                                 if dx*dx + dy*dy <= border_size*border_size]:
-            text_surface = font.render(text, True, border_color)
-            text_rect = text_surface.get_rect(center=(x + dx, y + dy))
-            self.screen.blit(text_surface, text_rect)
+            text_rect = border_surface.get_rect(center=(x + dx, y + dy))
+            self.screen.blit(border_surface, text_rect)
 
-        text_surface = font.render(text, True, text_color)
+        text_surface = self.resource_manager.render_text(font, text, text_color)
         text_rect = text_surface.get_rect(center=(x, y))
         self.screen.blit(text_surface, text_rect)
     
+    def _wrap_description(self, font_desc, desc_text: str, max_width: int) -> list:
+        """Corta la descripcion en lineas (soporta '\n'); se calcula una sola vez por texto"""
+        cache_key = (desc_text, max_width)
+        if cache_key in self._desc_lines_cache:
+            return self._desc_lines_cache[cache_key]
+        lines = []
+        # Primero separar por párrafos (salto explícito '\n')
+        for paragraph in desc_text.split('\n'):
+            words = paragraph.split(' ')
+            current_line = ""
+            for word in words:
+                if current_line == "":
+                    test_line = word
+                else:
+                    test_line = current_line + " " + word
+                # medir ancho de la línea tentativa
+                line_width = font_desc.size(test_line)[0]
+                if line_width <= max_width:
+                    current_line = test_line
+                else:
+                    if current_line != "":
+                        lines.append(current_line)
+                    # comenzar nueva línea con la palabra actual
+                    current_line = word
+            if current_line:
+                lines.append(current_line)
+        self._desc_lines_cache[cache_key] = lines
+        return lines
+    
     def _draw_level_card(self):
         """Dibuja la tarjeta del nivel actual"""
         current_level_key = self.level_keys[self.selected_level_index]
@@ -236,7 +275,7 @@ class LevelSelectScreen(Scene):
             pygame.draw.rect(self.screen, COLOR_VERDE, (badge_x, badge_y, badge_w, badge_h), border_radius=6)
             font_badge = self.resource_manager.get_font('pequeña')
             if font_badge:
-                txt = font_badge.render("COMPLETADO", True, COLOR_BLANCO)
+                txt = self.resource_manager.render_text(font_badge, "COMPLETADO", COLOR_BLANCO)
                 txt_rect = txt.get_rect(center=(badge_x + badge_w // 2, badge_y + badge_h // 2))
                 self.screen.blit(txt, txt_rect)
         
@@ -246,15 +285,15 @@ class LevelSelectScreen(Scene):
         font_titulo = self.resource_manager.get_font('subtitulo')
         if font_titulo:
             title_text = current_level["name"]
-            title_surface = font_titulo.render(title_text, True, COLOR_AMARILLO)
+            title_surface = self.resource_manager.render_text(font_titulo, title_text, COLOR_AMARILLO)
             title_rect = title_surface.get_rect()
             title_rect.centerx = card_x + self.level_card_width // 2
             title_rect.y = title_y
             self.screen.blit(title_surface, title_rect)
         else:
             # fallback rápido por si no hay fuente cargada
-            fallback = pygame.font.SysFont(None, 28)
-            title_surface = fallback.render(current_level["name"], True, COLOR_AMARILLO)
+            fallback = self.resource_manager.get_sized_font(None, 28)
+            title_surface = self.resource_manager.render_text(fallback, current_level["name"], COLOR_AMARILLO)
             title_rect = title_surface.get_rect(center=(card_x + self.level_card_width // 2, title_y))
             self.screen.blit(title_surface, title_rect)
         
@@ -264,32 +303,12 @@ class LevelSelectScreen(Scene):
             desc_text = current_level["description"]
             # ancho máximo para las líneas (margen dentro del recuadro)
             max_width = self.level_card_width - 80
-            lines = []
-            # Primero separar por párrafos (salto explícito '\n')
-            for paragraph in desc_text.split('\n'):
-                words = paragraph.split(' ')
-                current_line = ""
-                for word in words:
-                    if current_line == "":
-                        test_line = word
-                    else:
-                        test_line = current_line + " " + word
-                    # medir ancho de la línea tentativa
-                    line_width = font_desc.size(test_line)[0]
-                    if line_width <= max_width:
-                        current_line = test_line
-                    else:
-                        if current_line != "":
-                            lines.append(current_line)
-                        # comenzar nueva línea con la palabra actual
-                        current_line = word
-                if current_line:
-                    lines.append(current_line)
+            lines = self._wrap_description(font_desc, desc_text, max_width)
             # Renderizar líneas centradas
             line_height = font_desc.get_height() + 6
             start_y = desc_y
             for i, line in enumerate(lines):
-                line_surf = font_desc.render(line, True, COLOR_BLANCO)
+                line_surf = self.resource_manager.render_text(font_desc, line, COLOR_BLANCO)
                 line_rect = line_surf.get_rect(center=(card_x + self.level_card_width // 2, start_y + i * line_height))
                 self.screen.blit(line_surf, line_rect)
             # calcular bottom de bloque de texto para posicionar estado
@@ -307,14 +326,14 @@ class LevelSelectScreen(Scene):
         
         # dibujar estado con fallback si es necesario
         if font_desc:
-            status_surface = font_desc.render(status_text, True, status_color)
+            status_surface = self.resource_manager.render_text(font_desc, status_text, status_color)
             status_rect = status_surface.get_rect()
             status_rect.centerx = card_x + self.level_card_width // 2
             status_rect.y = text_block_bottom + 30
             self.screen.blit(status_surface, status_rect)
         else:
-            fallback = pygame.font.SysFont(None, 20)
-            status_surface = fallback.render(status_text, True, status_color)
+            fallback = self.resource_manager.get_sized_font(None, 20)
+            status_surface = self.resource_manager.render_text(fallback, status_text, status_color)
             status_rect = status_surface.get_rect(center=(card_x + self.level_card_width // 2, text_block_bottom + 30))
             self.screen.blit(status_surface, status_rect)
 
@@ -322,11 +341,10 @@ class LevelSelectScreen(Scene):
         """Dibuja la pantalla de seleccion de niveles"""
         # Fondo animado
         background_name = f"menu_background{self.current_background + 1}"
-        background_image = self.resource_manager.get_image(background_name)
+        background_image = self.resource_manager.get_scaled_image(background_name, (ANCHO_PANTALLA, ALTO_PANTALLA))
         
         if background_image:
-            scaled_background = pygame.transform.scale(background_image, (ANCHO_PANTALLA, ALTO_PANTALLA))
-            self.screen.blit(scaled_background, (0, 0))
+            self.screen.blit(background_image, (0, 0))
         else:
             self.screen.fill(COLOR_FONDO_BASE)
         
@@ -342,21 +360,21 @@ class LevelSelectScreen(Scene):
                 3
             )
         else:
-            fb = pygame.font.SysFont(None, 48)
-            txt = fb.render("Selecciona Mision", True, COLOR_TITULO)
+            fb = self.resource_manager.get_sized_font(None, 48)
+            txt = self.resource_manager.render_text(fb, "Selecciona Mision", COLOR_TITULO)
             self.screen.blit(txt, txt.get_rect(center=(ANCHO_PANTALLA // 2, 80)))
 
         # Indicador de nivel actual (usar color contrastante)
         font_indicador = self.resource_manager.get_font('boton')
         if font_indicador:
             level_indicator = f"{self.selected_level_index + 1} / {len(self.level_keys)}"
-            indicator_surface = font_indicador.render(level_indicator, True, COLOR_AMARILLO)
+            indicator_surface = self.resource_manager.render_text(font_indicador, level_indicator, COLOR_AMARILLO)
             indicator_rect = indicator_surface.get_rect(center=(ANCHO_PANTALLA // 2, 140))
             self.screen.blit(indicator_surface, indicator_rect)
         else:
-            fb = pygame.font.SysFont(None, 24)
+            fb = self.resource_manager.get_sized_font(None, 24)
             level_indicator = f"{self.selected_level_index + 1} / {len(self.level_keys)}"
-            indicator_surface = fb.render(level_indicator, True, COLOR_AMARILLO)
+            indicator_surface = self.resource_manager.render_text(fb, level_indicator, COLOR_AMARILLO)
             self.screen.blit(indicator_surface, indicator_surface.get_rect(center=(ANCHO_PANTALLA // 2, 140)))
         
         # Tarjeta del nivel actual
@@ -366,12 +384,12 @@ class LevelSelectScreen(Scene):
         font_instrucciones = self.resource_manager.get_font('pequeña')
         if font_instrucciones:
             instructions = "← → para navegar • ENTER para seleccionar • ESC para volver"
-            instr_surface = font_instrucciones.render(instructions, True, COLOR_TEXTO_SUTIL_EN_FONDO)
+            instr_surface = self.resource_manager.render_text(font_instrucciones, instructions, COLOR_TEXTO_SUTIL_EN_FONDO)
             instr_rect = instr_surface.get_rect(center=(ANCHO_PANTALLA // 2, ALTO_PANTALLA - 40))
             self.screen.blit(instr_surface, instr_rect)
         else:
-            fb = pygame.font.SysFont(None, 20)
-            instr_surface = fb.render("← → para navegar • ENTER para seleccionar • ESC para volver", True, COLOR_TEXTO_SUTIL_EN_FONDO)
+            fb = self.resource_manager.get_sized_font(None, 20)
+            instr_surface = self.resource_manager.render_text(fb, "← → para navegar • ENTER para seleccionar • ESC para volver", COLOR_TEXTO_SUTIL_EN_FONDO)
             self.screen.blit(instr_surface, instr_surface.get_rect(center=(ANCHO_PANTALLA // 2, ALTO_PANTALLA - 40)))
         
         # Botones: intentar dibujar con la implementación Button; si falla, dibujar fallback para el botón de borrar
@@ -399,16 +417,16 @@ class LevelSelectScreen(Scene):
                 pygame.draw.rect(self.screen, (60, 60, 60), rect, border_radius=6)
                 pygame.draw.rect(self.screen, (100, 100, 100), rect, 2, border_radius=6)
                 # Texto del botón (fallback font)
-                fb = pygame.font.SysFont(None, 16)  # texto más pequeño
+                fb = self.resource_manager.get_sized_font(None, 16)  # texto más pequeño
                 label = getattr(self, 'delete_progress_label', "Borrar Progreso")
-                txt = fb.render(label, True, COLOR_BLANCO)
+                txt = self.resource_manager.render_text(fb, label, COLOR_BLANCO)
                 self.screen.blit(txt, txt.get_rect(center=rect.center))
         else:
             # Si el Button.draw se ejecutó correctamente, sobreescribimos la etiqueta
             # con una fuente más pequeña para asegurar el tamaño deseado.
             rect = getattr(self, 'delete_progress_rect', None)
             if rect:
-                fb_small = pygame.font.SysFont(None, 16)
+                fb_small = self.resource_manager.get_sized_font(None, 16)
                 label = getattr(self, 'delete_progress_label', "Borrar Progreso")
-                txt = fb_small.render(label, True, COLOR_BLANCO)
+                txt = self.resource_manager.render_text(fb_small, label, COLOR_BLANCO)
                 self.screen.blit(txt, txt.get_rect(center=rect.center))
\ No newline at end of file
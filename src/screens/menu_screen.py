@@ -6,6 +6,10 @@ from src.UI.button import Button
 class MenuScreen(Scene):
     """Pantalla del menu principal"""
     
+    # Solo cambian los botones y el fondo: se suben a pantalla solo esas regiones
+    uses_dirty_rects = True
+    fps_cap = MENU_FPS_CAP
+    
     def __init__(self, screen, resource_manager, scene_manager):
         super().__init__(screen, resource_manager,scene_manager)
         self.scene_manager = scene_manager
@@ -77,28 +81,30 @@ class MenuScreen(Scene):
         """Actualiza el menu"""
         # Actualizar botones
         for button in self.buttons:
-            button.update(dt)
+            if button.update(dt):
+                self.mark_dirty(button.get_bounds())
         
         # ACTUALIZAR ANIMACIoN DE FONDO
         self.background_timer += dt
         if self.background_timer >= self.animation_speed:
             self.background_timer = 0.0
             self.current_background = 1 - self.current_background  # Alternar entre 0 y 1
+            self.request_full_redraw()
     
     def _draw_bordered_text(self, text: str, font: pygame.font.Font, pos: tuple, 
                            text_color: tuple, border_color: tuple, border_size: int = 4):
         """Dibuja texto con borde"""
         x, y = pos
         # Dibujar el borde
+        border_surface = self.resource_manager.render_text(font, text, border_color)
         for dx, dy in [(dx, dy) for dx in range(-border_size, border_size + 1) 
                                 for dy in range(-border_size, border_size + 1)
                                 if dx*dx + dy*dy <= border_size*border_size]:
-            text_surface = font.render(text, True, border_color)
-            text_rect = text_surface.get_rect(center=(x + dx, y + dy))
-            self.screen.blit(text_surface, text_rect)
+            text_rect = border_surface.get_rect(center=(x + dx, y + dy))
+            self.screen.blit(border_surface, text_rect)
         
         # Dibujar el texto principal
-        text_surface = font.render(text, True, text_color)
+        text_surface = self.resource_manager.render_text(font, text, text_color)
         text_rect = text_surface.get_rect(center=(x, y))
         self.screen.blit(text_surface, text_rect)
 
@@ -106,12 +112,10 @@ class MenuScreen(Scene):
         """Dibuja el menu con fondo animado"""
         # DIBUJAR FONDO ANIMADO
         background_name = f"menu_background{self.current_background + 1}"
-        background_image = self.resource_manager.get_image(background_name)
+        background_image = self.resource_manager.get_scaled_image(background_name, (ANCHO_PANTALLA, ALTO_PANTALLA))
         
         if background_image:
-            # Escalar la imagen al tamaño de la pantalla
-            scaled_background = pygame.transform.scale(background_image, (ANCHO_PANTALLA, ALTO_PANTALLA))
-            self.screen.blit(scaled_background, (0, 0))
+            self.screen.blit(background_image, (0, 0))
 
         else:
             # Si no hay imagen, usar color de fondo por defecto
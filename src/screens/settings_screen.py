@@ -3,9 +3,16 @@ from src.Constantes import *
 from src.core.scene_manager import Scene
 from src.UI.button import Button
 from src.UI.Slider import Slider
+from src.core.logger import game_log
+
+audio_log = game_log.channel("audio")
 class SettingsScreen(Scene):
     """Pantalla de configuracion"""
     
+    # Solo cambian los botones, los sliders y el fondo: se suben a pantalla solo esas regiones
+    uses_dirty_rects = True
+    fps_cap = MENU_FPS_CAP
+    
     def __init__(self, screen, resource_manager,scene_manager):
         super().__init__(screen, resource_manager,scene_manager)
         self.buttons = []
@@ -22,6 +29,7 @@ class SettingsScreen(Scene):
         self.initial_sound_volume = self.resource_manager.get_sound_volume()
         
         self._create_buttons()
+        self._drawn_slider_values = [slider.get_value() for slider in self.sliders]
     
     def _create_buttons(self):
         """Crea los botones de configuracion - POSICIONADOS A LA DERECHA"""
@@ -58,15 +66,15 @@ class SettingsScreen(Scene):
         """Dibuja texto con borde"""
         x, y = pos
         # Dibujar el borde
+        border_surface = self.resource_manager.render_text(font, text, border_color)
         for dx, dy in [(dx, dy) for dx in range(-border_size, border_size + 1) 
                                 for dy in range(-border_size, border_size + 1)
                                 if dx*dx + dy*dy <= border_size*border_size]:
-            text_surface = font.render(text, True, border_color)
-            text_rect = text_surface.get_rect(center=(x + dx, y + dy))
-            self.screen.blit(text_surface, text_rect)
+            text_rect = border_surface.get_rect(center=(x + dx, y + dy))
+            self.screen.blit(border_surface, text_rect)
         
         # Dibujar el texto principal
-        text_surface = font.render(text, True, text_color)
+        text_surface = self.resource_manager.render_text(font, text, text_color)
         text_rect = text_surface.get_rect(center=(x, y))
         self.screen.blit(text_surface, text_rect)
     
@@ -78,7 +86,7 @@ class SettingsScreen(Scene):
             and self.scene_manager.game_manager 
             and hasattr(self.scene_manager.game_manager, 'shared_data')):
             self.scene_manager.game_manager.shared_data['music_volume'] = value
-        print(f"Volumen música: {value:.2f}")
+        audio_log.debug("Volumen musica: %.2f", value)
 
     def _update_sound_volume(self, value):
         """Actualiza volumen de efectos cuando cambia el slider"""
@@ -87,7 +95,7 @@ class SettingsScreen(Scene):
             and self.scene_manager.game_manager 
             and hasattr(self.scene_manager.game_manager, 'shared_data')):
             self.scene_manager.game_manager.shared_data['sound_volume'] = value
-        print(f"Volumen efectos: {value:.2f}")
+        audio_log.debug("Volumen efectos: %.2f", value)
     
     def _show_controls(self):
         """Muestra la pantalla de controles"""
@@ -116,41 +124,57 @@ class SettingsScreen(Scene):
         """Actualiza la pantalla de configuracion"""
         # Actualizar botones
         for button in self.buttons:
-            button.update(dt)
+            if button.update(dt):
+                self.mark_dirty(button.get_bounds())
         
         for slider in self.sliders:
             if slider.container_rect.collidepoint(pygame.mouse.get_pos()):
                 if pygame.mouse.get_pressed()[0]:
                     slider.move_slider(pygame.mouse.get_pos()[0])
         
+        # Slider movido: redibujar el slider y su porcentaje
+        for i, slider in enumerate(self.sliders):
+            value = slider.get_value()
+            if value != self._drawn_slider_values[i]:
+                self._drawn_slider_values[i] = value
+                self.mark_dirty(self._get_slider_area(slider))
+        
         # ACTUALIZAR ANIMACIoN DE FONDO
         self.background_timer += dt
         if self.background_timer >= self.animation_speed:
             self.background_timer = 0.0
             self.current_background = 1 - self.current_background  # Alternar entre 0 y 1
+            self.request_full_redraw()
         
     
+    def _get_slider_area(self, slider: Slider) -> pygame.Rect:
+        """Region del slider incluyendo la etiqueta y el porcentaje que se dibujan arriba"""
+        bounds = slider.get_bounds()
+        label_y = slider.pos[1] - 35
+        return bounds.union(pygame.Rect(bounds.left, label_y, bounds.width, bounds.top - label_y))
+    
     def draw(self):
         """Dibuja la pantalla de configuracion con fondo animado"""
         # DIBUJAR FONDO ANIMADO
         background_name = f"menu_background{self.current_background + 1}"
-        background_image = self.resource_manager.get_image(background_name)
+        background_image = self.resource_manager.get_scaled_image(background_name, (ANCHO_PANTALLA, ALTO_PANTALLA))
         
         if background_image:
-            # Escalar la imagen al tamaño de la pantalla
-            scaled_background = pygame.transform.scale(background_image, (ANCHO_PANTALLA, ALTO_PANTALLA))
-            self.screen.blit(scaled_background, (0, 0))
+            self.screen.blit(background_image, (0, 0))
             
             fade_duration = 0.5  
             if self.background_timer <= fade_duration:
                 # Mostrar la imagen anterior con fade out
                 other_bg_name = f"settings_bg{(1 - self.current_background) + 1}"
-                other_bg = self.resource_manager.get_image(other_bg_name)
+                other_bg = self.resource_manager.get_scaled_image(other_bg_name, (ANCHO_PANTALLA, ALTO_PANTALLA))
                 if other_bg:
                     alpha = int(255 * (1 - self.background_timer / fade_duration))
-                    other_bg_scaled = pygame.transform.scale(other_bg, (ANCHO_PANTALLA, ALTO_PANTALLA))
-                    other_bg_scaled.set_alpha(alpha)
-                    self.screen.blit(other_bg_scaled, (0, 0))
+                    # La copia escalada es compartida: despues del blit vuelve a su alpha original
+                    # (set_alpha(None) le quitaria la transparencia por pixel)
+                    original_alpha = other_bg.get_alpha()
+                    other_bg.set_alpha(alpha)
+                    self.screen.blit(other_bg, (0, 0))
+                    other_bg.set_alpha(original_alpha)
         else:
             # Si no hay imagen, usar color de fondo por defecto
             self.screen.fill(COLOR_FONDO_BASE)
@@ -170,18 +194,18 @@ class SettingsScreen(Scene):
         # Ayuda - tambien a la izquierda
         font_pequeña = self.resource_manager.get_font('pequeña')
         if font_pequeña:
-            help_surface = font_pequeña.render("Presiona ESC para volver", True, COLOR_TEXTO_SUTIL_EN_FONDO)
+            help_surface = self.resource_manager.render_text(font_pequeña, "Presiona ESC para volver", COLOR_TEXTO_SUTIL_EN_FONDO)
             help_rect = help_surface.get_rect(center=(ANCHO_PANTALLA // 5, 180))
             self.screen.blit(help_surface, help_rect)
             for i, (slider, label) in enumerate(zip(self.sliders, self.slider_labels)):
                 # Etiqueta
-                label_surface = font_pequeña.render(label, True, COLOR_AMARILLO)
+                label_surface = self.resource_manager.render_text(font_pequeña, label, COLOR_AMARILLO)
                 label_y = slider.pos[1] - 35
                 self.screen.blit(label_surface, (slider.slider_left_pos, label_y))
                 
                 # Valor actual
                 value_text = f"{int(slider.get_value() * 100)}%"
-                value_surface = font_pequeña.render(value_text, True, COLOR_AMARILLO)
+                value_surface = self.resource_manager.render_text(font_pequeña, value_text, COLOR_AMARILLO)
                 value_rect = value_surface.get_rect()
                 value_rect.right = slider.slider_right_pos
                 value_rect.y = label_y
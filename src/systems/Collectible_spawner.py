@@ -1,21 +1,44 @@
 import pygame
-import random
 from typing import List
 from src.Constantes import *
-from src.entities.Pilas import pilas
-from src.entities.Escudo import Escudo
+from src.core.rng import rng_service
+from src.entities.Pilas import pilas, StorePilas
+from src.entities.Escudo import Escudo, StoreEscudo
+from src.core.logger import game_log
+from src.core.kinematics import swept_collide
+from src.core.entity_store import EntityStore
+from src.systems.collectible_pool import CollectiblePool
+
+spawn_log = game_log.channel("spawn")
+collision_log = game_log.channel("colisiones")
 
 class CollectibleSpawner:
     """Spawner unificado para objetos coleccionables (pilas y escudos)"""
     
     def __init__(self, resource_manager):
         self.resource_manager = resource_manager
+        self.rng = rng_service.stream("collectibles")
         self.spawn_timer = 0.0
-        self.collectibles: List = []
+        
+        # Modo almacen: posiciones y estado de todos los coleccionables por columnas,
+        # con las clases vista de pilas y escudos
+        if ENTITY_STORE_ENABLED:
+            self.store = EntityStore()
+            self.pila_class, self.escudo_class = StorePilas, StoreEscudo
+        else:
+            self.store = None
+            self.pila_class, self.escudo_class = pilas, Escudo
+        
+        # Pilas y escudos se reusan desde un pool; collectibles es su lista de activos
+        self.pool = CollectiblePool(resource_manager, self.store)
+        self.pool.prewarm(self.pila_class)
+        self.pool.prewarm(self.escudo_class)
+        self.collectibles: List = self.pool.active
         self.next_spawn_time = 5.0  # Generar un objeto cada 5 segundos
-        print("CollectibleSpawner inicializado")
+        spawn_log.debug("CollectibleSpawner inicializado")
     
-    def update(self, dt: float, camera_x: float, player_x: float, player_rect: pygame.Rect, energy_callback=None):
+    def update(self, dt: float, camera_x: float, player_x: float, player_rect: pygame.Rect, energy_callback=None,
+               previous_player_rect: pygame.Rect = None):
         """Actualiza el spawner y genera nuevos objetos coleccionables cada 5 segundos
         
         Args:
@@ -24,12 +47,16 @@ class CollectibleSpawner:
             player_x: Posicion X del jugador
             player_rect: Rectangulo del jugador para verificar colisiones
             energy_callback: Funcion callback para manejar la energia
+            previous_player_rect: Rectangulo del jugador al empezar el tick (colision barrida)
         """
         self.spawn_timer += dt
         
-        # Actualizar objetos coleccionables
-        for collectible in self.collectibles:
-            collectible.update()
+        # Mover todos los objetos coleccionables (en una pasada sobre el almacen si esta activo)
+        if self.store is not None:
+            self.store.step(dt)
+        else:
+            for collectible in self.collectibles:
+                collectible.update(dt)
         
         # Generar objetos cada 5 segundos
         if self.spawn_timer >= self.next_spawn_time:
@@ -41,46 +68,60 @@ class CollectibleSpawner:
         self._cleanup_collectibles(camera_x)
         
         # Verificar colisiones
-        self.check_collisions(player_rect, energy_callback)
+        self.check_collisions(player_rect, energy_callback, previous_player_rect)
     
     def _spawn_random_collectible(self, camera_x: float):
         """Genera aleatoriamente una pila o un escudo"""
         spawn_x = camera_x + PANTALLA_ANCHO + 100  # Siempre fuera de pantalla a la derecha
-        spawn_y = random.randint(PISO_POS_Y - 400, PISO_POS_Y - 100)  # Diferentes alturas
+        spawn_y = self.rng.randint(PISO_POS_Y - 400, PISO_POS_Y - 100)  # Diferentes alturas
         
         # Decidir que tipo de objeto generar
-        if random.random() < ESCUDO_SPAWN_CHANCE:
+        if self.rng.random() < ESCUDO_SPAWN_CHANCE:
             # Generar escudo
-            new_collectible = Escudo(self.resource_manager)
+            collectible_class = self.escudo_class
             collectible_type = "escudo"
         else:
             # Generar pila
-            new_collectible = pilas(self.resource_manager)
+            collectible_class = self.pila_class
             collectible_type = "pila"
         
-        new_collectible.rect.x = spawn_x
-        new_collectible.rect.y = spawn_y
-        
-        self.collectibles.append(new_collectible)
-        print(f"Nuevo {collectible_type} spawneado en ({spawn_x}, {spawn_y})")
+        self.pool.acquire(collectible_class, spawn_x, spawn_y)
+        spawn_log.debug("Nuevo %s spawneado en (%s, %s)", collectible_type, spawn_x, spawn_y)
     
     def _cleanup_collectibles(self, camera_x: float):
         """Limpia objetos que salieron de pantalla o fueron recolectados"""
-        active_collectibles = []
-        for collectible in self.collectibles:
-            # Verificar si el objeto sigue en pantalla y no ha sido recolectado
-            if not collectible.collected and collectible.rect.right > camera_x - 200:
-                active_collectibles.append(collectible)
-            else:
-                collectible_type = "escudo" if isinstance(collectible, Escudo) else "pila"
-                print(f"{collectible_type} eliminado: collected={collectible.collected}, pos={collectible.rect.x}")
-        
-        self.collectibles = active_collectibles
+        limit = camera_x - 200
+        if self.store is not None:
+            gone = [self.pool.by_slot[slot] for slot in self.store.cull(limit, include_dead=True)]
+        else:
+            gone = [collectible for collectible in self.collectibles
+                    if collectible.collected or collectible.rect.right <= limit]
+        for collectible in gone:
+            spawn_log.debug("%s eliminado: collected=%s, pos=%s",
+                            "escudo" if isinstance(collectible, Escudo) else "pila",
+                            collectible.collected, collectible.rect.x)
+            # Vuelve al pool (la lista de activos se actualiza en el lugar)
+            self.pool.release(collectible)
         
-    def check_collisions(self, player_rect: pygame.Rect, energy_callback):
-        """Verifica colisiones entre el jugador y los objetos coleccionables"""
-        for collectible in self.collectibles:
-            if not collectible.collected and player_rect.colliderect(collectible.rect):
+    def check_collisions(self, player_rect: pygame.Rect, energy_callback, previous_player_rect: pygame.Rect = None):
+        """Verifica colisiones entre el jugador y los objetos coleccionables a lo largo del tick"""
+        if previous_player_rect is None:
+            previous_player_rect = player_rect
+        # Zona que recorrio el jugador en el tick: lo que queda afuera (sin rozarla) no pudo tocarlo
+        sweep = player_rect.union(previous_player_rect)
+        collectibles = self.collectibles
+        if self.store is not None:
+            collectibles = self._collectibles_near(sweep.centerx, sweep.width / 2)
+        for collectible in collectibles:
+            rect = collectible.rect
+            if rect.bottom < sweep.top or rect.top > sweep.bottom:
+                continue
+            # Los coleccionables solo se mueven en X: su recorrido va de previous_x a rect.x
+            if (max(rect.x, collectible.previous_x) + rect.width < sweep.left
+                    or min(rect.x, collectible.previous_x) > sweep.right):
+                continue
+            if not collectible.collected and swept_collide(previous_player_rect, player_rect,
+                                                           collectible.get_previous_rect(), rect):
                 # Aplicar efecto específico según el tipo de objeto
                 if isinstance(collectible, Escudo):
                     # Para escudos, necesitamos acceder al player directamente
@@ -94,12 +135,12 @@ class CollectibleSpawner:
                                 enhanced_duration = ability_system.get_enhanced_shield_duration()
                                 player.shield_time = enhanced_duration
                                 player.max_shield_time = enhanced_duration
-                                print(f"Escudo activado con duración mejorada: {enhanced_duration}s")
+                                collision_log.debug("Escudo activado con duracion mejorada: %ss", enhanced_duration)
                             except ImportError:
                                 # Fallback si no hay ability_system
                                 player.shield_time = ESCUDO_DURACION
                                 player.max_shield_time = ESCUDO_DURACION
-                                print(f"Escudo activado con duración normal: {ESCUDO_DURACION}s")
+                                collision_log.debug("Escudo activado con duracion normal: %ss", ESCUDO_DURACION)
                 elif isinstance(collectible, pilas):
                     # Para pilas, usar la energía mejorada
                     if energy_callback:
@@ -109,13 +150,14 @@ class CollectibleSpawner:
                 # Marcar como recolectado
                 collectible.collect(None)
                 
-                collectible_type = "escudo" if isinstance(collectible, Escudo) else "pila"
-                print(f"¡{collectible_type} recolectado en posición ({collectible.rect.x}, {collectible.rect.y})!")
+                collision_log.debug("%s recolectado en posicion (%s, %s)",
+                                    "escudo" if isinstance(collectible, Escudo) else "pila",
+                                    collectible.rect.x, collectible.rect.y)
                 break
     def set_enhanced_battery_energy(self, enhanced_energy: float):
         """Configura la energia mejorada que dan las pilas"""
         self.enhanced_battery_energy = enhanced_energy
-        print(f"Energia de pilas actualizada a: {enhanced_energy}")
+        spawn_log.debug("Energia de pilas actualizada a: %s", enhanced_energy)
 
     def get_battery_energy(self) -> float:
         """Obtiene la energia que dan las pilas """
@@ -125,6 +167,20 @@ class CollectibleSpawner:
         """Devuelve la lista de objetos coleccionables activos"""
         return [collectible for collectible in self.collectibles if not collectible.collected]
     
+    def get_visible_collectibles(self, camera_x: float) -> List:
+        """Objetos activos que pueden estar en pantalla (el renderer descarta el resto)"""
+        if self.store is None:
+            return self.get_collectibles()
+        half_width = PANTALLA_ANCHO / 2
+        return self._collectibles_near(camera_x + half_width, half_width)
+    
+    def _collectibles_near(self, center: float, reach: float) -> List:
+        """Modo almacen: objetos vivos que pueden estar a menos de reach de center, cribados por columnas"""
+        by_slot = self.pool.by_slot
+        # En el orden de la lista de activos, igual que sin almacen
+        return sorted((by_slot[slot] for slot in self.store.near(center, reach)),
+                      key=lambda collectible: collectible.pool_index)
+    
     def get_pilas(self) -> List[pilas]:
         """Devuelve solo las pilas activas (compatibilidad con codigo existente)"""
         return [collectible for collectible in self.collectibles 
@@ -2,6 +2,9 @@ import json
 import os
 from typing import Dict, List, Any
 from src.Constantes import *
+from src.core.logger import game_log
+
+ability_log = game_log.channel("habilidades")
 
 class AbilitySystem:
     """Sistema centralizado de habilidades desbloqueables"""
@@ -80,7 +83,7 @@ class AbilitySystem:
                     self.unlocked_abilities.add(ability)
                     self.ability_effects[ability]["enabled"] = True
                     new_abilities.append(ability)
-                    print(f"¡Habilidad desbloqueada: {self.ability_effects[ability]['name']}!")
+                    ability_log.info("Habilidad desbloqueada: %s", self.ability_effects[ability]['name'])
         
         # Guardar progreso
         self.save_progress()
@@ -108,7 +111,7 @@ class AbilitySystem:
         for ability in self.ability_effects:
             self.unlocked_abilities.add(ability)
             self.ability_effects[ability]["enabled"] = True
-        print("Todas las habilidades desbloqueadas para modo libre")
+        ability_log.info("Todas las habilidades desbloqueadas para modo libre")
     
     def reset_progress(self):
         """Resetea todo el progreso (util para testing)"""
@@ -117,10 +120,24 @@ class AbilitySystem:
         for ability in self.ability_effects:
             self.ability_effects[ability]["enabled"] = False
         self.save_progress()
-        print("Progreso de misiones reseteado")
+        ability_log.info("Progreso de misiones reseteado")
+    
+    def load_snapshot(self, unlocked_abilities: List[str], completed_missions: List[str]):
+        """
+        Reemplaza el progreso en memoria sin tocar el archivo de guardado.
+        Lo usan los replays para jugar con las mismas habilidades que la grabacion.
+        """
+        self.unlocked_abilities = set(unlocked_abilities)
+        self.completed_missions = set(completed_missions)
+        for ability, effect in self.ability_effects.items():
+            effect["enabled"] = ability in self.unlocked_abilities
+        # Sin archivo: lo que se desbloquee durante el replay no se guarda
+        self.save_file = None
     
     def save_progress(self):
         """Guarda el progreso en archivo JSON"""
+        if not self.save_file:
+            return
         try:
             progress_data = {
                 "unlocked_abilities": list(self.unlocked_abilities),
@@ -129,7 +146,7 @@ class AbilitySystem:
             with open(self.save_file, 'w') as f:
                 json.dump(progress_data, f, indent=2)
         except Exception as e:
-            print(f"Error guardando progreso: {e}")
+            ability_log.error("Error guardando progreso: %s", e)
     
     def load_progress(self):
         """Carga el progreso desde archivo JSON"""
@@ -146,9 +163,10 @@ class AbilitySystem:
                     if ability in self.ability_effects:
                         self.ability_effects[ability]["enabled"] = True
                 
-                print(f"Progreso cargado: {len(self.unlocked_abilities)} habilidades, {len(self.completed_missions)} misiones")
+                ability_log.info("Progreso cargado: %d habilidades, %d misiones",
+                                 len(self.unlocked_abilities), len(self.completed_missions))
         except Exception as e:
-            print(f"Error cargando progreso: {e}")
+            ability_log.error("Error cargando progreso: %s", e)
     
     def get_enhanced_battery_energy(self) -> float:
         """Retorna la energia que dan las pilas (con bonificacion si esta desbloqueada)"""
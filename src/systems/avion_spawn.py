@@ -1,21 +1,33 @@
-import pygame, random
+import pygame
+from typing import List
+from src.Constantes import *
+from src.core.rng import rng_service
+from src.core.entity_store import EntityStore
+from src.core.logger import game_log
+
+spawn_log = game_log.channel("spawn")
+
+PLANE_SPEED = 150   # Pixeles por segundo hacia la izquierda
+PLANE_WIDTH = 200   # Ancho usado para saber cuando salio de pantalla
 
 class PlaneSpawner:
     def __init__(self, resource_manager):
         # variables principales del sistema
         self.resource_manager = resource_manager
-        self.planes = []
+        self.rng = rng_service.stream("planes")
+        # Aviones vivos: dicts, o slots del almacen por columnas en modo almacen
+        self.store = EntityStore() if ENTITY_STORE_ENABLED else None
+        self.planes: List = []
         self.timer = 0
-        self.spawn_interval = random.randint(10000, 20000)
+        self.spawn_interval = self.rng.randint(10000, 20000)
         
-        # cargar spritesheet y extraer frames de animacion
+        # frames de animacion como regiones del atlas (ya escalados al tamaño del avion)
         self.plane_spritesheet = self.resource_manager.get_spritesheet("avion")
+        self.plane_frames = []
         if self.plane_spritesheet:
-            self.plane_frames = []
             for row in range(self.plane_spritesheet.rows):
-                self.plane_frames.extend(self.plane_spritesheet.get_row(row))
-        else:
-            self.plane_frames = []
+                self.plane_frames.extend(self.resource_manager.get_frame_regions(
+                    "avion", 0, self.plane_spritesheet.columns - 1, row))
 
     def update(self, delta_time, camera_x):
         # Control de spawn
@@ -23,54 +35,72 @@ class PlaneSpawner:
         if self.timer >= self.spawn_interval:
             self.spawn_plane(camera_x)
             self.timer = 0
-            self.spawn_interval = random.randint(20000, 30000)
+            self.spawn_interval = self.rng.randint(20000, 30000)
+
+        if self.store is not None:
+            # mover todos los aviones y avanzar la animacion de la bandera en una pasada
+            self.store.step(delta_time)
+
+            # Limpiar aviones que salieron de pantalla
+            gone = set(self.store.cull(-200))
+            if gone:
+                for slot in gone:
+                    self.store.release(slot)
+                self.planes = [slot for slot in self.planes if slot not in gone]
+            return
 
-        # aodos los aviones existentes
+        # todos los aviones existentes
         for plane in self.planes:
             # mover avion hacia la izquierda
-            plane["x"] -= 150 * delta_time
-            
-            # actualiza la  animación de la bandera
+            plane["prev_x"] = plane["x"]
+            plane["x"] -= PLANE_SPEED * delta_time
+
+            # actualiza la animacion de la bandera
             plane["animation_timer"] += delta_time
             if plane["animation_timer"] >= plane["animation_speed"]:
                 plane["current_frame"] = (plane["current_frame"] + 1) % len(self.plane_frames)
-                plane["animation_timer"] = 0
+                plane["animation_timer"] = 0.0
 
         # Limpiar aviones que salieron de pantalla
-        self.planes = [p for p in self.planes if p["x"] + 200 > -200]
+        self.planes = [p for p in self.planes if p["x"] + PLANE_WIDTH > -200]
 
     def spawn_plane(self, camera_x):
         if self.plane_frames:
-            # escalar  los frames 
-            scaled_frames = []
-            for frame in self.plane_frames:
-                scaled_frame = pygame.transform.scale(frame, (280, 187))
-                scaled_frames.append(scaled_frame)
-            
             # crear nuevo avion con todas sus propiedades
-            new_plane = {
-                "frames": scaled_frames,
-                "current_frame": 0,
-                "animation_timer": 0,
-                "animation_speed": random.uniform(0.15, 0.25), 
-                "x": camera_x + 1200,
-                "y": random.randint(20, 80)
-            }
-            self.planes.append(new_plane)
-            print(f"¡Avión animado creado! Frames: {len(scaled_frames)}")
+            animation_speed = self.rng.uniform(0.15, 0.25)
+            y = self.rng.randint(20, 80)
+            if self.store is not None:
+                # velocidad en pixeles por tick de referencia, como el almacen
+                slot = self.store.spawn(camera_x + 1200, y, -PLANE_SPEED / SIMULATION_TICK_RATE,
+                                        PLANE_WIDTH, animation_speed, len(self.plane_frames))
+                self.planes.append(slot)
+            else:
+                self.planes.append({
+                    "current_frame": 0,
+                    "animation_timer": 0.0,
+                    "animation_speed": animation_speed,
+                    "x": camera_x + 1200,
+                    "prev_x": camera_x + 1200,
+                    "y": y
+                })
+            spawn_log.debug("Avion animado creado. Frames: %d", len(self.plane_frames))
 
     def get_planes(self):
         # Preparar aviones para el renderer con el frame actual
-        animated_planes = []
-        for plane in self.planes:
-            if plane["frames"]:
-                current_frame = plane["frames"][plane["current_frame"]]
-                animated_planes.append({
-                    "img": current_frame,
-                    "x": plane["x"],
-                    "y": plane["y"]
-                })
-        return animated_planes
+        store = self.store
+        if store is None:
+            return [{
+                        "img": self.plane_frames[plane["current_frame"]],
+                        "x": plane["x"],
+                        "prev_x": plane["prev_x"],
+                        "y": plane["y"]
+                    } for plane in self.planes]
+        return [{
+                    "img": self.plane_frames[store.frame[slot]],
+                    "x": store.x[slot],
+                    "prev_x": store.prev_x[slot],
+                    "y": int(store.y[slot])
+                } for slot in self.planes]
     
     def get_debug_info(self):
         # Información de debugging del sistema
@@ -1,76 +1,183 @@
 import pygame
-from typing import List, Optional
-from src.entities.Car import Car
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+from src.Constantes import *
+from src.core.entity_store import EntityStore
+from src.entities.Car import Car, StoreCar
+
+# Handle de un auto entregado por el pool: (slot, generacion). Deja de valer
+# cuando el auto vuelve al pool, aunque el mismo objeto se reuse despues.
+CarHandle = Tuple[int, int]
+
 
 class CarPool:
-    """Pool de objetos Car para evitar creacion/destruccion constante"""
-    def __init__(self, resource_manager, initial_size: int = 8):
+    """
+    Pool de objetos Car con operaciones en tiempo constante.
+
+    Cada auto tiene un slot fijo; cars[slot] lo ubica. Con ENTITY_STORE_ENABLED
+    los autos son StoreCar y el slot es el del almacen por columnas que el pool
+    mueve de una vez; si no, son objetos sueltos y el pool reparte los slots. Los libres forman una pila y los activos una lista con borrado por
+    intercambio con el ultimo (car.pool_index guarda su posicion). Cada vez que
+    se entrega un auto sube su generacion, asi un handle viejo no apunta al
+    auto reciclado.
+    """
+    def __init__(self, resource_manager, initial_size: int = INITIAL_CAR_POOL_SIZE,
+                 max_size: int = MAX_CAR_POOL_SIZE, available_limit: int = AVAILABLE_CAR_POOL_LIMIT):
         self.resource_manager = resource_manager
-        self.available_cars: List[Car] = []
-        self.active_cars: List[Car] = []
-        self.max_pool_size = 15  # Limite maximo del pool
-        
+        self.max_pool_size = max_size            # Autos activos como maximo
+        self.available_limit = available_limit   # Autos libres que se conservan (el resto se descarta)
+
+        # Modo almacen: todos los autos del pool comparten un almacen por columnas
+        self.store: Optional[EntityStore] = EntityStore(max(1, initial_size)) if ENTITY_STORE_ENABLED else None
+        self.cars: List[Optional[Car]] = []      # slot -> auto
+        self._free_slots: List[int] = []         # Slots de autos descartados (sin almacen)
+        self.available_cars: List[Car] = []      # Pila de autos libres
+        self.active_cars: List[Car] = []         # Activos (el orden no se conserva al borrar)
+        self._spawn_order: Deque[CarHandle] = deque()  # Handles en orden de entrega (para reciclar el mas viejo)
+
+        # Contadores para get_pool_stats
+        self.created = 0       # Autos construidos
+        self.reused = 0        # Entregas resueltas con un auto libre
+        self.exhausted = 0     # Entregas con el pool lleno (se recicla el activo mas viejo)
+        self.discarded = 0     # Autos descartados por superar available_limit
+        self.high_water = 0    # Maximo de autos activos a la vez
+
         # Pre-crear algunos autos
         for _ in range(initial_size):
-            car = Car(0, 0, resource_manager)
+            car = self._create_car(0, 0)
             car.active = False
             self.available_cars.append(car)
-    
+
+    def _create_car(self, x: float, y: float, speed: int = 15) -> Car:
+        """Crea un auto nuevo con su slot (el del almacen en modo almacen)"""
+        if self.store is not None:
+            car = StoreCar(x, y, self.resource_manager, speed, store=self.store)
+        else:
+            car = Car(x, y, self.resource_manager, speed)
+            car.slot = self._free_slots.pop() if self._free_slots else len(self.cars)
+        if car.slot >= len(self.cars):
+            self.cars.extend([None] * (car.slot + 1 - len(self.cars)))
+        self.cars[car.slot] = car
+        self.created += 1
+        return car
+
+    def _activate(self, car: Car):
+        """Agrega el auto a la lista de activos y le da un handle nuevo"""
+        car.generation += 1
+        car.pool_index = len(self.active_cars)
+        self.active_cars.append(car)
+        self._spawn_order.append((car.slot, car.generation))
+        if len(self.active_cars) > self.high_water:
+            self.high_water = len(self.active_cars)
+
+    def _deactivate(self, car: Car):
+        """Saca el auto de los activos intercambiandolo con el ultimo"""
+        index = car.pool_index
+        last = self.active_cars.pop()
+        if last is not car:
+            self.active_cars[index] = last
+            last.pool_index = index
+        car.pool_index = -1
+        car.active = False
+
+    def _oldest_active(self) -> Car:
+        """Auto activo entregado hace mas tiempo (descarta handles que ya no valen)"""
+        while True:
+            car = self.resolve(self._spawn_order[0])
+            if car is not None:
+                return car
+            self._spawn_order.popleft()
+
     def get_car(self, x: float, y: float, speed: int) -> Car:
         """Obtiene un auto del pool o crea uno nuevo si es necesario"""
         if self.available_cars:
             car = self.available_cars.pop()
             car.reset_for_reuse(x, y, speed)
-            car.active = True
-            self.active_cars.append(car)
-            return car
-        else:
+            self.reused += 1
+        elif len(self.active_cars) < self.max_pool_size:
             # Solo crear nuevo si no excedemos el limite del pool
-            if len(self.active_cars) < self.max_pool_size:
-                car = Car(x, y, self.resource_manager, speed)
-                car.active = True
-                self.active_cars.append(car)
-                return car
-            else:
-                # En caso extremo, reutilizar el auto mas viejo
-                oldest_car = self.active_cars[0]
-                oldest_car.reset_for_reuse(x, y, speed)
-                return oldest_car
-    
+            car = self._create_car(x, y, speed)
+        else:
+            # Pool lleno: el auto mas viejo deja de estar activo y se vuelve a entregar
+            car = self._oldest_active()
+            self._deactivate(car)
+            car.reset_for_reuse(x, y, speed)
+            self.exhausted += 1
+        car.active = True
+        self._activate(car)
+        return car
+
     def return_car(self, car: Car):
         """Devuelve un auto al pool para reutilizacion"""
-        if car in self.active_cars:
-            self.active_cars.remove(car)
-            car.active = False
-            # Solo mantener un numero razonable en el pool disponible
-            if len(self.available_cars) < 6:
-                self.available_cars.append(car)
-    
+        if car.pool_index < 0 or self.active_cars[car.pool_index] is not car:
+            return
+        self._deactivate(car)
+        # Solo mantener un numero razonable en el pool disponible
+        if len(self.available_cars) < self.available_limit:
+            self.available_cars.append(car)
+        else:
+            # El slot queda libre para el proximo auto que se cree
+            self.cars[car.slot] = None
+            if self.store is not None:
+                self.store.release(car.slot)
+            else:
+                self._free_slots.append(car.slot)
+            self.discarded += 1
+
+    def get_handle(self, car: Car) -> CarHandle:
+        """Handle del auto mientras siga activo"""
+        return (car.slot, car.generation)
+
+    def resolve(self, handle: CarHandle) -> Optional[Car]:
+        """Auto del handle, o None si ya volvio al pool"""
+        slot, generation = handle
+        car = self.cars[slot] if slot < len(self.cars) else None
+        if car is None or car.generation != generation or car.pool_index < 0:
+            return None
+        return car
+
     def update_active_cars(self, delta_time: float):
-        """Actualiza solo los autos activos"""
+        """Mueve y anima todos los autos activos (en una pasada sobre el almacen si esta activo)"""
+        if self.store is not None:
+            self.store.step(delta_time)
+            return
         for car in self.active_cars:
             car.update(delta_time)
-    
+
     def cleanup_cars(self, camera_x: float):
         """Limpia autos que salieron de pantalla y los devuelve al pool"""
         cleanup_threshold = camera_x - 600
-        cars_to_return = []
-        
-        for car in self.active_cars[:]:  # Copia shallow para iterar seguro
-            if car.rect.right <= cleanup_threshold:
-                cars_to_return.append(car)
-        
-        for car in cars_to_return:
+        if self.store is not None:
+            gone = [self.cars[slot] for slot in self.store.cull(cleanup_threshold)]
+        else:
+            gone = [car for car in self.active_cars if car.rect.right <= cleanup_threshold]
+        for car in gone:
             self.return_car(car)
-    
+        # Los handles de autos ya devueltos no se acumulan
+        while self._spawn_order and self.resolve(self._spawn_order[0]) is None:
+            self._spawn_order.popleft()
+
     def get_active_cars(self) -> List[Car]:
         """Retorna lista de autos activos"""
         return self.active_cars
-    
+
+    def get_cars_near(self, x: float, reach: float) -> List[Car]:
+        """Autos activos que pueden estar a menos de reach de x (en modo almacen se criban por columnas)"""
+        if self.store is None:
+            return self.active_cars
+        cars = self.cars
+        return [cars[slot] for slot in self.store.near(x, reach)]
+
     def get_pool_stats(self) -> dict:
         """Retorna estadisticas del pool para debugging"""
         return {
             "active": len(self.active_cars),
             "available": len(self.available_cars),
-            "total_pool_size": len(self.active_cars) + len(self.available_cars)
-        }
\ No newline at end of file
+            "total_pool_size": len(self.active_cars) + len(self.available_cars),
+            "created": self.created,
+            "reused": self.reused,
+            "exhausted": self.exhausted,
+            "discarded": self.discarded,
+            "high_water": self.high_water,
+            "store_backend": self.store.backend if self.store is not None else "objetos"
+        }
@@ -1,7 +1,8 @@
 import pygame
-import random
 from typing import List
 from src.Constantes import *
+from src.core.rng import rng_service
+from src.core.kinematics import swept_collide
 from src.systems.car_pool import CarPool
 
 # Constantes extraidas para evitar numeros magicos
@@ -46,6 +47,7 @@ class CarSpawner:
 
     def __init__(self, resource_manager):
         self.resource_manager = resource_manager
+        self.rng = rng_service.stream("car_spawner")
         
         # Usar CarPool en lugar de lista simple
         self.car_pool = CarPool(resource_manager)
@@ -77,22 +79,22 @@ class CarSpawner:
 
     def _generate_car_speed(self) -> int:
         """Velocidad variada: lento / normal / rapido usando constantes"""
-        type_choice = random.choices(
+        type_choice = self.rng.choices(
             ['lento', 'normal', 'rapido'], 
             weights=[SLOW_CAR_WEIGHT, NORMAL_CAR_WEIGHT, FAST_CAR_WEIGHT], 
             k=1
         )[0]
         
         if type_choice == 'lento':
-            return random.randint(SLOW_CAR_SPEED_MIN, SLOW_CAR_SPEED_MAX)
+            return self.rng.randint(SLOW_CAR_SPEED_MIN, SLOW_CAR_SPEED_MAX)
         elif type_choice == 'normal':
-            return random.randint(NORMAL_CAR_SPEED_MIN, NORMAL_CAR_SPEED_MAX)
+            return self.rng.randint(NORMAL_CAR_SPEED_MIN, NORMAL_CAR_SPEED_MAX)
         else:  # rapido
-            return random.randint(FAST_CAR_SPEED_MIN, FAST_CAR_SPEED_MAX)
+            return self.rng.randint(FAST_CAR_SPEED_MIN, FAST_CAR_SPEED_MAX)
 
     def _next_spawn_interval(self) -> float:
         """Genera intervalo aleatorio entre spawns"""
-        return random.uniform(SPAWN_INTERVAL_MIN, SPAWN_INTERVAL_MAX)
+        return self.rng.uniform(SPAWN_INTERVAL_MIN, SPAWN_INTERVAL_MAX)
 
     def update(self, delta_time: float, camera_x: float, player_x: float):
         """Actualizar con logica de pooling optimizada"""
@@ -110,7 +112,7 @@ class CarSpawner:
 
     def _decide_spawn_count(self) -> int:
         """Decide 1 o 2 autos; ponderado con constantes"""
-        return random.choices(
+        return self.rng.choices(
             [1, 2], 
             weights=[SINGLE_CAR_WEIGHT, DOUBLE_CAR_WEIGHT], 
             k=1
@@ -153,7 +155,7 @@ class CarSpawner:
 
     def _spawn_cars(self, camera_x: float, num_cars: int):
         """Spawn usando el pool de objetos"""
-        base_x = camera_x + PANTALLA_ANCHO + random.randint(
+        base_x = camera_x + PANTALLA_ANCHO + self.rng.randint(
             self.spawn_x_offset_min, self.spawn_x_offset_max
         )
         y = PISO_POS_Y - 86
@@ -164,9 +166,9 @@ class CarSpawner:
             return
 
         # num_cars == 2: uno rapido adelante y otro mas lento mas atras
-        fast_speed = random.randint(VERY_FAST_CAR_SPEED_MIN, VERY_FAST_CAR_SPEED_MAX)
-        slow_speed = random.randint(SLOW_PAIRED_CAR_SPEED_MIN, SLOW_PAIRED_CAR_SPEED_MAX)
-        gap = random.randint(CAR_GAP_MIN, CAR_GAP_MAX)
+        fast_speed = self.rng.randint(VERY_FAST_CAR_SPEED_MIN, VERY_FAST_CAR_SPEED_MAX)
+        slow_speed = self.rng.randint(SLOW_PAIRED_CAR_SPEED_MIN, SLOW_PAIRED_CAR_SPEED_MAX)
+        gap = self.rng.randint(CAR_GAP_MIN, CAR_GAP_MAX)
 
         self.car_pool.get_car(base_x, y, fast_speed)
         self.car_pool.get_car(base_x + gap, y, slow_speed)
@@ -176,23 +178,42 @@ class CarSpawner:
         self.spawn_timer = 0.0
         self.next_spawn_time = self._next_spawn_interval()
 
-    def check_collisions(self, player_rect: pygame.Rect) -> bool:
-        """Verificar colisiones optimizada usando pool"""
+    def check_collisions(self, player_rect: pygame.Rect, previous_player_rect: pygame.Rect = None) -> bool:
+        """
+        Verificar colisiones optimizada usando pool
+        
+        Se prueba todo el recorrido del tick (de previous_* a la posicion actual),
+        asi con ticks largos un auto rapido no atraviesa al jugador sin chocarlo.
+        """
         active_cars = self.car_pool.get_active_cars()
         if not active_cars:
             return False
 
+        if previous_player_rect is None:
+            previous_player_rect = player_rect
         # Hitbox reducida del jugador para ser mas justo
         player_hit = player_rect.inflate(*self.player_hitbox_shrink)
+        player_prev_hit = previous_player_rect.inflate(*self.player_hitbox_shrink)
+        player_travel = abs(player_rect.x - previous_player_rect.x)
+        player_x = player_rect.x
+        # Franja vertical que recorrio el jugador (los autos solo se mueven en X)
+        sweep_top = min(player_hit.top, player_prev_hit.top)
+        sweep_bottom = max(player_hit.bottom, player_prev_hit.bottom)
 
         # Solo verificar autos cercanos
-        for car in active_cars:
-            # Filtro rapido por distancia X usando constante
-            if abs(car.rect.x - player_rect.x) > COLLISION_DISTANCE_THRESHOLD:
+        for car in self.car_pool.get_cars_near(player_x, COLLISION_DISTANCE_THRESHOLD + player_travel):
+            rect = car.rect
+            # Filtro rapido por distancia X (ampliado con lo que ambos se movieron en el tick)
+            reach = COLLISION_DISTANCE_THRESHOLD + player_travel + abs(rect.x - car.previous_x)
+            if abs(rect.x - player_x) > reach:
                 continue
 
-            car_hit = car.rect.inflate(*self.car_hitbox_shrink)
-            if car_hit.colliderect(player_hit):
+            car_hit = rect.inflate(*self.car_hitbox_shrink)
+            # Filtro por altura antes de armar el rect del tick anterior (el test barrido cuenta el roce)
+            if car_hit.bottom < sweep_top or car_hit.top > sweep_bottom:
+                continue
+            car_prev_hit = car.get_previous_rect().inflate(*self.car_hitbox_shrink)
+            if swept_collide(car_prev_hit, car_hit, player_prev_hit, player_hit):
                 return True
 
         return False
@@ -201,6 +222,12 @@ class CarSpawner:
         """Retorna autos activos del pool"""
         return self.car_pool.get_active_cars()
     
+    def get_visible_cars(self, camera_x: float) -> List:
+        """Autos activos que pueden estar en pantalla (el renderer descarta el resto)"""
+        half_width = PANTALLA_ANCHO / 2
+        # Mismo margen de 100 px que GameRenderer._is_car_visible
+        return self.car_pool.get_cars_near(camera_x + half_width, half_width + 100)
+    
     def get_pool_statistics(self) -> dict:
         """Metodo de debugging para ver estado del pool"""
         return self.car_pool.get_pool_stats()
\ No newline at end of file
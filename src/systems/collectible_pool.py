@@ -0,0 +1,102 @@
+from typing import Dict, List, Optional, Type
+from src.Constantes import *
+from src.core.entity_store import EntityStore
+from src.entities.Collectible import Collectible
+
+
+class CollectiblePool:
+    """
+    Pool de coleccionables por tipo (pilas, escudos), como el CarPool: los
+    libres de cada tipo forman una pila y los activos una lista con borrado
+    por intercambio con el ultimo. En modo almacen (store, con las clases
+    vista como StorePilas) un objeto en juego ocupa un slot del almacen del
+    spawner y lo devuelve al liberarse (asi cull() del spawner solo ve
+    objetos en juego). Las imagenes son las compartidas del
+    ResourceManager: reusar un objeto no crea sprites ni superficies.
+    """
+
+    def __init__(self, resource_manager, store: Optional[EntityStore] = None,
+                 available_limit: int = COLLECTIBLE_POOL_AVAILABLE_LIMIT):
+        self.resource_manager = resource_manager
+        self.store = store
+        self.available_limit = available_limit
+        self.available: Dict[Type[Collectible], List[Collectible]] = {}
+        self.active: List[Collectible] = []
+        self.by_slot: List[Optional[Collectible]] = []   # slot -> objeto en juego (modo almacen)
+
+        # Contadores para get_stats
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self.high_water = 0
+
+    def _create(self, collectible_class: Type[Collectible]) -> Collectible:
+        """Instancia nueva (con su slot en el almacen en modo almacen)"""
+        self.created += 1
+        if self.store is not None:
+            return collectible_class(self.resource_manager, store=self.store)
+        return collectible_class(self.resource_manager)
+
+    def _register(self, collectible: Collectible):
+        """Anota el slot que ocupa el objeto en juego"""
+        if self.store is None:
+            return
+        if collectible.slot >= len(self.by_slot):
+            self.by_slot.extend([None] * (collectible.slot + 1 - len(self.by_slot)))
+        self.by_slot[collectible.slot] = collectible
+
+    def prewarm(self, collectible_class: Type[Collectible], count: int = COLLECTIBLE_POOL_PREWARM):
+        """Crea instancias libres de antemano (fuera de la partida)"""
+        free = self.available.setdefault(collectible_class, [])
+        for _ in range(count):
+            collectible = self._create(collectible_class)
+            collectible.release()  # Fuera de juego hasta que se entregue
+            free.append(collectible)
+
+    def acquire(self, collectible_class: Type[Collectible], x: int, y: int) -> Collectible:
+        """Entrega un objeto del tipo pedido en (x, y), reusando uno libre si hay"""
+        free = self.available.get(collectible_class)
+        if free:
+            collectible = free.pop()
+            collectible.reset_for_reuse(x, y)
+            self.reused += 1
+        else:
+            collectible = self._create(collectible_class)
+            collectible.set_position(x, y)
+        self._register(collectible)
+        collectible.pool_index = len(self.active)
+        self.active.append(collectible)
+        if len(self.active) > self.high_water:
+            self.high_water = len(self.active)
+        return collectible
+
+    def release(self, collectible: Collectible):
+        """Saca el objeto de los activos (intercambiandolo con el ultimo) y lo guarda para reuso"""
+        index = collectible.pool_index
+        if index < 0 or self.active[index] is not collectible:
+            return
+        last = self.active.pop()
+        if last is not collectible:
+            self.active[index] = last
+            last.pool_index = index
+        collectible.pool_index = -1
+        if self.store is not None:
+            self.by_slot[collectible.slot] = None
+        collectible.release()
+
+        free = self.available.setdefault(type(collectible), [])
+        if len(free) < self.available_limit:
+            free.append(collectible)
+        else:
+            self.discarded += 1
+
+    def get_stats(self) -> dict:
+        """Estadisticas del pool para debugging"""
+        return {
+            "active": len(self.active),
+            "available": sum(len(free) for free in self.available.values()),
+            "created": self.created,
+            "reused": self.reused,
+            "discarded": self.discarded,
+            "high_water": self.high_water,
+        }
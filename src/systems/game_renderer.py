@@ -7,17 +7,27 @@ from src.entities.Pilas import pilas
 from src.entities.Escudo import Escudo
 import random
 import math
+from src.core.rng import rng_service
 
 class GameRenderer:
     """Maneja todo el sistema de renderizado del juego con efectos de escudo"""  
     def __init__(self, screen: pygame.Surface, resource_manager):
         self.screen = screen
         self.resource_manager = resource_manager
+        self.rng = rng_service.stream("renderer")
         self.world_scroll_x = 0
+        self.previous_world_scroll_x = 0
         self.world_scroll_speed = 30
+        
+        # Fraccion entre el tick anterior y el actual para interpolar posiciones
+        self.interpolation = 1.0
 
         # Inicializar modo noche por defecto
         self.is_night_mode = False
+        
+        # Color de parpadeo de color_aleatorio: uno por cada medio segundo
+        self._color_bucket = None
+        self._color_actual = COLOR_BLANCO
 
             
         # Cache para superficies escaladas
@@ -60,11 +70,8 @@ class GameRenderer:
         # Recargar capas con el conjunto apropiado
         for layer_name, parallax_factor in night_layers:
             if layer_name not in self.scaled_backgrounds:
-                image = self.resource_manager.get_image(layer_name)
-                if image:
-                    scaled_image = pygame.transform.scale(image, (PANTALLA_ANCHO, PANTALLA_ALTO))
-                    scaled_image = scaled_image.convert_alpha()
-                else:
+                scaled_image = self.resource_manager.get_scaled_image(layer_name, (PANTALLA_ANCHO, PANTALLA_ALTO))
+                if scaled_image is None:
                     # Fallback apropiado según el modo
                     fallback_color = (10, 10, 30) if is_night_mode else (30, 30, 30)
                     scaled_image = pygame.Surface((PANTALLA_ANCHO, PANTALLA_ALTO))
@@ -84,10 +91,8 @@ class GameRenderer:
         self.front_options.clear()
         for name in night_front_options:
             if name not in self.scaled_backgrounds:
-                image = self.resource_manager.get_image(name)
-                if image:
-                    scaled = pygame.transform.scale(image, (PANTALLA_ANCHO, PANTALLA_ALTO)).convert_alpha()
-                else:
+                scaled = self.resource_manager.get_scaled_image(name, (PANTALLA_ANCHO, PANTALLA_ALTO))
+                if scaled is None:
                     fallback_color = (20, 20, 40) if is_night_mode else (40, 40, 40)
                     scaled = pygame.Surface((PANTALLA_ANCHO, PANTALLA_ALTO))
                     scaled.fill(fallback_color)
@@ -102,7 +107,7 @@ class GameRenderer:
             self.front_options = [night_front_options[0]]
         
         # Elegir variante inicial
-        self.current_front_name = random.choice(self.front_options)
+        self.current_front_name = self.rng.choice(self.front_options)
         front_image = self.scaled_backgrounds[self.current_front_name]
         
         # Limpiar el mapa de tiles para empezar fresh
@@ -119,8 +124,13 @@ class GameRenderer:
     def color_aleatorio(self):
         """Actualiza el efecto de parpadeo y cambio de color"""
         tiempo_actual = pygame.time.get_ticks() // 500
-        random.seed(tiempo_actual)
-        return (random.randint(100, 255), random.randint(100, 255), random.randint(100, 255))
+        # Un color fijo por cada medio segundo, con un generador propio
+        # (reseedear el random global rompia el resto de los sistemas)
+        if self._color_bucket != tiempo_actual:
+            color_rng = random.Random(tiempo_actual)
+            self._color_actual = (color_rng.randint(100, 255), color_rng.randint(100, 255), color_rng.randint(100, 255))
+            self._color_bucket = tiempo_actual
+        return self._color_actual
 
     def mostrar_parpadeo(self):
         """Controla el parpadeo del texto de reinicio"""
@@ -140,12 +150,8 @@ class GameRenderer:
         for layer_name, parallax_factor in base_layers:
             # Verificar si ya tenemos la imagen escalada en cache
             if layer_name not in self.scaled_backgrounds:
-                image = self.resource_manager.get_image(layer_name)
-                if image:
-                    #guardar en cache
-                    scaled_image = pygame.transform.scale(image, (PANTALLA_ANCHO, PANTALLA_ALTO))
-                    scaled_image = scaled_image.convert_alpha()  # Optimizar blitting
-                else:
+                scaled_image = self.resource_manager.get_scaled_image(layer_name, (PANTALLA_ANCHO, PANTALLA_ALTO))
+                if scaled_image is None:
                     scaled_image = pygame.Surface((PANTALLA_ANCHO, PANTALLA_ALTO))
                     scaled_image.fill((30, 30, 30))
                     scaled_image = scaled_image.convert()
@@ -163,10 +169,8 @@ class GameRenderer:
         candidates = ["bg_front", "bg_front2"]
         for name in candidates:
             if name not in self.scaled_backgrounds:
-                image = self.resource_manager.get_image(name)
-                if image:
-                    scaled = pygame.transform.scale(image, (PANTALLA_ANCHO, PANTALLA_ALTO)).convert_alpha()
-                else:
+                scaled = self.resource_manager.get_scaled_image(name, (PANTALLA_ANCHO, PANTALLA_ALTO))
+                if scaled is None:
                     # fallback simple si no existe la imagen
                     scaled = pygame.Surface((PANTALLA_ANCHO, PANTALLA_ALTO))
                     scaled.fill((40, 40, 40))
@@ -180,7 +184,7 @@ class GameRenderer:
             self.front_options = ["bg_front"]
         
         # Elegir variante inicial aleatoria
-        self.current_front_name = random.choice(self.front_options)
+        self.current_front_name = self.rng.choice(self.front_options)
         front_image = self.scaled_backgrounds[self.current_front_name]
         self.bg_layers.append({
             "name": "front_dynamic",
@@ -201,26 +205,35 @@ class GameRenderer:
         self.color_aleatorio()
         if font_large:
             # Textos de game over
-            self.cached_text_surfaces['game_over'] = font_large.render(
-                "JUEGO TERMINADO", True, COLOR_ROJO
+            self.cached_text_surfaces['game_over'] = self.resource_manager.render_text(
+                font_large, "JUEGO TERMINADO", COLOR_ROJO
             )
-            self.cached_text_surfaces['victory'] = font_large.render(
-                "¡VICTORIA!", True, COLOR_TEXTO_VICTORIA
+            self.cached_text_surfaces['victory'] = self.resource_manager.render_text(
+                font_large, "¡VICTORIA!", COLOR_TEXTO_VICTORIA
             )
         
         if font_normal:
             # Textos de instrucciones
-            self.cached_text_surfaces['escape_menu'] = font_normal.render(
-                "Presiona [ESCAPE] para volver al menu", True, COLOR_BLANCO
+            self.cached_text_surfaces['escape_menu'] = self.resource_manager.render_text(
+                font_normal, "Presiona [ESCAPE] para volver al menu", COLOR_BLANCO
             )
-            self.cached_text_surfaces['victory_msg'] = font_normal.render(
-                "¡El paquete fue entregado con exito!", True, COLOR_TEXTO_VICTORIA
+            self.cached_text_surfaces['victory_msg'] = self.resource_manager.render_text(
+                font_normal, "¡El paquete fue entregado con exito!", COLOR_TEXTO_VICTORIA
             )
         
     def update(self, delta_time: float):
         """Actualiza el sistema de renderizado"""
+        self.previous_world_scroll_x = self.world_scroll_x
         self.world_scroll_x += self.world_scroll_speed * delta_time
     
+    def set_interpolation(self, alpha: float):
+        """Define la fraccion (0..1) usada para interpolar entre ticks"""
+        self.interpolation = alpha
+    
+    def _lerp(self, previous: float, current: float) -> float:
+        """Interpola entre la posicion del tick anterior y la actual"""
+        return previous + (current - previous) * self.interpolation
+    
     def _maybe_update_front_by_camera(self, camera_x: float):
         """Cambia la variante frontal aleatoriamente cuando se avanza suficiente en el mundo."""
         # Si no hay al menos 2 opciones, no hacemos nada
@@ -233,7 +246,7 @@ class GameRenderer:
             choices = [c for c in self.front_options if c != self.current_front_name]
             if not choices:
                 choices = self.front_options
-            new_front = random.choice(choices)
+            new_front = self.rng.choice(choices)
             self.current_front_name = new_front
             # actualizar la capa frontal
             for layer in self.bg_layers:
@@ -252,12 +265,12 @@ class GameRenderer:
         # Intentar mantener continuidad: mirar version anterior
         prev = self.front_tile_map.get(tile_index - 1, self.current_front_name)
         # Decidir si cambiamos
-        if random.random() < self.front_change_chance:
+        if self.rng.random() < self.front_change_chance:
             # elegir una variante distinta si es posible
             options = [o for o in self.front_options if o != prev]
             if not options:
                 options = self.front_options
-            chosen = random.choice(options)
+            chosen = self.rng.choice(options)
         else:
             chosen = prev
 
@@ -269,6 +282,8 @@ class GameRenderer:
         # APLICAR CAMBIO DE FRONT SI CORRESPONDE
         self._maybe_update_front_by_camera(camera_x)
         
+        world_scroll_x = self._lerp(self.previous_world_scroll_x, self.world_scroll_x)
+        
         # Cache para evitar recalculos cuando la camara no se mueve mucho
         if not hasattr(self, 'last_camera_x'):
             self.last_camera_x = 0
@@ -283,7 +298,7 @@ class GameRenderer:
                 parallax_factor = layer["parallax_factor"]
 
                 # total_offset_x define que tile esta en pantalla (puede ser flotante)
-                total_offset_x = (self.world_scroll_x * parallax_factor +
+                total_offset_x = (world_scroll_x * parallax_factor +
                                   camera_x * parallax_factor * BACKGROUND_PARALLAX_CAMERA_FACTOR)
                 # indice del tile mas a la izquierda que deberia dibujarse
                 start_tile_index = int(math.floor(total_offset_x / layer_width))
@@ -307,7 +322,7 @@ class GameRenderer:
             layer_width = layer["width"]
             
             # Calcular offset solo una vez por capa
-            total_offset_x = (self.world_scroll_x * parallax_factor + 
+            total_offset_x = (world_scroll_x * parallax_factor + 
                             camera_x * parallax_factor * BACKGROUND_PARALLAX_CAMERA_FACTOR)
             offset_x = -(total_offset_x % layer_width)
             
@@ -350,21 +365,21 @@ class GameRenderer:
         pygame.draw.line(self.screen, line_color, (0, PISO_POS_Y), (PANTALLA_ANCHO, PISO_POS_Y), 3)
     def draw_planes(self, planes, camera_x):
       for plane in planes:
-        screen_x = plane["x"] - camera_x
-        self.screen.blit(plane["img"], (screen_x, plane["y"]))
+        screen_x = self._lerp(plane["prev_x"], plane["x"]) - camera_x
+        self.screen.blit(*plane["img"].blit_args(screen_x, plane["y"]))
     
     def draw_player(self, player: Player, camera_x: float):
         """Dibuja el jugador con efectos visuales del escudo"""
-        screen_x = player.rect.x - camera_x
-        screen_y = player.rect.y
+        screen_x = self._lerp(player.previous_x, player.rect.x) - camera_x
+        screen_y = self._lerp(player.previous_y, player.rect.y)
         
         # Dibujar efectos del escudo ANTES del jugador si esta activo
         if player.should_show_shield_effect():
-            self._draw_shield_effect(player, camera_x)
+            self._draw_shield_effect(player, screen_x, screen_y)
         
         # Dibujar efecto de colision del escudo si corresponde
         if player.should_show_collision_effect():
-            self._draw_shield_collision_effect(player, camera_x)
+            self._draw_shield_collision_effect(player, screen_x, screen_y)
         
         if player.current_sprite:
             self._draw_player_sprite(player, screen_x, screen_y)
@@ -372,13 +387,13 @@ class GameRenderer:
             self._draw_player_fallback(player, screen_x, screen_y)
     def draw_planes(self, planes, camera_x):
       for plane in planes:
-        screen_x = plane["x"] - camera_x
-        self.screen.blit(plane["img"], (screen_x, plane["y"]))
+        screen_x = self._lerp(plane["prev_x"], plane["x"]) - camera_x
+        self.screen.blit(*plane["img"].blit_args(screen_x, plane["y"]))
 
-    def _draw_shield_effect(self, player: Player, camera_x: float):
+    def _draw_shield_effect(self, player: Player, player_screen_x: float, player_screen_y: float):
         """Dibuja el efecto visual del escudo activo"""
-        screen_x = player.rect.x - camera_x + player.rect.width // 2
-        screen_y = player.rect.y + player.rect.height // 2
+        screen_x = player_screen_x + player.rect.width // 2
+        screen_y = player_screen_y + player.rect.height // 2
         
         current_time = pygame.time.get_ticks()
         
@@ -426,10 +441,10 @@ class GameRenderer:
             pygame.draw.circle(self.screen, (255, 255, 255), 
                              (int(particle_x), int(particle_y)), particle_size)
     
-    def _draw_shield_collision_effect(self, player: Player, camera_x: float):
+    def _draw_shield_collision_effect(self, player: Player, player_screen_x: float, player_screen_y: float):
         """Dibuja el efecto visual cuando el escudo absorbe una colision"""
-        screen_x = player.rect.x - camera_x + player.rect.width // 2
-        screen_y = player.rect.y + player.rect.height // 2
+        screen_x = player_screen_x + player.rect.width // 2
+        screen_y = player_screen_y + player.rect.height // 2
         
         # Efecto de expansion rapida
         effect_progress = 1.0 - (player.shield_collision_effect_time / SHIELD_EFFECT_DURATION)
@@ -454,9 +469,8 @@ class GameRenderer:
     def _draw_player_sprite(self, player: Player, screen_x: float, screen_y: float):
         """Dibuja el sprite del jugador"""
         # Reutilizar rect existente en lugar de crear uno nuevo para mejor performance
-        player.current_sprite_rect = getattr(player, 'current_sprite_rect', None)
         if player.current_sprite_rect is None:
-            player.current_sprite_rect = player.current_sprite.get_rect()
+            player.current_sprite_rect = player.current_sprite.get_rect()  # Tamaño del frame sin recortar
         
         player.current_sprite_rect.center = (screen_x + player.rect.width // 2, 
                                            screen_y + player.rect.height // 2)
@@ -464,13 +478,14 @@ class GameRenderer:
         if player.is_dashing:
             self._draw_dash_trail(player.current_sprite, player.current_sprite_rect)
         
-        self.screen.blit(player.current_sprite, player.current_sprite_rect)
+        sprite_rect = player.current_sprite_rect
+        self.screen.blit(*player.current_sprite.blit_args(sprite_rect.x, sprite_rect.y))
     
-    def _draw_dash_trail(self, sprite: pygame.Surface, sprite_rect: pygame.Rect):
+    def _draw_dash_trail(self, sprite, sprite_rect: pygame.Rect):
         """Dibuja la estela del dash"""
-        # Cache de la superficie de estela
-        if not hasattr(self, 'trail_surface') or self.trail_surface_sprite != sprite:
-            self.trail_surface = sprite.copy()
+        # Cache de la superficie de estela (copia de la region recortada del atlas)
+        if not hasattr(self, 'trail_surface') or self.trail_surface_sprite is not sprite:
+            self.trail_surface = sprite.surface.copy()
             self.trail_surface.set_alpha(150)
             self.trail_surface_sprite = sprite
         
@@ -482,7 +497,8 @@ class GameRenderer:
             self.trail_rect.x = sprite_rect.x - i * 10
             self.trail_rect.y = sprite_rect.y
             if self.trail_rect.right >= 0:
-                self.screen.blit(self.trail_surface, self.trail_rect)
+                self.screen.blit(self.trail_surface, (self.trail_rect.x + sprite.offset_x,
+                                                      self.trail_rect.y + sprite.offset_y))
     
     def _draw_player_fallback(self, player: Player, screen_x: float, screen_y: float):
         """Dibuja rectangulo de respaldo para el jugador"""
@@ -496,11 +512,19 @@ class GameRenderer:
         pygame.draw.rect(self.screen, color, self.fallback_rect)
     
     def draw_cars(self, cars: List[Car], camera_x: float):
-        """Dibuja todos los autos visibles"""
+        """Dibuja todos los autos visibles (en un solo blits: los frames salen de la misma pagina del atlas)"""
+        batch = []
         for car in cars:
-            screen_x = car.rect.x - camera_x
-            if self._is_car_visible(screen_x, car.rect.width):
-                self._draw_single_car(car, screen_x)
+            rect = car.rect
+            screen_x = self._lerp(car.previous_x, rect.x) - camera_x
+            if self._is_car_visible(screen_x, rect.width):
+                sprite = car.current_sprite
+                if sprite:
+                    batch.append(sprite.blit_args(screen_x, rect.y))
+                else:
+                    self._draw_single_car(car, screen_x)
+        if batch:
+            self.screen.blits(batch, doreturn=False)
     
     def _is_car_visible(self, screen_x: float, car_width: int) -> bool:
         """Verifica si un auto esta visible en pantalla"""
@@ -511,10 +535,10 @@ class GameRenderer:
         """Dibuja un auto individual"""
         if car.current_sprite:
             # Usar posicion directa en lugar de crear rect
-            self.screen.blit(car.current_sprite, (screen_x, car.rect.y))
+            self.screen.blit(*car.current_sprite.blit_args(screen_x, car.rect.y))
         else:
             # Rectangulo de respaldo - reutilizar rect
-            if not hasattr(car, 'fallback_rect'):
+            if car.fallback_rect is None:
                 car.fallback_rect = pygame.Rect(0, 0, car.rect.width, car.rect.height)
             car.fallback_rect.x = screen_x
             car.fallback_rect.y = car.rect.y
@@ -522,22 +546,26 @@ class GameRenderer:
     
     def draw_collectibles(self, collectibles: List, camera_x: float):
         """Dibuja todos los objetos coleccionables (pilas y escudos) en la pantalla"""
+        batch = []
         for collectible in collectibles:
-            screen_x = collectible.rect.x - camera_x
+            rect = collectible.rect
+            screen_x = self._lerp(collectible.previous_x, rect.x) - camera_x
             
             # Solo dibujar si esta en pantalla
-            if -collectible.rect.width <= screen_x <= PANTALLA_ANCHO:
+            if -rect.width <= screen_x <= PANTALLA_ANCHO:
                 # Añadir efecto especial para escudos
                 if isinstance(collectible, Escudo):
                     self._draw_escudo_with_effect(collectible, screen_x)
                 else:
-                    # Dibujar objetos normales (pilas)
-                    self.screen.blit(collectible.image, (screen_x, collectible.rect.y))
+                    # Objetos normales (pilas): se juntan en un solo blits
+                    batch.append(collectible.region.blit_args(screen_x, rect.y))
+        if batch:
+            self.screen.blits(batch, doreturn=False)
     
     def _draw_escudo_with_effect(self, escudo: Escudo, screen_x: float):
         """Dibuja un escudo con efectos visuales especiales"""
         # Dibujar el escudo base
-        self.screen.blit(escudo.image, (screen_x, escudo.rect.y))
+        self.screen.blit(*escudo.region.blit_args(screen_x, escudo.rect.y))
         
         # Añadir efecto de brillo pulsante
         current_time = pygame.time.get_ticks()
@@ -566,7 +594,7 @@ class GameRenderer:
             
             # Solo dibujar si esta en pantalla
             if -pila.rect.width <= screen_x <= PANTALLA_ANCHO:
-                self.screen.blit(pila.image, (screen_x, pila.rect.y))
+                self.screen.blit(*pila.region.blit_args(screen_x, pila.rect.y))
     
     def draw_restart_text(self, y_position: int):
         """Dibuja el texto de reiniciar con efecto de parpadeo y color aleatorio"""
@@ -574,10 +602,10 @@ class GameRenderer:
             font_normal = self.resource_manager.get_font('pequeña')
             if font_normal:
                     scale = self.Latido_reiniciar()
-                    # Renderizar el texto con color aleatorio cada vez
-                    restart_text = font_normal.render(
+                    # El color cambia cada medio segundo: entre tanto el texto sale del cache
+                    restart_text = self.resource_manager.render_text(
+                        font_normal,
                         "Presiona [R] para reiniciar el juego", 
-                        True, 
                         self.color_aleatorio()
                     )
                     
@@ -652,7 +680,7 @@ class GameRenderer:
     def _draw_centered_text(self, text: str, font: pygame.font.Font, 
                            color: tuple, y_position: int):
         """Dibuja texto centrado horizontalmente"""
-        text_surface = font.render(text, True, color)
+        text_surface = self.resource_manager.render_text(font, text, color)
         text_rect = text_surface.get_rect(center=(PANTALLA_ANCHO // 2, y_position))
         self.screen.blit(text_surface, text_rect)
         return text_rect
\ No newline at end of file